@@ -68,6 +68,7 @@ SCHEDULE_END = time(13, 0)   # 1:00 PM
 VOICE_MODEL = "tts-1"
 VOICE_NAME = "onyx" # Options: alloy, echo, fable, onyx, nova, shimmer
 VOICE_SPEED = 1
+AUDIO_CLEANUP_DELAY_SECONDS = 60  # Windows only: how long to wait before deleting a played announcement
 
 # Create directories
 AUDIO_DIR = Path("src/audio")
@@ -206,33 +207,42 @@ class FocusAgent:
             if not force_voice:
                 return
                 
-            # Generate speech directly to memory and play
-            response = self.openai_client.audio.speech.create(
-                model=VOICE_MODEL,
-                voice=VOICE_NAME,
-                speed=VOICE_SPEED,
-                input=message
-            )
-            
-            # Create temporary file in system temp directory
+            # Stream speech into a temp file as the bytes arrive instead of buffering the whole response first
+            # (afplay needs a real file path - it can't play from stdin)
             with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-                for chunk in response.iter_bytes():
-                    temp_file.write(chunk)
+                with self.openai_client.audio.speech.with_streaming_response.create(
+                    model=VOICE_MODEL,
+                    voice=VOICE_NAME,
+                    speed=VOICE_SPEED,
+                    input=message
+                ) as response:
+                    for chunk in response.iter_bytes():
+                        temp_file.write(chunk)
                 temp_path = temp_file.name
 
             # Play audio based on OS
             if os.name == 'posix':
                 os.system(f"afplay {temp_path}")
+                
+                # Cleanup temp file
+                os.unlink(temp_path)
             else:
-                os.system(f"start {temp_path}")
-                time_lib.sleep(5)
-            
-            # Cleanup temp file
-            os.unlink(temp_path)
+                # startfile hands the file to the default player and returns right away - delete it once it's had time to play
+                os.startfile(temp_path)
+                cleanup = threading.Timer(AUDIO_CLEANUP_DELAY_SECONDS, self._delete_temp_audio, args=(temp_path,))
+                cleanup.daemon = True
+                cleanup.start()
             
         except Exception as e:
             cprint(f"❌ Error in announcement: {str(e)}", "red")
 
+    def _delete_temp_audio(self, temp_path):
+        """Remove a played temp audio file"""
+        try:
+            os.unlink(temp_path)
+        except Exception as e:
+            cprint(f"⚠️ Couldn't delete temp audio file: {str(e)}", "yellow")
+
     def analyze_focus(self, transcript):
         """Analyze focus level from transcript"""
         try:
@@ -176,8 +176,8 @@ class FundingAgent(BaseAgent):
                 market_context += f"{symbol} Technical Data (Last 5 candles):\n{symbol_data.tail(5).to_string()}\n\n"
             
             # Add some basic trend analysis
-            btc_close = btc_data['close'].iloc[-1]
-            btc_sma = btc_data['close'].rolling(20).mean().iloc[-1]
+            btc_close = btc_data['close'].iat[-1]
+            btc_sma = btc_data['sma_20'].iat[-1]  # get_data(add_indicators=True) already computed it
             btc_trend = "UPTREND" if btc_close > btc_sma else "DOWNTREND"
             market_context += f"\nBTC Trend Analysis:\n- Current Price vs 20 SMA: {btc_trend}\n"
             
@@ -50,6 +50,11 @@ from datetime import datetime, timedelta
 import time
 from src.config import *
 from src.agents.base_agent import BaseAgent
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import signal
+
+PORTFOLIO_CACHE_SECONDS = 30  # Reuse a portfolio valuation this fresh - run() and the PnL checks ask back to back
 
 # Load environment variables
 load_dotenv()
@@ -66,6 +71,9 @@ class RiskAgent(BaseAgent):
         self.client = anthropic.Anthropic(api_key=api_key)
         self.override_active = False
         self.last_override_check = None
+        self._portfolio_cache = None  # (monotonic time, value) of the last successful valuation
+        self._portfolio_lock = threading.Lock()  # Agents run in worker threads now
+        self._last_balance_log = None  # When the balance was last logged - skips re-reading the CSV every check
         
         # Initialize start balance using portfolio value
         self.start_balance = self.get_portfolio_value()
@@ -75,7 +83,19 @@ class RiskAgent(BaseAgent):
         cprint("🛡️ Risk Agent initialized!", "white", "on_blue")
         
     def get_portfolio_value(self):
-        """Calculate total portfolio value in USD"""
+        """Calculate total portfolio value in USD (cached for PORTFOLIO_CACHE_SECONDS)"""
+        with self._portfolio_lock:
+            if self._portfolio_cache and time.monotonic() - self._portfolio_cache[0] < PORTFOLIO_CACHE_SECONDS:
+                return self._portfolio_cache[1]
+                
+            total_value = self._fetch_portfolio_value()
+            if total_value is not None:
+                self._portfolio_cache = (time.monotonic(), total_value)
+                return total_value
+            return 0.0
+            
+    def _fetch_portfolio_value(self):
+        """Price every monitored balance over RPC - None on error so failures aren't cached"""
         total_value = 0.0
         
         try:
@@ -93,11 +113,29 @@ class RiskAgent(BaseAgent):
             
         except Exception as e:
             cprint(f"❌ Error calculating portfolio value: {str(e)}", "white", "on_red")
-            return 0.0
+            return None
+
+    def warm_cache(self):
+        """Load the last balance-log time up front so the first check doesn't have to read the CSV"""
+        try:
+            balance_file = 'src/data/portfolio_balance.csv'
+            if os.path.exists(balance_file):
+                df = pd.read_csv(balance_file, usecols=['timestamp'])
+                if not df.empty:
+                    self._last_balance_log = pd.to_datetime(df['timestamp']).max().to_pydatetime()
+        except Exception as e:
+            cprint(f"⚠️ Couldn't warm balance log cache: {str(e)}", "white", "on_yellow")
 
     def log_daily_balance(self):
         """Log portfolio value if not logged in past check period"""
         try:
+            # Already know about a recent log - no need to touch the CSV
+            if self._last_balance_log is not None:
+                hours_since_log = (datetime.now() - self._last_balance_log).total_seconds() / 3600
+                if hours_since_log < config.MAX_LOSS_GAIN_CHECK_HOURS:
+                    cprint(f"✨ Recent balance log found ({hours_since_log:.1f} hours ago)", "white", "on_blue")
+                    return
+                    
             # Create data directory if it doesn't exist
             os.makedirs('src/data', exist_ok=True)
             balance_file = 'src/data/portfolio_balance.csv'
@@ -108,6 +146,7 @@ class RiskAgent(BaseAgent):
                 if not df.empty:
                     df['timestamp'] = pd.to_datetime(df['timestamp'])
                     last_log = df['timestamp'].max()
+                    self._last_balance_log = last_log.to_pydatetime()
                     hours_since_log = (datetime.now() - last_log).total_seconds() / 3600
                     
                     if hours_since_log < config.MAX_LOSS_GAIN_CHECK_HOURS:
@@ -120,14 +159,16 @@ class RiskAgent(BaseAgent):
             current_value = self.get_portfolio_value()
             
             # Add new row
+            logged_at = datetime.now()
             new_row = {
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': logged_at.strftime('%Y-%m-%d %H:%M:%S'),
                 'balance': current_value
             }
             df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
             
             # Save updated log
             df.to_csv(balance_file, index=False)
+            self._last_balance_log = logged_at
             cprint(f"💾 New portfolio balance logged: ${current_value:.2f}", "white", "on_green")
             
         except Exception as e:
@@ -290,18 +331,22 @@ class RiskAgent(BaseAgent):
                 cprint("📝 No monitored positions to close", "white", "on_blue")
                 return
                 
-            # Close each monitored position
-            for _, row in positions.iterrows():
-                token = row['Mint Address']
-                value = row['USD Value']
-                
-                cprint(f"\n💰 Closing position: {token} (${value:.2f})", "white", "on_cyan")
-                try:
-                    n.chunk_kill(token, max_usd_order_size, slippage)
-                    cprint(f"✅ Successfully closed position for {token}", "white", "on_green")
-                except Exception as e:
-                    cprint(f"❌ Error closing position for {token}: {str(e)}", "white", "on_red")
+            # Close every monitored position at once - total time is the slowest exit, not the sum of them
+            values = dict(zip(positions['Mint Address'], positions['USD Value']))
+            with ThreadPoolExecutor(max_workers=min(n.MAX_CLOSE_WORKERS, len(values)), thread_name_prefix='risk-close') as pool:
+                futures = {}
+                for token, value in values.items():
+                    cprint(f"\n💰 Closing position: {token} (${value:.2f})", "white", "on_cyan")
+                    futures[pool.submit(n.chunk_kill, token, max_usd_order_size, slippage)] = token
+                for future in as_completed(futures):
+                    token = futures[future]
+                    try:
+                        future.result()
+                        cprint(f"✅ Successfully closed position for {token}", "white", "on_green")
+                    except Exception as e:
+                        cprint(f"❌ Error closing position for {token}: {str(e)}", "white", "on_red")
                     
+            self._portfolio_cache = None  # Balances just changed - next check must re-price
             cprint("\n✨ All monitored positions closed", "white", "on_green")
             
         except Exception as e:
@@ -439,40 +484,8 @@ Then explain your reasoning.
             return 0.0
 
     def run(self):
-        """Run the risk agent (implements BaseAgent interface)"""
-        try:
-            # Get current PnL
-            current_pnl = self.get_current_pnl()
-            current_balance = self.get_portfolio_value()
-            
-            print(f"\n💰 Current PnL: ${current_pnl:.2f}")
-            print(f"💼 Current Balance: ${current_balance:.2f}")
-            print(f"📉 Minimum Balance Limit: ${MINIMUM_BALANCE_USD:.2f}")
-            
-            # Check minimum balance limit
-            if current_balance < MINIMUM_BALANCE_USD:
-                print(f"⚠️ ALERT: Current balance ${current_balance:.2f} is below minimum ${MINIMUM_BALANCE_USD:.2f}")
-                self.handle_limit_breach("MINIMUM_BALANCE", current_balance)
-                return True
-            
-            # Check PnL limits
-            if USE_PERCENTAGE:
-                if abs(current_pnl) >= MAX_LOSS_PERCENT:
-                    print(f"⚠️ PnL limit reached: {current_pnl}%")
-                    self.handle_limit_breach("PNL_PERCENT", current_pnl)
-                    return True
-            else:
-                if abs(current_pnl) >= MAX_LOSS_USD:
-                    print(f"⚠️ PnL limit reached: ${current_pnl:.2f}")
-                    self.handle_limit_breach("PNL_USD", current_pnl)
-                    return True
-                    
-            print("✅ All risk limits OK")
-            return False
-            
-        except Exception as e:
-            print(f"❌ Error checking risk limits: {str(e)}")
-            return False
+        """Run the risk agent (implements BaseAgent interface) - True when a limit was breached"""
+        return self.check_risk_limits()
 
 def main():
     """Main function to run the risk agent"""
@@ -480,7 +493,11 @@ def main():
     
     agent = RiskAgent()
     
-    while True:
+    # SIGTERM ends the loop right away instead of after the current 5 minute wait
+    shutdown = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: shutdown.set())
+    
+    while not shutdown.is_set():
         try:
             # Always try to log balance (function will check if 12 hours have passed)
             agent.log_daily_balance()
@@ -489,7 +506,7 @@ def main():
             agent.check_pnl_limits()
             
             # Sleep for 5 minutes before next check
-            time.sleep(300)
+            shutdown.wait(300)
                 
         except KeyboardInterrupt:
             print("\n👋 Risk Agent shutting down gracefully...")
@@ -497,7 +514,7 @@ def main():
         except Exception as e:
             print(f"❌ Error: {str(e)}")
             print("🔧 Moon Dev suggests checking the logs and trying again!")
-            time.sleep(300)  # Still sleep on error
+            shutdown.wait(300)  # Still sleep on error
 
 if __name__ == "__main__":
     main()
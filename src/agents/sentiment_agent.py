@@ -26,11 +26,14 @@ SENTIMENT_ANNOUNCE_THRESHOLD = 0.4  # Announce vocally if abs(sentiment) > this
 VOICE_MODEL = "tts-1"  # or tts-1-hd for higher quality
 VOICE_NAME = "nova"   # Options: alloy, echo, fable, onyx, nova, shimmer
 VOICE_SPEED = 1      # 0.25 to 4.0
+AUDIO_CLEANUP_DELAY_SECONDS = 60  # Windows only: how long to wait before deleting a played announcement
 
 import httpx
 from dotenv import load_dotenv
 import os
 import sys
+import subprocess
+import threading
 from termcolor import cprint
 import time
 from datetime import datetime, timedelta
@@ -51,9 +54,6 @@ pathlib.Path(DATA_FOLDER).mkdir(parents=True, exist_ok=True)
 # Load environment variables
 load_dotenv()
 
-# Get OpenAI key for voice
-openai.api_key = os.getenv("OPENAI_KEY")
-
 # Patch httpx
 original_client = httpx.Client
 def patched_client(*args, **kwargs):
@@ -103,6 +103,12 @@ class SentimentAgent:
         self.audio_dir = Path("src/audio")
         self.audio_dir.mkdir(parents=True, exist_ok=True)
         
+        # One OpenAI client for voice, reused so announcements share a warm connection
+        openai_key = os.getenv("OPENAI_KEY")
+        self.openai_client = openai.OpenAI(api_key=openai_key) if openai_key else None
+        if not self.openai_client:
+            cprint("⚠️ OPENAI_KEY not found - voice announcements disabled", "yellow")
+        
         # Initialize sentiment history file
         if not os.path.exists(SENTIMENT_HISTORY_FILE):
             pd.DataFrame(columns=['timestamp', 'sentiment_score', 'num_tweets']).to_csv(SENTIMENT_HISTORY_FILE, index=False)
@@ -153,7 +159,7 @@ class SentimentAgent:
             print(f"\n🗣️ {message}")
             
             # Only use voice for important messages
-            if not is_important:
+            if not is_important or not self.openai_client:
                 return
                 
             # Generate unique filename based on timestamp
@@ -161,7 +167,7 @@ class SentimentAgent:
             speech_file = self.audio_dir / f"sentiment_audio_{timestamp}.mp3"
             
             # Generate speech using OpenAI
-            response = openai.audio.speech.create(
+            response = self.openai_client.audio.speech.create(
                 model=VOICE_MODEL,
                 voice=VOICE_NAME,
                 speed=VOICE_SPEED,
@@ -175,20 +181,36 @@ class SentimentAgent:
             
             # Play the audio
             if os.name == 'posix':  # macOS/Linux
-                os.system(f"afplay {speech_file}")
+                # Play in the background and clean up once playback finishes so the agent keeps running
+                try:
+                    proc = subprocess.Popen(['afplay', str(speech_file)], stdout=subprocess.DEVNULL)
+                except OSError as e:  # No afplay (e.g. Linux) - nothing will play it, so don't leave it behind
+                    print(f"⚠️ Couldn't play announcement: {e}")
+                    self._delete_audio_file(speech_file)
+                    return
+                threading.Thread(target=self._cleanup_after_playback, args=(proc, speech_file), daemon=True).start()
             else:  # Windows
-                os.system(f"start {speech_file}")
-                time.sleep(5)
-            
-            # Clean up
-            try:
-                speech_file.unlink()
-            except Exception as e:
-                print(f"⚠️ Couldn't delete audio file: {e}")
+                # startfile hands the file to the default player and returns right away - delete it once it's had time to play
+                os.startfile(str(speech_file))
+                cleanup = threading.Timer(AUDIO_CLEANUP_DELAY_SECONDS, self._delete_audio_file, args=(speech_file,))
+                cleanup.daemon = True
+                cleanup.start()
                 
         except Exception as e:
             print(f"❌ Error in text-to-speech: {str(e)}")
 
+    def _cleanup_after_playback(self, proc, speech_file):
+        """Wait for a background player to finish, then delete its audio file"""
+        proc.wait()
+        self._delete_audio_file(speech_file)
+
+    def _delete_audio_file(self, speech_file):
+        """Remove a played announcement file"""
+        try:
+            speech_file.unlink(missing_ok=True)
+        except Exception as e:
+            print(f"⚠️ Couldn't delete audio file: {e}")
+
     def save_sentiment_score(self, sentiment_score, num_tweets):
         """Save sentiment score to history"""
         try:
@@ -232,11 +254,13 @@ class SentimentAgent:
             history_df['timestamp'] = pd.to_datetime(history_df['timestamp'], format='ISO8601')
             history_df = history_df.sort_values('timestamp')
             
-            current_score = float(history_df.iloc[-1]['sentiment_score'])
-            previous_score = float(history_df.iloc[-2]['sentiment_score'])
+            scores = history_df['sentiment_score']
+            times = history_df['timestamp']
+            current_score = float(scores.iat[-1])
+            previous_score = float(scores.iat[-2])
             
             # Calculate time difference in minutes
-            time_diff = (history_df.iloc[-1]['timestamp'] - history_df.iloc[-2]['timestamp']).total_seconds() / 60
+            time_diff = (times.iat[-1] - times.iat[-2]).total_seconds() / 60
             
             # Calculate percentage change relative to the scale (-1 to 1)
             # Convert to 0-100 scale for easier understanding
@@ -8,8 +8,6 @@ import json
 from termcolor import cprint
 import anthropic
 import os
-import importlib
-import inspect
 import time
 from src import nice_funcs as n
 
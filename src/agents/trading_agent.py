@@ -75,10 +75,13 @@ from src.data.ohlcv_collector import collect_all_tokens
 # Load environment variables
 load_dotenv()
 
+PREFETCH_MAX_AGE_SECONDS = 300  # Prefetched market data older than this is re-collected
+
 class TradingAgent:
     def __init__(self):
         self.client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_KEY"))
         self.recommendations_df = pd.DataFrame(columns=['token', 'action', 'confidence', 'reasoning'])
+        self._prefetched = None  # (monotonic time, market data) from prefetch_market_data
         print("🤖 Moon Dev's LLM Trading Agent initialized!")
 
     def analyze_market_data(self, token, market_data):
@@ -325,12 +328,10 @@ Example format:
             # Parse the cleaned JSON
             allocations = json.loads(json_str)
             
+            # Print and validate in one pass - amounts must be non-negative numbers
             print("\n📊 Parsed allocations:")
             for token, amount in allocations.items():
                 print(f"  • {token}: ${amount}")
-            
-            # Validate amounts are numbers
-            for token, amount in allocations.items():
                 if not isinstance(amount, (int, float)):
                     raise ValueError(f"Invalid amount type for {token}: {type(amount)}")
                 if amount < 0:
@@ -375,6 +376,19 @@ Example format:
             print(f"❌ Unexpected error parsing allocations: {e}")
             return None
 
+    def prefetch_market_data(self):
+        """Collect OHLCV ahead of the next cycle - lets main.py overlap the fetch with the risk check"""
+        self._prefetched = (time.monotonic(), collect_all_tokens())
+
+    def _take_market_data(self):
+        """Use fresh prefetched market data once, otherwise collect it now"""
+        prefetched, self._prefetched = self._prefetched, None
+        if prefetched and time.monotonic() - prefetched[0] < PREFETCH_MAX_AGE_SECONDS:
+            cprint("📊 Using prefetched market data...", "white", "on_blue")
+            return prefetched[1]
+        cprint("📊 Collecting market data...", "white", "on_blue")
+        return collect_all_tokens()
+
     def run(self):
         """Run the trading agent (implements BaseAgent interface)"""
         self.run_trading_cycle()
@@ -386,8 +400,7 @@ Example format:
             cprint(f"\n⏰ AI Agent Run Starting at {current_time}", "white", "on_green")
             
             # Collect OHLCV data for all tokens
-            cprint("📊 Collecting market data...", "white", "on_blue")
-            market_data = collect_all_tokens()
+            market_data = self._take_market_data()
             
             # Analyze each token's data
             for token, data in market_data.items():
@@ -429,7 +442,7 @@ Example format:
             cprint("\n🧹 Cleaning up temporary data...", "white", "on_blue")
             try:
                 for file in os.listdir('temp_data'):
-                    if file.endswith('_latest.csv'):
+                    if file.endswith('_latest.parquet'):
                         os.remove(os.path.join('temp_data', file))
                 cprint("✨ Temp data cleaned successfully!", "white", "on_green")
             except Exception as e:
@@ -6,21 +6,23 @@ Dez the Whale Agent tracks open interest changes across different timeframes and
 """
 
 import os
+import sys
+import math
+import logging
+import atexit
+import subprocess
 import pandas as pd
 import time
-from datetime import datetime, timedelta
-from termcolor import colored, cprint
+from datetime import datetime
 from dotenv import load_dotenv
-import openai
 from pathlib import Path
-from src import nice_funcs as n
 from src import nice_funcs_hl as hl  # Add import for hyperliquid functions
 from src.agents.api import MoonDevAPI
-from collections import deque
 from src.agents.base_agent import BaseAgent
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import anthropic
+import httpx
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -31,6 +33,14 @@ LOOKBACK_PERIODS = {
     '15min': 15  # Simplified to just 15 minutes
 }
 
+# History Settings
+HISTORY_HOURS = 24  # How much OI history to keep
+HISTORY_SIZE = math.ceil(HISTORY_HOURS * 60 / CHECK_INTERVAL_MINUTES)  # Ring buffer slots
+HISTORY_NS = HISTORY_HOURS * 3600 * 10**9  # History window in nanoseconds
+HISTORY_FLUSH_EVERY = 6  # Write history to disk every N samples (always flushed on exit)
+OI_COLUMNS = ['timestamp', 'btc_oi', 'eth_oi', 'total_oi', 'btc_change_pct', 'eth_change_pct', 'total_change_pct']
+OI_CSV_DTYPES = {col: 'f8' for col in OI_COLUMNS[1:]}  # Explicit dtypes for the legacy CSV import
+
 # Whale Detection Settings
 WHALE_THRESHOLD_MULTIPLIER = 1.31 #1.25  # Multiplier for average change to detect whale activity (e.g. 1.25 = 25% above average)
 
@@ -47,6 +57,57 @@ VOICE_MODEL = "tts-1"  # or tts-1-hd for higher quality
 VOICE_NAME = "shimmer"   # Options: alloy, echo, fable, onyx, nova, shimmer
 VOICE_SPEED = 1      # 0.25 to 4.0
 
+# Logging - per-cycle diagnostics are DEBUG so they aren't even formatted at the default INFO level
+LOG_LEVEL = logging.INFO
+log = logging.getLogger('whale')
+if not log.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(_handler)
+    log.setLevel(LOG_LEVEL)
+    log.propagate = False
+
+# Speech number formatting
+BILLION = 1e9
+MILLION = 1e6
+BILLION_TEMPLATE = "{:.4f} billion"
+MILLION_TEMPLATE = "{:.2f} million"
+
+# Connection pool settings for the Anthropic + OpenAI clients
+HTTP_MAX_CONNECTIONS = 10
+HTTP_MAX_KEEPALIVE = 8
+HTTP_KEEPALIVE_EXPIRY = 60  # seconds
+
+# Shared clients - built once per process so every WhaleAgent reuses the same warm connections
+_ANTHROPIC = None
+_OPENAI = None
+_MOONDEV_API = None
+
+def _get_shared_clients(openai_key, anthropic_key):
+    """Create the Anthropic, OpenAI and Moon Dev API clients once and hand back the cached ones after that"""
+    global _ANTHROPIC, _OPENAI, _MOONDEV_API
+    import anthropic  # Imported here so loading this module doesn't pay for the SDKs until an agent is built
+    import openai
+    
+    # Each SDK keeps its own DefaultHttpxClient pool (with its own timeouts/redirects) - they only share these limits
+    limits = httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+    )
+    if _ANTHROPIC is None:
+        _ANTHROPIC = anthropic.Anthropic(api_key=anthropic_key, http_client=anthropic.DefaultHttpxClient(limits=limits))
+    if _OPENAI is None:
+        _OPENAI = openai.OpenAI(api_key=openai_key, http_client=openai.DefaultHttpxClient(limits=limits))
+    if _MOONDEV_API is None:
+        _MOONDEV_API = MoonDevAPI()  # Keeps its own requests.Session alive between OI fetches
+        
+    return _ANTHROPIC, _OPENAI, _MOONDEV_API
+
+def _now_ns():
+    """Current local wall-clock time as int64 nanoseconds - matches the naive timestamps we store"""
+    return time.time_ns() + time.localtime().tm_gmtoff * 1_000_000_000
+
 # AI Analysis Prompt
 WHALE_ANALYSIS_PROMPT = """You must respond in exactly 3 lines:
 Line 1: Only write BUY, SELL, or NOTHING
@@ -95,10 +156,9 @@ class WhaleAgent(BaseAgent):
         if not anthropic_key:
             raise ValueError("🚨 ANTHROPIC_KEY not found in environment variables!")
             
-        openai.api_key = openai_key
-        self.client = anthropic.Anthropic(api_key=anthropic_key)
-        
-        self.api = MoonDevAPI()
+        self.client, self.openai_client, self.api = _get_shared_clients(openai_key, anthropic_key)
+        self._player_proc = None  # Current afplay process so playback never blocks the cycle
+        self._tts_pool = ThreadPoolExecutor(max_workers=1)  # Single worker keeps announcements in order
         
         # Create data directories if they don't exist
         self.audio_dir = PROJECT_ROOT / "src" / "audio"
@@ -106,42 +166,118 @@ class WhaleAgent(BaseAgent):
         self.audio_dir.mkdir(parents=True, exist_ok=True)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize or load historical data
-        self.history_file = self.data_dir / "oi_history.csv"
+        # Initialize or load historical data (Parquet keeps the columns typed - no re-parsing on load)
+        self.history_file = self.data_dir / "oi_history.parquet"
+        self.legacy_history_file = self.data_dir / "oi_history.csv"  # Imported once if no Parquet file yet
+        self._unflushed = 0  # Samples added since the last write to disk
         self.load_history()
+        atexit.register(self._flush_history)  # Don't lose buffered samples on shutdown
         
         print("🐋 Dez the Whale Agent initialized!")
         
+    def _init_history_buffer(self):
+        """Allocate the fixed-size ring buffer that holds the last 24h of OI samples"""
+        # One contiguous array per column (timestamps as int64 nanoseconds, the rest float64)
+        self._cols = {
+            col: np.empty(HISTORY_SIZE, dtype='i8' if col == 'timestamp' else 'f8')
+            for col in OI_COLUMNS
+        }
+        self._head = 0   # Next slot to write
+        self._count = 0  # Number of valid samples in the buffer
+        self._abs_change_sum = 0.0  # Running sum of |btc_change_pct| over the buffer for whale detection
+        
+    def _column(self, col):
+        """Return the valid part of a history column, oldest sample first"""
+        arr = self._cols[col]
+        start = (self._head - self._count) % HISTORY_SIZE
+        if start + self._count <= HISTORY_SIZE:
+            return arr[start:start + self._count]
+        return np.concatenate((arr[start:], arr[:self._head]))
+        
+    def _snapshot_df(self):
+        """Materialize the ring buffer as a DataFrame - only needed for persistence"""
+        df = pd.DataFrame({col: self._column(col) for col in OI_COLUMNS})
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        return df
+        
+    def _latest(self, col):
+        """Read the newest value of a history column straight from the buffer"""
+        return self._cols[col][(self._head - 1) % HISTORY_SIZE]
+        
+    def _oldest(self, col):
+        """Read the oldest value of a history column straight from the buffer"""
+        return self._cols[col][(self._head - self._count) % HISTORY_SIZE]
+        
+    def _slot_at_or_before(self, target_ns):
+        """Ring buffer slot of the newest sample at or before target_ns (None if there isn't one)"""
+        # Timestamps are sorted, so binary search instead of masking the whole history
+        pos = int(np.searchsorted(self._column('timestamp'), target_ns, side='right')) - 1
+        if pos < 0:
+            return None
+        return (self._head - self._count + pos) % HISTORY_SIZE
+        
+    @property
+    def oi_history(self):
+        """DataFrame view of the OI history"""
+        return self._snapshot_df()
+        
+    def _prune_history(self, cutoff_ns):
+        """Drop samples at or before cutoff_ns from the front of the ring buffer"""
+        # Timestamps are sorted, so a binary search finds how many have expired
+        expired = int(np.searchsorted(self._column('timestamp'), cutoff_ns, side='right'))
+        if expired:
+            self._abs_change_sum -= float(np.abs(self._column('btc_change_pct')[:expired]).sum())
+        self._count -= expired
+        return expired
+        
+    def _flush_history(self):
+        """Write any buffered samples to the history file"""
+        if not self._unflushed:
+            return
+        self._snapshot_df().to_parquet(self.history_file, compression='zstd', index=False)
+        self._unflushed = 0
+        log.debug("💾 Saved to history file")
+        
     def load_history(self):
         """Load or initialize historical OI data with change tracking"""
+        self._init_history_buffer()
         try:
+            source = None
             if self.history_file.exists():
-                df = pd.read_csv(self.history_file)
+                source = self.history_file
+                df = pd.read_parquet(source)
+            elif self.legacy_history_file.exists():
+                # One-time import of the old CSV history - dtypes and timestamps parsed in a single C-engine pass
+                source = self.legacy_history_file
+                print("📦 Importing legacy CSV OI history")
+                df = pd.read_csv(source, engine='c', dtype=OI_CSV_DTYPES, parse_dates=['timestamp'])
                 
-                # Check if we have the new column format
-                required_columns = ['timestamp', 'btc_oi', 'eth_oi', 'total_oi', 'btc_change_pct', 'eth_change_pct', 'total_change_pct']
-                if all(col in df.columns for col in required_columns):
-                    self.oi_history = df
-                    self.oi_history['timestamp'] = pd.to_datetime(self.oi_history['timestamp'])
-                    print(f"📈 Loaded {len(self.oi_history)} historical OI records")
-                else:
-                    print("📝 Detected old format, creating new history file")
-                    self.oi_history = pd.DataFrame(columns=required_columns)
-                    self.history_file.unlink()
-            else:
-                self.oi_history = pd.DataFrame(columns=['timestamp', 'btc_oi', 'eth_oi', 'total_oi', 
-                                                      'btc_change_pct', 'eth_change_pct', 'total_change_pct'])
+            if source is None:
                 print("📝 Created new OI history file")
+            # Check if we have the new column format
+            elif all(col in df.columns for col in OI_COLUMNS):
+                df = df.tail(HISTORY_SIZE)
+                n = len(df)
+                self._cols['timestamp'][:n] = pd.to_datetime(df['timestamp']).to_numpy(dtype='datetime64[ns]').view('i8')
+                for col in OI_COLUMNS[1:]:
+                    self._cols[col][:n] = df[col].to_numpy(dtype='f8')
+                self._head = n % HISTORY_SIZE
+                self._count = n
+                self._abs_change_sum = float(np.abs(self._cols['btc_change_pct'][:n]).sum())
+                print(f"📈 Loaded {self._count} historical OI records")
+            else:
+                print("📝 Detected old format, creating new history file")
+                source.unlink()
+                source = None
                 
-            # Clean up old data (keep only last 24 hours)
-            if not self.oi_history.empty:
-                cutoff_time = datetime.now() - timedelta(hours=24)
-                self.oi_history = self.oi_history[self.oi_history['timestamp'] > cutoff_time]
-                self.oi_history.to_csv(self.history_file, index=False)
+            # Clean up old data (keep only last 24 hours) and write the Parquet file if anything changed
+            pruned = self._count and self._prune_history(_now_ns() - HISTORY_NS)
+            if pruned or source == self.legacy_history_file:
+                self._snapshot_df().to_parquet(self.history_file, compression='zstd', index=False)
                 
         except Exception as e:
             print(f"❌ Error loading history: {str(e)}")
-            self.oi_history = pd.DataFrame(columns=['timestamp', 'btc_oi', 'eth_oi', 'total_oi'])
+            self._init_history_buffer()
             
     def _save_oi_data(self, timestamp, btc_oi, eth_oi, total_oi):
         """Save new OI data point with change percentages"""
@@ -149,118 +285,119 @@ class WhaleAgent(BaseAgent):
             # Calculate percentage changes if we have previous data
             btc_change_pct = eth_change_pct = total_change_pct = 0.0
             
-            if not self.oi_history.empty:
-                prev_data = self.oi_history.iloc[-1]
-                print("\n📊 Previous vs Current OI:")
-                print(f"Previous BTC OI: ${prev_data['btc_oi']:,.2f}")
-                print(f"Current BTC OI: ${btc_oi:,.2f}")
-                
-                btc_change_pct = ((btc_oi - prev_data['btc_oi']) / prev_data['btc_oi']) * 100
-                eth_change_pct = ((eth_oi - prev_data['eth_oi']) / prev_data['eth_oi']) * 100
-                total_change_pct = ((total_oi - prev_data['total_oi']) / prev_data['total_oi']) * 100
+            if self._count:
+                prev = np.array([self._latest('btc_oi'), self._latest('eth_oi'), self._latest('total_oi')])
+                curr = np.array([btc_oi, eth_oi, total_oi], dtype='f8')
+                btc_change_pct, eth_change_pct, total_change_pct = ((curr - prev) / prev * 100.0).tolist()
                 
-                print(f"\n📈 Calculated Changes:")
-                print(f"BTC Change: {btc_change_pct:.4f}%")
-                print(f"ETH Change: {eth_change_pct:.4f}%")
-                print(f"Total Change: {total_change_pct:.4f}%")
-            
-            # Add new data point
-            new_row = pd.DataFrame([{
-                'timestamp': timestamp,
-                'btc_oi': float(btc_oi),
-                'eth_oi': float(eth_oi),
-                'total_oi': float(total_oi),
-                'btc_change_pct': btc_change_pct,
-                'eth_change_pct': eth_change_pct,
-                'total_change_pct': total_change_pct
-            }])
-            
-            print("\n📝 Adding new data point to history...")
-            print(f"History size before: {len(self.oi_history)}")
-            self.oi_history = pd.concat([self.oi_history, new_row], ignore_index=True)
-            print(f"History size after: {len(self.oi_history)}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("\n".join([
+                        "\n📊 Previous vs Current OI:",
+                        f"Previous BTC OI: ${prev[0]:,.2f}",
+                        f"Current BTC OI: ${btc_oi:,.2f}",
+                        "\n📈 Calculated Changes:",
+                        f"BTC Change: {btc_change_pct:.4f}%",
+                        f"ETH Change: {eth_change_pct:.4f}%",
+                        f"Total Change: {total_change_pct:.4f}%"
+                    ]))
+            
+            # Write new data point into the next ring slot - no reallocation or copying
+            size_before = self._count
+            i = self._head
+            cols = self._cols
+            if self._count == HISTORY_SIZE:  # Buffer full - the slot we're about to overwrite drops out of the average
+                self._abs_change_sum -= abs(cols['btc_change_pct'][i])
+            self._abs_change_sum += abs(btc_change_pct)
+            ts_ns = pd.Timestamp(timestamp).value
+            cols['timestamp'][i] = ts_ns
+            cols['btc_oi'][i] = btc_oi
+            cols['eth_oi'][i] = eth_oi
+            cols['total_oi'][i] = total_oi
+            cols['btc_change_pct'][i] = btc_change_pct
+            cols['eth_change_pct'][i] = eth_change_pct
+            cols['total_change_pct'][i] = total_change_pct
+            self._head = (i + 1) % HISTORY_SIZE
+            self._count = min(HISTORY_SIZE, self._count + 1)
             
             # Clean up old data
-            cutoff_time = datetime.now() - timedelta(hours=24)
-            old_size = len(self.oi_history)
-            self.oi_history = self.oi_history[self.oi_history['timestamp'] > cutoff_time]
-            print(f"Removed {old_size - len(self.oi_history)} old records")
+            removed = self._prune_history(ts_ns - HISTORY_NS)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"\n📝 Added new data point to history: {size_before} -> {self._count} records, removed {removed} old records")
             
-            # Save to file
-            self.oi_history.to_csv(self.history_file, index=False)
-            print("💾 Saved to history file")
+            # Save to file in batches instead of rewriting it every tick
+            self._unflushed += 1
+            if self._unflushed >= HISTORY_FLUSH_EVERY:
+                self._flush_history()
             
         except Exception as e:
-            print(f"❌ Error saving OI data: {str(e)}")
-            print(f"Stack trace: {traceback.format_exc()}")
+            log.error(f"❌ Error saving OI data: {str(e)}\nStack trace: {traceback.format_exc()}")
             
     def _format_number_for_speech(self, number):
         """Convert numbers to speech-friendly format"""
-        billions = number / 1e9
-        if billions >= 1:
-            return f"{billions:.4f} billion"
-        millions = number / 1e6
-        return f"{millions:.2f} million"
+        if number >= BILLION:
+            return BILLION_TEMPLATE.format(number / BILLION)
+        return MILLION_TEMPLATE.format(number / MILLION)
 
     def _get_current_oi(self):
         """Get current open interest data from API"""
         try:
-            print("\n🔍 Fetching fresh OI data from API...")
+            log.debug("\n🔍 Fetching fresh OI data from API...")
             df = self.api.get_oi_data()  # Changed from get_open_interest to get_oi_data
             
             if df is None:
-                print("❌ Failed to get current OI data")
+                log.error("❌ Failed to get current OI data")
                 return None
                 
-            print(f"✨ Successfully fetched {len(df)} OI records")
+            log.debug("✨ Successfully fetched %d OI records", len(df))
             return df
             
         except Exception as e:
-            print(f"❌ Error getting OI data: {str(e)}")
-            print(f"Stack trace: {traceback.format_exc()}")
+            log.error(f"❌ Error getting OI data: {str(e)}\nStack trace: {traceback.format_exc()}")
             return None
             
-    def _get_historical_oi(self, minutes_ago):
+    def _get_historical_oi(self, minutes_ago, now_ns=None):
         """Get OI data from X minutes ago"""
         try:
-            target_time = datetime.now() - timedelta(minutes=minutes_ago)
+            if now_ns is None:
+                now_ns = _now_ns()
             
             # Find closest data point before target time
-            historical_data = self.oi_history[self.oi_history['timestamp'] <= target_time]
-            
-            if not historical_data.empty:
-                return float(historical_data.iloc[-1]['total_oi'])
+            slot = self._slot_at_or_before(now_ns - minutes_ago * 60 * 10**9)
+            if slot is not None:
+                return float(self._cols['total_oi'][slot])
             return None
             
         except Exception as e:
-            print(f"❌ Error getting historical OI: {str(e)}")
+            log.error(f"❌ Error getting historical OI: {str(e)}")
             return None
         
-    def _calculate_changes(self, current_oi):
+    def _calculate_changes(self, current_oi, now_ns=None):
         """Calculate OI changes for the configured interval"""
         changes = {}
         
-        print("\n📊 Calculating OI Changes:")
-        
         # Get current BTC value
-        current_btc = float(self.oi_history.iloc[-1]['btc_oi'])
-        print(f"Current BTC OI: ${current_btc:,.2f}")
+        current_btc = float(self._latest('btc_oi'))
         
         # Use our local CHECK_INTERVAL_MINUTES constant
         interval = CHECK_INTERVAL_MINUTES
         
         # Get historical data from X minutes ago
-        historical_data = self.oi_history[
-            self.oi_history['timestamp'] <= (datetime.now() - timedelta(minutes=interval))
-        ]
+        if now_ns is None:
+            now_ns = _now_ns()
+        slot = self._slot_at_or_before(now_ns - interval * 60 * 10**9)
         
-        if not historical_data.empty:
-            historical_btc = float(historical_data.iloc[-1]['btc_oi'])
-            print(f"Historical BTC OI ({interval}m ago): ${historical_btc:,.2f}")
+        if slot is not None:
+            historical_btc = float(self._cols['btc_oi'][slot])
             
             # Calculate percentage change
             btc_pct_change = ((current_btc - historical_btc) / historical_btc) * 100
-            print(f"Calculated change: {btc_pct_change:.4f}%")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("\n".join([
+                    "\n📊 Calculating OI Changes:",
+                    f"Current BTC OI: ${current_btc:,.2f}",
+                    f"Historical BTC OI ({interval}m ago): ${historical_btc:,.2f}",
+                    f"Calculated change: {btc_pct_change:.4f}%"
+                ]))
             
             changes = {
                 'btc': btc_pct_change,
@@ -269,7 +406,7 @@ class WhaleAgent(BaseAgent):
                 'current_btc': current_btc
             }
         else:
-            print(f"⚠️ No historical data found from {interval}m ago")
+            log.info(f"⚠️ No historical data found from {interval}m ago")
         
         return changes
         
@@ -285,7 +422,7 @@ class WhaleAgent(BaseAgent):
                 market_data=market_data.tail(5).to_string() if market_data is not None else "No market data available"
             )
             
-            print(f"\n🤖 Analyzing whale movement with AI...")
+            log.info("\n🤖 Analyzing whale movement with AI...")
             
             # Get AI analysis using instance settings
             message = self.client.messages.create(
@@ -300,7 +437,7 @@ class WhaleAgent(BaseAgent):
             
             # Handle response
             if not message or not message.content:
-                print("❌ No response from AI")
+                log.error("❌ No response from AI")
                 return None
                 
             # Handle TextBlock response
@@ -309,19 +446,19 @@ class WhaleAgent(BaseAgent):
                 if len(response) > 0 and hasattr(response[0], 'text'):
                     response = response[0].text
                 else:
-                    print("❌ Invalid response format from AI")
+                    log.error("❌ Invalid response format from AI")
                     return None
             
             # Parse response
             lines = [line.strip() for line in response.split('\n') if line.strip()]
             if not lines:
-                print("❌ Empty response from AI")
+                log.error("❌ Empty response from AI")
                 return None
                 
             # First line should be the action
             action = lines[0].strip().upper()
             if action not in ['BUY', 'SELL', 'NOTHING']:
-                print(f"⚠️ Invalid action: {action}")
+                log.warning(f"⚠️ Invalid action: {action}")
                 return None
                 
             # Rest is analysis
@@ -337,7 +474,7 @@ class WhaleAgent(BaseAgent):
                         if matches:
                             confidence = int(matches[0])
                     except:
-                        print("⚠️ Could not parse confidence, using default")
+                        log.warning("⚠️ Could not parse confidence, using default")
             
             return {
                 'action': action,
@@ -346,8 +483,7 @@ class WhaleAgent(BaseAgent):
             }
             
         except Exception as e:
-            print(f"❌ Error in AI analysis: {str(e)}")
-            traceback.print_exc()
+            log.error(f"❌ Error in AI analysis: {str(e)}\n{traceback.format_exc()}")
             return None
             
     def _format_announcement(self, changes):
@@ -365,7 +501,7 @@ class WhaleAgent(BaseAgent):
             # Get market data for analysis if it's a whale movement
             market_data = None
             if is_whale:
-                print("\n📊 Fetching market data for analysis...")
+                log.info("\n📊 Fetching market data for analysis...")
                 market_data = hl.get_data(
                     symbol='BTC',
                     timeframe='15m',
@@ -394,38 +530,40 @@ class WhaleAgent(BaseAgent):
     def run_monitoring_cycle(self):
         """Run one monitoring cycle"""
         try:
-            print("\n📊 Checking Open Interest...")
+            log.info("\n📊 Checking Open Interest...")
+            now_ns = _now_ns()  # One clock read shared by the whole cycle
             current_oi = self._get_current_oi()
             
             if current_oi is None:
-                print("❌ Failed to get current OI data")
+                log.error("❌ Failed to get current OI data")
                 return
                 
             # Calculate and announce changes if we have enough data
-            if len(self.oi_history) > 2:  # Need at least 2 data points
-                changes = self._calculate_changes(current_oi)
+            if self._count > 2:  # Need at least 2 data points
+                changes = self._calculate_changes(current_oi, now_ns)
                 if changes:
                     announcement, is_whale = self._format_announcement(changes)
                     if announcement:
                         self._announce(announcement, is_whale)
             else:
-                print("📝 Building historical data...")
+                log.info("📝 Building historical data...")
                 
         except Exception as e:
-            print(f"❌ Error in monitoring cycle: {str(e)}")
-            print(f"Stack trace: {traceback.format_exc()}")
+            log.error(f"❌ Error in monitoring cycle: {str(e)}\nStack trace: {traceback.format_exc()}")
             
     def _announce(self, message, is_whale=False):
         """Announce a message, only use voice for whale alerts"""
-        try:
-            print(f"\n🗣️ {message}")
+        log.info(f"\n🗣️ {message}")
+        
+        # Only use voice for whale alerts - speech runs on the TTS worker so the next OI fetch isn't held up
+        if is_whale:
+            self._tts_pool.submit(self._speak, message)
             
-            # Only use voice for whale alerts
-            if not is_whale:
-                return
-                
+    def _speak(self, message):
+        """Generate and play a voice announcement (runs on the TTS worker thread)"""
+        try:
             # Generate speech using OpenAI
-            response = openai.audio.speech.create(
+            response = self.openai_client.audio.speech.create(
                 model=VOICE_MODEL,
                 voice=VOICE_NAME,
                 speed=VOICE_SPEED,
@@ -438,17 +576,20 @@ class WhaleAgent(BaseAgent):
             
             response.stream_to_file(audio_file)
             
-            # Play audio using system command
-            os.system(f"afplay {audio_file}")
+            # Newest alert wins - stop any announcement that is still playing
+            if self._player_proc is not None and self._player_proc.poll() is None:
+                self._player_proc.terminate()
+            
+            # Play audio in the background so the next cycle isn't blocked by playback
+            self._player_proc = subprocess.Popen(['afplay', str(audio_file)])
             
         except Exception as e:
-            print(f"❌ Error in announcement: {str(e)}")
-            traceback.print_exc()
+            log.error(f"❌ Error in announcement: {str(e)}\n{traceback.format_exc()}")
 
     def _announce_initial_summary(self):
         """Announce the current state of the market based on existing data"""
         try:
-            if self.oi_history.empty:
+            if not self._count:
                 current_data = self._get_current_oi()
                 if current_data is not None:
                     latest_data = self.oi_history.iloc[-1]
@@ -463,23 +604,23 @@ class WhaleAgent(BaseAgent):
                 return
                 
             # Rest of the method remains unchanged
-            current_oi = float(self.oi_history.iloc[-1]['total_oi'])
+            current_oi = float(self._latest('total_oi'))
             changes = {}
             available_periods = []
             
             # Check what historical data we have
+            now_ns = _now_ns()
             for period_name, minutes in LOOKBACK_PERIODS.items():
-                historical_oi = self._get_historical_oi(minutes)
+                historical_oi = self._get_historical_oi(minutes, now_ns)
                 if historical_oi is not None:
                     pct_change = ((current_oi - historical_oi) / historical_oi) * 100
                     changes[period_name] = pct_change
                     available_periods.append(period_name)
             
             if not changes:
-                earliest_data = self.oi_history.iloc[0]
-                latest_data = self.oi_history.iloc[-1]
-                minutes_diff = (latest_data['timestamp'] - earliest_data['timestamp']).total_seconds() / 60
-                pct_change = ((latest_data['total_oi'] - earliest_data['total_oi']) / earliest_data['total_oi']) * 100
+                earliest_oi, latest_oi = self._oldest('total_oi'), self._latest('total_oi')
+                minutes_diff = (self._latest('timestamp') - self._oldest('timestamp')) / 60e9
+                pct_change = ((latest_oi - earliest_oi) / earliest_oi) * 100
                 
                 message = f"Open Interest has {('increased' if pct_change > 0 else 'decreased')} "
                 message += f"by {abs(pct_change):.1f}% over the last {int(minutes_diff)} minutes."
@@ -493,36 +634,33 @@ class WhaleAgent(BaseAgent):
             self._announce(message)
             
         except Exception as e:
-            print(f"❌ Error in initial summary: {str(e)}")
-            print(f"Stack trace: {traceback.format_exc()}")
+            log.error(f"❌ Error in initial summary: {str(e)}\nStack trace: {traceback.format_exc()}")
 
     def _detect_whale_activity(self, current_change):
         """Detect if current change is significantly above rolling average"""
         try:
-            if len(self.oi_history) < 10:  # Need some history for meaningful average
-                print("⚠️ Not enough history for whale detection")
+            if self._count < 10:  # Need some history for meaningful average
+                log.debug("⚠️ Not enough history for whale detection")
                 return False
             
-            # Get rolling average of absolute changes
-            historical_changes = self.oi_history['btc_change_pct'].abs().rolling(window=10).mean().dropna()
-            if historical_changes.empty:
-                print("⚠️ No historical changes available")
-                return False
-                
-            avg_change = historical_changes.mean()
+            # Average absolute change comes from the running sum - no pass over the history
+            avg_change = self._abs_change_sum / self._count
             threshold = avg_change * WHALE_THRESHOLD_MULTIPLIER
             
-            print(f"\n🔍 Whale Detection Analysis:")
-            print(f"Current change: {abs(current_change):.4f}%")
-            print(f"Average change: {avg_change:.4f}%")
-            print(f"Threshold ({(WHALE_THRESHOLD_MULTIPLIER-1)*100:.0f}% above avg): {threshold:.4f}%")
-            print(f"Is whale? {'Yes! 🐋' if abs(current_change) > threshold else 'No'}")
+            is_whale = abs(current_change) > threshold
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("\n".join([
+                    "\n🔍 Whale Detection Analysis:",
+                    f"Current change: {abs(current_change):.4f}%",
+                    f"Average change: {avg_change:.4f}%",
+                    f"Threshold ({(WHALE_THRESHOLD_MULTIPLIER-1)*100:.0f}% above avg): {threshold:.4f}%",
+                    f"Is whale? {'Yes! 🐋' if is_whale else 'No'}"
+                ]))
             
-            return abs(current_change) > threshold
+            return is_whale
             
         except Exception as e:
-            print(f"❌ Error detecting whale activity: {str(e)}")
-            print(f"Stack trace: {traceback.format_exc()}")
+            log.error(f"❌ Error detecting whale activity: {str(e)}\nStack trace: {traceback.format_exc()}")
             return False
 
 if __name__ == "__main__":
@@ -35,7 +35,6 @@ address = '4wgfCBf2WwLSRKLef9iW7JXZ2AfkxUxGM4XcKpHm3Sin' # YOUR WALLET ADDRESS H
 usd_size = 25  # Size of position to hold
 max_usd_order_size = 3  # Max order size
 tx_sleep = 30  # Sleep between transactions
-slippage = 199  # Slippage settings
 
 # Risk Management Settings 🛡️
 CASH_PERCENTAGE = 20  # Minimum % to keep in USDC as safety buffer (0-100)
@@ -89,9 +88,6 @@ AI_TEMPERATURE = 0.7  # Creativity vs precision (0-1)
 ENABLE_STRATEGIES = True  # Set this to True to use strategies
 STRATEGY_MIN_CONFIDENCE = 0.7  # Minimum confidence to act on strategy signals
 
-# Sleep time between main agent runs
-SLEEP_BETWEEN_RUNS_MINUTES = 15  # How long to sleep between agent runs 🕒
-
 # Future variables (not active yet) 🔮
 sell_at_multiple = 3
 USDC_SIZE = 1
@@ -0,0 +1,139 @@
+"""
+🌙 Moon Dev's OHLCV Data Collector
+Collects Open-High-Low-Close-Volume data for the tokens we trade
+Built with love by Moon Dev 🚀
+"""
+
+import os
+import shutil
+import asyncio
+import functools
+import httpx
+import pandas as pd
+from datetime import datetime
+from pathlib import Path
+from src.config import *
+from src import nice_funcs as n
+
+log = n.queue_logger('ohlcv')
+
+# Get the project root directory
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+
+# Collector settings
+OHLCV_DATA_DIR = PROJECT_ROOT / "src" / "data" / "ohlcv"
+SNAPSHOT_FILENAME = "{token}_{timestamp}.parquet"
+LATEST_FILENAME = "{token}_latest.parquet"
+MAX_CONCURRENT_FETCHES = 4  # Birdeye requests in flight at once - keep low to respect API rate limits
+
+@functools.cache
+def _ensure_data_directory():
+    """Create the OHLCV folder once per process instead of on every save"""
+    os.makedirs(OHLCV_DATA_DIR, exist_ok=True)
+    return OHLCV_DATA_DIR
+
+def _snapshot_timestamp():
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+def _link_latest(filename, latest_filename):
+    """Point the _latest file at the newest snapshot without writing the data a second time"""
+    tmp_link = latest_filename.with_suffix('.tmp')
+    tmp_link.unlink(missing_ok=True)
+    try:
+        os.link(filename, tmp_link)
+    except OSError:
+        shutil.copyfile(filename, tmp_link)  # Filesystem without hardlink support
+    os.replace(tmp_link, latest_filename)  # Atomic swap so readers never see a half-written file
+    tmp_link.unlink(missing_ok=True)  # rename is a no-op when both names already point at the same file
+
+def _load_cached_data(token):
+    """Candles from the last saved _latest file, so only newer ones need fetching (None if nothing is saved)"""
+    latest_filename = OHLCV_DATA_DIR / LATEST_FILENAME.format(token=token)
+    if not latest_filename.exists():
+        return None
+    try:
+        return pd.read_parquet(latest_filename, columns=n.OHLCV_COLUMNS)
+    except Exception as e:
+        log.error(f"⚠️ Moon Dev's AI Agent ignoring unreadable cache for {token[:4]}: {str(e)}", extra=n.cstyle("white", "on_yellow"))
+        return None
+
+def _save_token_data(token, df, timestamp=None, persist=None):
+    """Check the fetched candles and save them - returns the DataFrame or None"""
+    if len(df.index) == 0:  # get_data always returns a DataFrame - empty means the fetch failed
+        log.error(f"❌ Moon Dev's AI Agent couldn't fetch data for {token}", extra=n.cstyle("white", "on_red"))
+        return None
+        
+    log.info(f"📊 Moon Dev's AI Agent processed {len(df)} candles for analysis", extra=n.cstyle("white", "on_blue"))
+    
+    # Only touch the disk when we're keeping data permanently (n.get_data already caches for this run)
+    if not (SAVE_OHLCV_DATA if persist is None else persist):
+        return df
+        
+    # Save a timestamped copy plus a _latest copy for other agents (typed Parquet - smaller and faster to reload than CSV)
+    data_dir = _ensure_data_directory()
+    timestamp = timestamp or _snapshot_timestamp()
+    filename = data_dir / SNAPSHOT_FILENAME.format(token=token, timestamp=timestamp)
+    latest_filename = data_dir / LATEST_FILENAME.format(token=token)
+    df.to_parquet(filename, engine='pyarrow', compression='snappy', index=False)
+    _link_latest(filename, latest_filename)
+    log.info(f"💾 Moon Dev's AI Agent saved data for {token[:4]}", extra=n.cstyle("white", "on_green"))
+    
+    return df
+
+def collect_token_data(token, days_back=DAYSBACK_4_DATA, timeframe=DATA_TIMEFRAME, timestamp=None, persist=None):
+    """Collect OHLCV data for a single token and save it"""
+    log.info(f"\n🤖 Moon Dev's AI Agent fetching data for {token}...", extra=n.cstyle("white", "on_blue"))
+    
+    try:
+        df = n.get_data(token, days_back, timeframe, cached=_load_cached_data(token))
+        return _save_token_data(token, df, timestamp, persist)
+        
+    except Exception as e:
+        log.error(f"❌ Moon Dev's AI Agent error collecting {token}: {str(e)}", extra=n.cstyle("white", "on_red"))
+        return None
+
+async def _collect_token_data_async(client, semaphore, token, timestamp, persist, days_back=DAYSBACK_4_DATA, timeframe=DATA_TIMEFRAME):
+    """Async collect_token_data - the semaphore caps how many Birdeye requests are in flight"""
+    try:
+        async with semaphore:
+            log.info(f"\n🤖 Moon Dev's AI Agent fetching data for {token}...", extra=n.cstyle("white", "on_blue"))
+            cached = await asyncio.to_thread(_load_cached_data, token)
+            df = await n.get_data_async(client, token, days_back, timeframe, cached)
+        # Parquet write is blocking disk work - keep it off the event loop
+        return await asyncio.to_thread(_save_token_data, token, df, timestamp, persist)
+        
+    except Exception as e:
+        log.error(f"❌ Moon Dev's AI Agent error collecting {token}: {str(e)}", extra=n.cstyle("white", "on_red"))
+        return None
+
+async def collect_all_tokens_async(persist=None):
+    """Collect OHLCV data for every token in tokens_to_trade concurrently"""
+    log.info("\n🔍 Moon Dev's AI Agent starting market data collection...", extra=n.cstyle("white", "on_blue"))
+    
+    timestamp = _snapshot_timestamp()  # One timestamp for the whole batch
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_FETCHES)
+    # Birdeye has no multi-token OHLCV endpoint - HTTP/2 multiplexes every token's request over one TLS connection instead
+    async with httpx.AsyncClient(limits=limits, timeout=30, http2=True) as client:
+        results = await asyncio.gather(*[
+            _collect_token_data_async(client, semaphore, token, timestamp, persist) for token in tokens_to_trade
+        ])
+        
+    market_data = {token: df for token, df in zip(tokens_to_trade, results) if df is not None}
+    
+    log.info("\n✨ Moon Dev's AI Agent completed market data collection!", extra=n.cstyle("white", "on_green"))
+    
+    return market_data
+
+def collect_all_tokens(persist=None):
+    """Collect OHLCV data for every token in tokens_to_trade - persist overrides SAVE_OHLCV_DATA for this call"""
+    return asyncio.run(collect_all_tokens_async(persist))
+
+if __name__ == "__main__":
+    try:
+        collect_all_tokens()
+    except KeyboardInterrupt:
+        print("\n👋 Moon Dev OHLCV Collector shutting down gracefully...")
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        print("🔧 Moon Dev suggests checking the logs and trying again!")
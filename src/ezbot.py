@@ -17,9 +17,76 @@ not done yet
 
 from ..core.config import *
 from ..core.utils import nice_funcs as n 
+import asyncio
+import functools
 import time
-from termcolor import colored, cprint
-import schedule
+from typing import NamedTuple
+
+log = n.queue_logger('ezbot')  # Status lines are written by a background thread, not inside the polling loops
+
+SNAPSHOT_TTL_SECONDS = 1  # Reuse a position/price read this fresh - shorter than any sleep between checks
+
+class Snapshot(NamedTuple):
+    pos: float
+    price: float
+    pos_usd: float
+    size_needed: float
+    chunk_size: str  # Order size in token base units, as market_buy expects
+
+_snapshot_cache = {}
+
+_CHUNK_SCALE = 1_000_000  # USD order size -> base units string that market_buy expects
+
+def lamports(usd):
+    return str(int(usd * _CHUNK_SCALE))
+
+async def get_market_snapshot(symbol):
+    """Fetch position + price once and derive the order sizing from them"""
+    cached = _snapshot_cache.get(symbol)
+    if cached and time.monotonic() - cached[0] < SNAPSHOT_TTL_SECONDS:
+        return cached[1]
+
+    pos, price = await asyncio.to_thread(n.get_position_and_price, symbol)  # Both reads in flight at once
+    pos_usd = pos * price
+    size_needed = usd_size - pos_usd
+    chunk_size = lamports(min(size_needed, max_usd_order_size))
+
+    snapshot = Snapshot(pos, price, pos_usd, size_needed, chunk_size)
+    _snapshot_cache[symbol] = (time.monotonic(), snapshot)
+    return snapshot
+
+ERROR_BACKOFF_START_SECONDS = 3  # First wait after bot() raises, doubled on each failure in a row
+ERROR_BACKOFF_MAX_SECONDS = 60
+
+BUY_RETRY_ATTEMPTS = 2  # One retry after a failed round of chunk buys
+BUY_RETRY_WAIT_SECONDS = 30
+
+def retry(attempts, wait):
+    """Retry an async function up to attempts times, sleeping wait seconds between tries"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            for attempt in range(1, attempts + 1):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception:
+                    if attempt == attempts:
+                        raise
+                    log.info(f'trying again to make the order in {wait} seconds.....', extra=n.cstyle('light_blue', 'on_light_magenta'))
+                    await asyncio.sleep(wait)
+        return wrapper
+    return decorator
+
+@retry(BUY_RETRY_ATTEMPTS, BUY_RETRY_WAIT_SECONDS)
+async def submit_chunk_buys(symbol, chunk_size):
+    """Send orders_per_open chunk buys, let them land, and return a fresh snapshot - retried only if every leg failed"""
+    tx_ids = await asyncio.to_thread(n.market_buy_batch, symbol, chunk_size, slippage, orders_per_open)
+    failed = tx_ids.count(None)
+    if failed:  # Partial fill - re-sending the batch would double the legs that landed, the next chunk tops it up instead
+        log.warning(f'{failed}/{orders_per_open} chunk buys of {symbol[-4:]} failed', extra=n.cstyle('white', 'on_yellow'))
+
+    await asyncio.sleep(tx_sleep)
+    return await get_market_snapshot(symbol)
 
 
 ###### ASKING USER WHAT THEY WANNA DO - WILL REMOVE USER SOON AND REPLACE WITH BOT ######
@@ -29,233 +96,150 @@ action = input('0 to close, 1 to buy, 2 stop loss, 3 breakout, 5 market maker  |
 print('you entered:', action)
 action = int(action)
 
-def bot():
+async def bot():
 
     while action == 0:
-        print('closing position')
+        log.info('closing position')
         # get pos first
-        pos = n.get_position(symbol)
+        pos = await asyncio.to_thread(n.get_position, symbol)
         while pos > 0:
-            n.chunk_kill(symbol, max_usd_order_size, slippage)
-            pos = n.get_position(symbol)
-            time.sleep(1)
+            await asyncio.to_thread(n.chunk_kill, symbol, max_usd_order_size, slippage)
+            pos = await asyncio.to_thread(n.get_position, symbol)
+            await asyncio.sleep(1)
 
         if pos < .9:
-            time.sleep(15)
-            pos = n.get_position(symbol)
+            await asyncio.sleep(15)
+            pos = await asyncio.to_thread(n.get_position, symbol)
             if pos < .9:
-                print('position closed thanks moon dev....')
-                time.sleep(SLEEP_AFTER_CLOSE)
+                log.info('position closed thanks moon dev....')
+                await asyncio.sleep(SLEEP_AFTER_CLOSE)
                 break
 
 
-    print('bot successfully closed position...')
+    log.info('bot successfully closed position...')
 
     while action == 1:
-        print('opening buying position')
-        pos = n.get_position(symbol)
-        price = n.token_price(symbol)
-        pos_usd = pos * price
-        size_needed = usd_size - pos_usd
-        if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-        else: chunk_size = size_needed
-
-        chunk_size = int(chunk_size * 10**6)
-        chunk_size = str(chunk_size)
+        log.info('opening buying position')
+        pos, price, pos_usd, size_needed, chunk_size = await get_market_snapshot(symbol)
 
         if pos_usd > (.97 * usd_size):
-            print('position filled')
-            time.sleep(7867678)
+            log.info('position filled')
+            await asyncio.sleep(7867678)
 
         while pos_usd < (.97 * usd_size):
 
-            print(f'position: {round(pos,2)} price: {round(price,8)} buy_under: {buy_under} pos_usd: ${round(pos_usd,2)}')
+            log.info(f'position: {round(pos,2)} price: {round(price,8)} buy_under: {buy_under} pos_usd: ${round(pos_usd,2)}')
 
             try:
+                pos, price, pos_usd, size_needed, chunk_size = await submit_chunk_buys(symbol, chunk_size)
+            except Exception:
+                log.error(f'Final Error in the buy, restart needed', extra=n.cstyle('white', 'on_red'))
+                await asyncio.sleep(10)
+                break
 
-                for i in range(orders_per_open):
-                    n.market_buy(symbol, chunk_size, slippage)
-                    # cprint green background black text
-                    cprint(f'chunk buy submitted of {symbol[-4:]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-                    time.sleep(1)
-
-                time.sleep(tx_sleep)
-
-                pos = n.get_position(symbol)
-                price = n.token_price(symbol)
-                pos_usd = pos * price
-                size_needed = usd_size - pos_usd
-                if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-                else: chunk_size = size_needed
-                chunk_size = int(chunk_size * 10**6)
-                chunk_size = str(chunk_size)
-
-            except:
-
-                try:
-                    cprint(f'trying again to make the order in 30 seconds.....', 'light_blue', 'on_light_magenta')
-                    time.sleep(30)
-                    for i in range(orders_per_open):
-                        n.market_buy(symbol, chunk_size, slippage)
-                        # cprint green background black text
-                        cprint(f'chunk buy submitted of {symbol[-4:]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-                        time.sleep(1)
-
-                    time.sleep(tx_sleep)
-                    pos = n.get_position(symbol)
-                    price = n.token_price(symbol)
-                    pos_usd = pos * price
-                    size_needed = usd_size - pos_usd
-                    if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-                    else: chunk_size = size_needed
-                    chunk_size = int(chunk_size * 10**6)
-                    chunk_size = str(chunk_size)
-
-
-                except:
-                    cprint(f'Final Error in the buy, restart needed', 'white', 'on_red')
-                    time.sleep(10)
-                    break
-
-            time.sleep(3)
-            pos = n.get_position(symbol)
-            price = n.token_price(symbol)
-            pos_usd = pos * price
-            size_needed = usd_size - pos_usd
-            if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-            else: chunk_size = size_needed
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
+            await asyncio.sleep(3)
+            pos, price, pos_usd, size_needed, chunk_size = await get_market_snapshot(symbol)
 
 
         # cprint white on greeen
-        cprint(f'position filled of {symbol[-4:]} total: ${pos_usd}', 'white', 'on_green')
+        log.info(f'position filled of {symbol[-4:]} total: ${pos_usd}', extra=n.cstyle('white', 'on_green'))
         break
 
     while action == 2:
 
         # get token price
-        pos = n.get_position(symbol)
-        price = n.token_price(symbol)
+        pos, price = await asyncio.to_thread(n.get_position_and_price, symbol)
         pos = float(pos)
 
-        print(f'stop loss: close if price under {STOPLOSS_PRICE} current price is {price}')
+        log.info(f'stop loss: close if price under {STOPLOSS_PRICE} current price is {price}')
 
         if price < STOPLOSS_PRICE and pos > 0:
-            print(f'selling {symbol[-4:]} bc price is {price}  is under {STOPLOSS_PRICE}')
-            n.chunk_kill(symbol, max_usd_order_size, slippage)
-            print(f'chunk kill complete... thank you moon dev you are my savior 777')
-            time.sleep(15)
+            log.info(f'selling {symbol[-4:]} bc price is {price}  is under {STOPLOSS_PRICE}')
+            await asyncio.to_thread(n.chunk_kill, symbol, max_usd_order_size, slippage)
+            log.info(f'chunk kill complete... thank you moon dev you are my savior 777')
+            await asyncio.sleep(15)
 
         else:
-            print(f'price is {price} and pos is {pos}')
-            time.sleep(30)
+            log.info(f'price is {price} and pos is {pos}')
+            await asyncio.sleep(30)
 
     while action == 3:
 
         # get token price
-        pos = n.get_position(symbol)
-        price = n.token_price(symbol)
-        pos_usd = pos * price
-        size_needed = usd_size - pos_usd
-        if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-        else: chunk_size = size_needed
-
-        print(f'breakout action called, buying over {BREAKOUT_PRICE} current price is {price} & pos is ${pos_usd}')
+        pos, price, pos_usd, size_needed, chunk_size = await get_market_snapshot(symbol)
 
-        chunk_size = int(chunk_size * 10**6)
-        chunk_size = str(chunk_size)
+        log.info(f'breakout action called, buying over {BREAKOUT_PRICE} current price is {price} & pos is ${pos_usd}')
 
-        print(f'BREAKOUT_PRICE: {BREAKOUT_PRICE} pos_usd: {pos_usd} usd_size: {usd_size} price: {price}')
+        log.info(f'BREAKOUT_PRICE: {BREAKOUT_PRICE} pos_usd: {pos_usd} usd_size: {usd_size} price: {price}')
         if (price > BREAKOUT_PRICE) and (pos_usd < usd_size):
 
-            time.sleep(1)
+            await asyncio.sleep(1)
             # get token price
-            pos = n.get_position(symbol)
-            price = n.token_price(symbol)
-            pos_usd = pos * price
-            size_needed = usd_size - pos_usd
-            if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-            else: chunk_size = size_needed
-
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
+            pos, price, pos_usd, size_needed, chunk_size = await get_market_snapshot(symbol)
 
             if (pos_usd < usd_size) and (price > BREAKOUT_PRICE):
-                print(f'buying {symbol[-4:]} bc price is {price} and breakoutprice is {BREAKOUT_PRICE}')
-                n.breakout_entry(symbol, BREAKOUT_PRICE)
-                print('breakout entry complete, thanks moon dev...')
-                time.sleep(15)
+                log.info(f'buying {symbol[-4:]} bc price is {price} and breakoutprice is {BREAKOUT_PRICE}')
+                await asyncio.to_thread(n.breakout_entry, symbol, BREAKOUT_PRICE)
+                log.info('breakout entry complete, thanks moon dev...')
+                await asyncio.sleep(15)
 
         else:
-            print(f'price is {price} and not buying or selling position is {pos_usd} and usd size is {usd_size}')
-            time.sleep(30)
+            log.info(f'price is {price} and not buying or selling position is {pos_usd} and usd size is {usd_size}')
+            await asyncio.sleep(30)
 
 
     while action == 5:
-        print(f'market maker buying below {buy_under} and selling above {sell_over}')
+        log.info(f'market maker buying below {buy_under} and selling above {sell_over}')
 
         # get token price
-        pos = n.get_position(symbol)
-        price = n.token_price(symbol)
-        pos_usd = pos * price
-        size_needed = usd_size - pos_usd
-        if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-        else: chunk_size = size_needed
-
-        chunk_size = int(chunk_size * 10**6)
-        chunk_size = str(chunk_size)
+        pos, price, pos_usd, size_needed, chunk_size = await get_market_snapshot(symbol)
 
         if price > sell_over:
-            print(f'selling {symbol[-4:]} bc price is {price} and sell over is {sell_over}')
-            n.chunk_kill(symbol, max_usd_order_size, slippage)
-            print(f'chunk kill complete... thank you moon dev you are my savior 777')
-            time.sleep(15)
+            log.info(f'selling {symbol[-4:]} bc price is {price} and sell over is {sell_over}')
+            await asyncio.to_thread(n.chunk_kill, symbol, max_usd_order_size, slippage)
+            log.info(f'chunk kill complete... thank you moon dev you are my savior 777')
+            await asyncio.sleep(15)
 
 
         elif (price < buy_under) and (pos_usd < usd_size):
 
-            time.sleep(10)
+            await asyncio.sleep(10)
 
             # get token price
-            pos = n.get_position(symbol)
-            price = n.token_price(symbol)
-            pos_usd = pos * price
-            size_needed = usd_size - pos_usd
-            if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-            else: chunk_size = size_needed
-
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
+            pos, price, pos_usd, size_needed, chunk_size = await get_market_snapshot(symbol)
 
             if (pos_usd < usd_size) and (price < buy_under):
-                print(f'buying {symbol[-4:]} bc price is {price} and buy under is {buy_under}')
-                n.elegant_entry(symbol, buy_under)
-                print('elegant entry complete...')
-                time.sleep(15)
+                log.info(f'buying {symbol[-4:]} bc price is {price} and buy under is {buy_under}')
+                await asyncio.to_thread(n.elegant_entry, symbol, buy_under)
+                log.info('elegant entry complete...')
+                await asyncio.sleep(15)
 
         else:
-            print(f'price is {price} and not buying or selling position is {pos_usd} and usd size is {usd_size}')
-            time.sleep(30)
+            log.info(f'price is {price} and not buying or selling position is {pos_usd} and usd size is {usd_size}')
+            await asyncio.sleep(30)
 
-    while action == 6:
-        print('funding buy')
+    # 6 and 7 aren't built yet - say so once instead of spinning on the log line
+    if action == 6:
+        log.info('funding buy - not done yet')
 
-    while action == 7:
-        print('liquidation amount')
+    elif action == 7:
+        log.info('liquidation amount - not done yet')
 
     else:
-        print('COMPLETE THANKS MOON DEV!')
-
-
-bot()
-
-schedule.every(30).seconds.do(bot)
-
-while True:
-    try:
-        schedule.run_pending()
-        time.sleep(3)
-    except:
-        print('*** error, sleeping')
-        time.sleep(15)
+        log.info('COMPLETE THANKS MOON DEV!')
+
+
+async def scheduler():
+    """Run bot() every 30s - on errors log the traceback and back off exponentially up to 60s"""
+    backoff = ERROR_BACKOFF_START_SECONDS
+    while True:
+        try:
+            await bot()
+            backoff = ERROR_BACKOFF_START_SECONDS
+            await asyncio.sleep(30)
+        except Exception:
+            log.exception(f'*** error, sleeping {backoff}s')
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, ERROR_BACKOFF_MAX_SECONDS)
+
+asyncio.run(scheduler())
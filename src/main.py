@@ -7,7 +7,10 @@ import os
 import sys
 from termcolor import cprint
 from dotenv import load_dotenv
+import asyncio
 import time
+import signal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from config import *
 
@@ -15,13 +18,6 @@ from config import *
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
-# Import agents
-from src.agents.trading_agent import TradingAgent
-from src.agents.risk_agent import RiskAgent
-from src.agents.strategy_agent import StrategyAgent
-from src.agents.copybot_agent import CopyBotAgent
-from src.agents.sentiment_agent import SentimentAgent
-
 # Load environment variables
 load_dotenv()
 
@@ -37,55 +33,137 @@ ACTIVE_AGENTS = {
     # 'portfolio': False,  # Future portfolio optimization agent
 }
 
-def run_agents():
-    """Run all active agents in sequence"""
+# Startup banner rows, built once from ACTIVE_AGENTS
+_BANNER = tuple((agent.title(), "✅ ON" if active else "❌ OFF") for agent, active in ACTIVE_AGENTS.items())
+
+LIMIT_TYPE = "percentage" if USE_PERCENTAGE else "USD"  # Fixed for the life of the process
+SLEEP_SECONDS = SLEEP_BETWEEN_RUNS_MINUTES * 60
+SLEEP_INTERVAL = timedelta(seconds=SLEEP_SECONDS)
+
+# get_signals is network bound (Birdeye + Claude) and StrategyAgent holds an API client that can't be pickled,
+# so per-token work gets its own thread pool rather than processes or the default pool the other agents share
+MAX_STRATEGY_WORKERS = 8
+STRATEGY_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_STRATEGY_WORKERS, thread_name_prefix='strategy')
+
+async def run_strategy_agent(strategy_agent):
+    """Get strategy signals for every monitored token concurrently"""
+    tokens = [token for token in MONITORED_TOKENS if token not in EXCLUDED_TOKENS]  # Skip USDC and other excluded tokens
+    for token in tokens:
+        cprint(f"\n🔍 Analyzing {token}...", "cyan")
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(*[loop.run_in_executor(STRATEGY_EXECUTOR, strategy_agent.get_signals, token) for token in tokens])
+
+def in_thread(run):
+    """Wrap a blocking agent method so it runs in a worker thread instead of on the event loop"""
+    return lambda: asyncio.to_thread(run)
+
+def create_agent(name):
+    """Import and construct one agent, warming its caches so the first cycle doesn't start cold"""
+    # Agent modules are imported only when enabled - each pulls in its own SDKs (anthropic, solana, twikit...)
+    if name == 'risk':
+        from src.agents.risk_agent import RiskAgent
+        agent = RiskAgent()
+        agent.warm_cache()
+        return agent
+    if name == 'trading':
+        from src.agents.trading_agent import TradingAgent
+        return TradingAgent()
+    if name == 'strategy':
+        from src.agents.strategy_agent import StrategyAgent
+        return StrategyAgent()
+    if name == 'copybot':
+        from src.agents.copybot_agent import CopyBotAgent
+        return CopyBotAgent()
+    if name == 'sentiment':
+        from src.agents.sentiment_agent import SentimentAgent
+        return SentimentAgent()
+    raise ValueError(f"Unknown agent: {name}")
+
+async def build_agents():
+    """Create the active agents and map each name to (status message, async run function[, async prefetch])"""
+    # Constructors price the portfolio and open API clients - do them side by side instead of one after another
+    names = [name for name, active in ACTIVE_AGENTS.items() if active]
+    created = dict(zip(names, await asyncio.gather(*(asyncio.to_thread(create_agent, name) for name in names))))
+
+    agents = {}
+    if 'risk' in created:
+        agents['risk'] = ("🛡️ Running Risk Management...", in_thread(created['risk'].run))
+    if 'trading' in created:
+        trading_agent = created['trading']
+        agents['trading'] = ("🤖 Running Trading Analysis...", in_thread(trading_agent.run), in_thread(trading_agent.prefetch_market_data))
+    if 'strategy' in created:
+        strategy_agent = created['strategy']
+        agents['strategy'] = ("📊 Running Strategy Analysis...", lambda: run_strategy_agent(strategy_agent))
+    if 'copybot' in created:
+        agents['copybot'] = ("🤖 Running CopyBot Portfolio Analysis...", in_thread(created['copybot'].run_analysis_cycle))
+    if 'sentiment' in created:
+        agents['sentiment'] = ("🎭 Running Sentiment Analysis...", in_thread(created['sentiment'].run))
+    return agents
+
+async def run_agent(message, run):
+    cprint(f"\n{message}", "cyan")
+    return await run()
+
+async def run_on_interval(name, message, run, prefetch=None, gate=None, on_result=None):
+    """Run one agent every SLEEP_SECONDS, waiting for gate (if given) before each pass"""
+    while True:
+        try:
+            # Start the agent's data fetch now so it overlaps with the risk check instead of following it
+            prefetching = asyncio.create_task(prefetch()) if prefetch else None
+
+            if gate is not None and not gate.is_set():
+                cprint(f"\n⏸️ {name.title()} waiting for Risk Management to clear trading...", "yellow")
+                await gate.wait()
+            if prefetching:
+                await prefetching
+
+            result = await run_agent(message, run)
+            if on_result:
+                on_result(result)
+
+            # Sleep until next cycle - scheduled on the monotonic clock, wall clock is only for the log line
+            deadline = time.monotonic() + SLEEP_SECONDS
+            next_run = datetime.now() + SLEEP_INTERVAL
+            cprint(f"\n😴 {name.title()} sleeping until {next_run.strftime('%H:%M:%S')}", "cyan")
+            await asyncio.sleep(max(0, deadline - time.monotonic()))
+
+        except Exception as e:
+            cprint(f"\n❌ Error running {name} agent: {str(e)}", "red")
+            cprint("🔄 Continuing to next cycle...", "yellow")
+            await asyncio.sleep(60)  # Sleep for 1 minute on error before retrying
+
+async def run_agents():
+    """Run every active agent on its own interval - the others pause while a risk limit is breached"""
     try:
-        # Initialize active agents
-        trading_agent = TradingAgent() if ACTIVE_AGENTS['trading'] else None
-        risk_agent = RiskAgent() if ACTIVE_AGENTS['risk'] else None
-        strategy_agent = StrategyAgent() if ACTIVE_AGENTS['strategy'] else None
-        copybot_agent = CopyBotAgent() if ACTIVE_AGENTS['copybot'] else None
-        sentiment_agent = SentimentAgent() if ACTIVE_AGENTS['sentiment'] else None
-
-        while True:
-            try:
-                # Run Risk Management
-                if risk_agent:
-                    cprint("\n🛡️ Running Risk Management...", "cyan")
-                    risk_agent.run()
-
-                # Run Trading Analysis
-                if trading_agent:
-                    cprint("\n🤖 Running Trading Analysis...", "cyan")
-                    trading_agent.run()
-
-                # Run Strategy Analysis
-                if strategy_agent:
-                    cprint("\n📊 Running Strategy Analysis...", "cyan")
-                    for token in MONITORED_TOKENS:
-                        if token not in EXCLUDED_TOKENS:  # Skip USDC and other excluded tokens
-                            cprint(f"\n🔍 Analyzing {token}...", "cyan")
-                            strategy_agent.get_signals(token)
-
-                # Run CopyBot Analysis
-                if copybot_agent:
-                    cprint("\n🤖 Running CopyBot Portfolio Analysis...", "cyan")
-                    copybot_agent.run_analysis_cycle()
-
-                # Run Sentiment Analysis
-                if sentiment_agent:
-                    cprint("\n🎭 Running Sentiment Analysis...", "cyan")
-                    sentiment_agent.run()
-
-                # Sleep until next cycle
-                next_run = datetime.now() + timedelta(minutes=SLEEP_BETWEEN_RUNS_MINUTES)
-                cprint(f"\n😴 Sleeping until {next_run.strftime('%H:%M:%S')}", "cyan")
-                time.sleep(60 * SLEEP_BETWEEN_RUNS_MINUTES)
-
-            except Exception as e:
-                cprint(f"\n❌ Error running agents: {str(e)}", "red")
-                cprint("🔄 Continuing to next cycle...", "yellow")
-                time.sleep(60)  # Sleep for 1 minute on error before retrying
+        agents = await build_agents()
+        risk = agents.pop('risk', None)
+
+        # Set while risk limits are OK - RiskAgent.run() returns True when a limit is breached
+        trading_allowed = asyncio.Event()
+        tasks = []
+        if risk:
+            def update_gate(breached):
+                if breached:
+                    if trading_allowed.is_set():
+                        cprint(f"\n⚠️ Risk limit hit ({LIMIT_TYPE}-based) - pausing the other agents until it clears", "red")
+                    trading_allowed.clear()
+                else:
+                    trading_allowed.set()
+            tasks.append(asyncio.create_task(run_on_interval('risk', *risk, on_result=update_gate)))
+        else:
+            trading_allowed.set()
+
+        # The remaining agents are independent and I/O bound, so each gets its own task
+        for name, agent in agents.items():
+            tasks.append(asyncio.create_task(run_on_interval(name, *agent, gate=trading_allowed)))
+
+        # SIGTERM (e.g. docker stop) cancels every agent task, so nobody sits out the rest of a sleep
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, lambda: [task.cancel() for task in tasks])
+        except NotImplementedError:
+            pass  # Windows event loops have no signal handlers - Ctrl+C still cancels
+
+        await asyncio.gather(*tasks)
 
     except KeyboardInterrupt:
         cprint("\n👋 Gracefully shutting down...", "yellow")
@@ -94,11 +172,10 @@ def run_agents():
         raise
 
 if __name__ == "__main__":
-    cprint("\n🌙 Moon Dev AI Agent Trading System Starting...", "white", "on_blue")
-    cprint("\n📊 Active Agents:", "white", "on_blue")
-    for agent, active in ACTIVE_AGENTS.items():
-        status = "✅ ON" if active else "❌ OFF"
-        cprint(f"  • {agent.title()}: {status}", "white", "on_blue")
-    print("\n")
-
-    run_agents()
\ No newline at end of file
+    banner = "\n".join(f"  • {agent}: {status}" for agent, status in _BANNER)
+    cprint(f"\n🌙 Moon Dev AI Agent Trading System Starting...\n\n📊 Active Agents:\n{banner}\n\n", "white", "on_blue")
+
+    try:
+        asyncio.run(run_agents())
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        cprint("\n👋 Gracefully shutting down...", "yellow")  # Ctrl+C / SIGTERM surface here once the agent tasks are cancelled
\ No newline at end of file
@@ -5,22 +5,39 @@ Built with love by Moon Dev 🚀
 
 from src.config import *
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
+import ijson
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pprint
 import re as reggie
 import sys
 import os
 import time
+import random
 import json
+from urllib.parse import urlsplit
+import orjson
+import base64
+import functools
+import backoff
 import numpy as np
 import datetime
-import pandas_ta as ta
 from datetime import datetime, timedelta
 from termcolor import colored, cprint
 import solders
+from solders.keypair import Keypair
+from solders.transaction import VersionedTransaction
 from dotenv import load_dotenv
-import shutil
 import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Load environment variables
 load_dotenv()
@@ -34,28 +51,230 @@ sample_address = "2yXTyarttn2pTZ6cwt4DqmrRuBw1G7pmFv9oT6MStdKP"
 
 BASE_URL = "https://public-api.birdeye.so/defi"
 
-# Create temp directory and register cleanup
+# One pooled keep-alive session for every Birdeye/Jupiter/RPC call, so polling loops reuse TLS connections.
+# Retries only cover idempotent requests (urllib3's default allowed_methods leave out POST), so swaps are never sent twice.
+HTTP_SESSION = requests.Session()
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False),  # Callers still see the final status code
+)
+HTTP_SESSION.mount('https://', _HTTP_ADAPTER)
+HTTP_SESSION.mount('http://', _HTTP_ADAPTER)
+HTTP_SESSION.headers['Accept-Encoding'] = 'gzip, deflate'  # Pinned explicitly - OHLCV/holdings/RPC JSON shrinks 75%+ on the wire
+
+# Small shared pool for independent blocking lookups (balance + price) in the close loops
+_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='nice_funcs')
+
+MAX_CLOSE_WORKERS = 8  # Positions closed at once by close_all_positions
+MAX_CONCURRENT_SWAPS = 3  # Jupiter quote/swap round-trips in flight at once - keeps parallel closes under its rate limit
+_SWAP_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_SWAPS)
+_DONT_OVERTRADE_LOCK = threading.Lock()  # Parallel closes append to dont_overtrade.txt
+
+# Birdeye candle sizes in seconds - a temp cache older than one candle is stale
+TIMEFRAME_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1H': 3600, '2H': 7200, '4H': 14400, '6H': 21600, '8H': 28800, '12H': 43200,
+    '1D': 86400, '3D': 259200, '1W': 604800, '1M': 2592000,
+}
+
+TEMP_DATA_MAX_AGE = 5 * TIMEFRAME_SECONDS.get(DATA_TIMEFRAME, 3600)  # Seconds - temp files untouched this long are evicted at startup
+
+# Create temp directory and evict stale files - kept across restarts so a quick restart doesn't re-download everything
 os.makedirs('temp_data', exist_ok=True)
 
-def cleanup_temp_data():
-    if os.path.exists('temp_data'):
-        print("🧹 Moon Dev cleaning up temporary data...")
-        shutil.rmtree('temp_data')
+def cleanup_temp_data(max_age=TEMP_DATA_MAX_AGE):
+    """Remove temp_data files older than max_age seconds, leaving fresh caches in place"""
+    now = time.time()
+    removed = 0
+    for entry in os.scandir('temp_data'):
+        try:
+            if entry.is_file() and now - entry.stat().st_mtime > max_age:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass  # Another process got there first
+    if removed:
+        print(f"🧹 Moon Dev evicted {removed} stale temp files")
+
+cleanup_temp_data()  # At startup rather than atexit, so a crash never costs us the cache
+
+class CprintFormatter(logging.Formatter):
+    """Keeps termcolor styling for log records that carry color/on_color (see cstyle)"""
+    def format(self, record):
+        msg = super().format(record)
+        color = getattr(record, 'color', None)
+        return colored(msg, color, getattr(record, 'on_color', None)) if color else msg
+
+def cstyle(color, on_color=None):
+    """extra= for a log call that should look like cprint(msg, color, on_color)"""
+    return {'color': color, 'on_color': on_color}
+
+LOG_QUEUE_MAX = 10_000  # Records waiting for the writer thread - past this, new ones are dropped rather than piling up in memory
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler for a bounded queue - a full queue drops the record instead of blocking or raising"""
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
 
-atexit.register(cleanup_temp_data)
+def _stop_listener(listener):
+    try:
+        listener.stop()
+    except queue.Full:
+        pass  # No room for the stop sentinel - the writer is a daemon thread, so exit anyway
+
+def queue_logger(name, level=logging.INFO):
+    """Logger whose records are written to stdout by a background thread, so hot loops never block on print"""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        records = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(CprintFormatter('%(message)s'))
+        listener = QueueListener(records, handler)
+        listener.start()
+        atexit.register(_stop_listener, listener)  # Drain anything still queued on exit
+        logger.addHandler(_DroppingQueueHandler(records))
+        logger.setLevel(level)
+        logger.propagate = False
+    return logger
+
+class RateLimitFilter(logging.Filter):
+    """Drops repeats of the same message from the same call site within interval seconds - warnings and errors always pass"""
+    def __init__(self, interval=1.0):
+        super().__init__()
+        self.interval = interval
+        self.last = {}
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+        key = (record.pathname, record.lineno, record.getMessage())
+        now = time.monotonic()
+        if now - self.last.get(key, float('-inf')) < self.interval:
+            return False
+        if len(self.last) > 1024:  # Distinct messages pile up - forget the ones whose window has passed
+            self.last = {k: t for k, t in self.last.items() if now - t < self.interval}
+        self.last[key] = now
+        return True
+
+# Close/kill loops log through here - off the calling thread, and each distinct line at most once per second
+close_log = queue_logger('moondev.close', level=os.getenv('LOG_LEVEL', 'INFO').upper())
+close_log.addFilter(RateLimitFilter(1.0))
+
+class _TTL:
+    """Tiny per-key time-to-live cache - entries quietly expire after ttl seconds"""
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.d = {}
+
+    def get(self, key):
+        hit = self.d.get(key)
+        if hit is not None and time.monotonic() - hit[0] < self.ttl:
+            return hit[1]
+        return None
+
+    def set(self, key, value):
+        self.d[key] = (time.monotonic(), value)
+
+    def pop(self, key):
+        self.d.pop(key, None)
+
+    def clear(self):
+        self.d.clear()
+
+_PRICE_CACHE = _TTL(15)  # Seconds - prices move, but poll loops hit the same mint many times a minute
+_OVERVIEW_CACHE = _TTL(60)  # Seconds - overview stats (trades, liquidity, links) change slowly
+_WALLET_CACHE = _TTL(10)  # Seconds - per-token balance reads in one close/risk pass share a single wallet fetch
+_BALANCE_CACHE = _TTL(10)  # Seconds - {mint: USD value} view of the wallet snapshot, so balance lookups skip pandas
+
+# Birdeye token metadata survives restarts on disk (kept next to the OHLCV data, away from temp_data eviction)
+BIRDEYE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'birdeye_cache')
+OVERVIEW_DISK_TTL = 600  # Seconds - 1h trade counts and price changes go stale quickly
+SECURITY_DISK_TTL = 3600  # Seconds - holder concentration and authorities rarely move within the hour
+CREATION_DISK_TTL = None  # Creation info is immutable - keep forever
+DEAD_TOKEN_LIQUIDITY_USD = 1000  # No trades in the last hour and less liquidity than this = dead token, skip the deep parse
+
+def _birdeye_cache_path(endpoint, address):
+    return os.path.join(BIRDEYE_CACHE_DIR, f"{endpoint}_{address}.json")
+
+def _disk_cached(endpoint, ttl, memory=None):
+    """Cache a Birdeye lookup per (endpoint, address) as JSON on disk, optionally fronted by an in-memory _TTL"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(address):
+            if memory is not None:
+                hit = memory.get(address)
+                if hit is not None:
+                    return hit
+
+            path = _birdeye_cache_path(endpoint, address)
+            try:
+                with open(path) as f:
+                    entry = json.load(f)
+                if ttl is None or time.time() - entry['saved'] < ttl:
+                    if memory is not None:
+                        memory.set(address, entry['data'])
+                    return entry['data']
+            except (OSError, ValueError, KeyError):
+                pass  # Missing or unreadable cache file - just fetch
+
+            data = func(address)
+            if data is not None:
+                if memory is not None:
+                    memory.set(address, data)
+                try:
+                    os.makedirs(BIRDEYE_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                    with open(tmp_path, 'w') as f:
+                        json.dump({'saved': time.time(), 'data': data}, f)
+                    os.replace(tmp_path, path)  # Atomic swap so a parallel reader never sees half a file
+                except OSError as e:
+                    print(f"⚠️ Moon Dev couldn't cache {endpoint} for {address[:4]}: {str(e)}")
+            return data
+        return wrapper
+    return decorator
+
+def invalidate(mint):
+    """Drop cached price/overview for a mint and the wallet snapshot so the next read after a trade is fresh"""
+    _PRICE_CACHE.pop(mint)
+    _OVERVIEW_CACHE.pop(mint)
+    _WALLET_CACHE.clear()
+    _BALANCE_CACHE.clear()
+    try:
+        os.remove(_birdeye_cache_path('token_overview', mint))
+    except OSError:
+        pass
 
 # Custom function to print JSON in a human-readable format
 def print_pretty_json(data):
     pp = pprint.PrettyPrinter(indent=4)
     pp.pprint(data)
 
+# URL helpers for token descriptions - compiled once at import instead of on every overview
+_URL_RE = reggie.compile(r'https?://[^\s]+')
+_LINK_TYPES = {'t.me': 'telegram', 'telegram.me': 'telegram', 'twitter.com': 'twitter', 'x.com': 'twitter'}
+
 # Function to print JSON in a human-readable format - assuming you already have it as print_pretty_json
 # Helper function to find URLs in text
 def find_urls(string):
-    # Regex to extract URLs
-    return reggie.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', string)
+    return _URL_RE.findall(string)
+
+def classify_url(url):
+    """telegram / twitter / website for a description link - None for youtube links, which we skip"""
+    try:
+        host = urlsplit(url).hostname or ''  # Already lower-cased, port stripped
+    except ValueError:  # Malformed link text, e.g. an unclosed [IPv6 bracket
+        return 'website'
+    host = host.removeprefix('www.')
+    if 'youtube' in host:
+        return None
+    return _LINK_TYPES.get(host, 'website')
 
 # UPDATED TO RMEOVE THE OTHER ONE so now we can just use this filter instead of filtering twice
+@_disk_cached('token_overview', OVERVIEW_DISK_TTL, memory=_OVERVIEW_CACHE)
 def token_overview(address):
     """
     Fetch token overview for a given address and return structured information, including specific links,
@@ -66,11 +285,11 @@ def token_overview(address):
     overview_url = f"{BASE_URL}/token_overview?address={address}"
     headers = {"X-API-KEY": BIRDEYE_API_KEY}
 
-    response = requests.get(overview_url, headers=headers)
+    response = HTTP_SESSION.get(overview_url, headers=headers)
     result = {}
 
     if response.status_code == 200:
-        overview_data = response.json().get('data', {})
+        overview_data = orjson.loads(response.content).get('data', {})
 
         # Retrieve buy1h, sell1h, and calculate trade1h
         buy1h = overview_data.get('buy1h', 0)
@@ -92,12 +311,27 @@ def token_overview(address):
         # Check if trade1h is bigger than MIN_TRADES_LAST_HOUR
         result['minimum_trades_met'] = True if trade1h >= MIN_TRADES_LAST_HOUR else False
 
+        # Dead token - same keys, but skip the price-change walk and description parsing entirely
+        liquidity = overview_data.get('liquidity', 0) or 0
+        if trade1h == 0 and liquidity < DEAD_TOKEN_LIQUIDITY_USD:
+            result.update({
+                'priceChangesXhrs': {},
+                'rug_pull': False,
+                'uniqueWallet2hr': overview_data.get('uniqueWallet24h', 0),
+                'v24USD': overview_data.get('v24hUSD', 0),
+                'watch': overview_data.get('watch', 0),
+                'view24h': overview_data.get('view24h', 0),
+                'liquidity': liquidity,
+                'description': [],
+            })
+            return result
+
         # Extract price changes over different timeframes
         price_changes = {k: v for k, v in overview_data.items() if 'priceChange' in k}
         result['priceChangesXhrs'] = price_changes
 
-        # Check for rug pull indicator
-        rug_pull = any(value < -80 for key, value in price_changes.items() if value is not None)
+        # Check for rug pull indicator (any() stops at the first crash it finds)
+        rug_pull = any(value is not None and value < -80 for value in price_changes.values())
         result['rug_pull'] = rug_pull
         if rug_pull:
             print("Warning: Price change percentage below -80%, potential rug pull")
@@ -107,7 +341,6 @@ def token_overview(address):
         v24USD = overview_data.get('v24hUSD', 0)
         watch = overview_data.get('watch', 0)
         view24h = overview_data.get('view24h', 0)
-        liquidity = overview_data.get('liquidity', 0)
 
         # Add the retrieved data to result
         result.update({
@@ -121,20 +354,16 @@ def token_overview(address):
         # Extract and process description links if extensions are not None
         extensions = overview_data.get('extensions', {})
         description = extensions.get('description', '') if extensions else ''
-        urls = find_urls(description)
         links = []
-        for url in urls:
-            if 't.me' in url:
-                links.append({'telegram': url})
-            elif 'twitter.com' in url:
-                links.append({'twitter': url})
-            elif 'youtube' not in url:  # Assume other URLs are for website
-                links.append({'website': url})
+        if description:
+            for url in find_urls(description):
+                link_type = classify_url(url)
+                if link_type:
+                    links.append({link_type: url})
 
         # Add extracted links to result
         result['description'] = links
 
-
         # Return result dictionary with all the data
         return result
     else:
@@ -142,6 +371,7 @@ def token_overview(address):
         return None
 
 
+@_disk_cached('token_security', SECURITY_DISK_TTL)
 def token_security_info(address):
 
     '''
@@ -187,15 +417,18 @@ def token_security_info(address):
     headers = {"X-API-KEY": BIRDEYE_API_KEY}
 
     # Sending a GET request to the API
-    response = requests.get(url, headers=headers)
+    response = HTTP_SESSION.get(url, headers=headers)
 
     if response.status_code == 200:
         # Parse the JSON response
-        security_data = response.json()['data']
+        security_data = orjson.loads(response.content)['data']
         print_pretty_json(security_data)
+        return security_data
     else:
         print("Failed to retrieve token security info:", response.status_code)
+        return None
 
+@_disk_cached('token_creation_info', CREATION_DISK_TTL)
 def token_creation_info(address):
 
     '''
@@ -213,100 +446,79 @@ def token_creation_info(address):
     headers = {"X-API-KEY": BIRDEYE_API_KEY}
 
     # Sending a GET request to the API
-    response = requests.get(url, headers=headers)
+    response = HTTP_SESSION.get(url, headers=headers)
 
     if response.status_code == 200:
         # Parse the JSON response
-        creation_data = response.json()['data']
+        creation_data = orjson.loads(response.content)['data']
         print_pretty_json(creation_data)
+        return creation_data
     else:
         print("Failed to retrieve token creation info:", response.status_code)
+        return None
 
-def market_buy(token, amount, slippage):
-    import requests
-    import sys
-    import json
-    import base64
-    from solders.keypair import Keypair
-    from solders.transaction import VersionedTransaction
+@functools.cache
+def _solana_wallet():
+    """Keypair + RPC client, built on the first trade and reused after (one decode, one keep-alive connection)"""
     from solana.rpc.api import Client
-    from solana.rpc.types import TxOpts
 
-    KEY = Keypair.from_base58_string(os.getenv("SOLANA_PRIVATE_KEY"))
-    if not KEY:
+    private_key = os.getenv("SOLANA_PRIVATE_KEY")
+    if not private_key:
         raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
-    #print('key success')
-    SLIPPAGE = slippage # 5000 is 50%, 500 is 5% and 50 is .5%
-
-    QUOTE_TOKEN = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v" # usdc
-
-    http_client = Client(os.getenv("RPC_ENDPOINT"))
-    #print('http client success')
-    if not http_client:
+    rpc_endpoint = os.getenv("RPC_ENDPOINT")
+    if not rpc_endpoint:
         raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
+    return Keypair.from_base58_string(private_key), Client(rpc_endpoint)
+
+def _swap(input_mint, output_mint, amount, slippage):
+    """Jupiter quote -> swap -> sign -> send, returns the tx id. slippage: 5000 is 50%, 500 is 5% and 50 is .5%"""
+    from solana.rpc.types import TxOpts
 
-    quote = requests.get(f'https://quote-api.jup.ag/v6/quote?inputMint={QUOTE_TOKEN}&outputMint={token}&amount={amount}&slippageBps={SLIPPAGE}').json()
-    #print(quote)
-
-    txRes = requests.post('https://quote-api.jup.ag/v6/swap',
-                          headers={"Content-Type": "application/json"},
-                          data=json.dumps({
-                              "quoteResponse": quote,
-                              "userPublicKey": str(KEY.pubkey()),
-                              "prioritizationFeeLamports": PRIORITY_FEE  # or replace 'auto' with your specific lamport value
-                          })).json()
-    #print(txRes)
+    KEY, http_client = _solana_wallet()
+
+    with _SWAP_SLOTS:
+        quote = orjson.loads(HTTP_SESSION.get(f'https://quote-api.jup.ag/v6/quote?inputMint={input_mint}&outputMint={output_mint}&amount={amount}&slippageBps={slippage}').content)
+        txRes = orjson.loads(HTTP_SESSION.post('https://quote-api.jup.ag/v6/swap',
+                              headers={"Content-Type": "application/json"},
+                              data=orjson.dumps({  # bytes - goes on the wire as-is
+                                  "quoteResponse": quote,
+                                  "userPublicKey": str(KEY.pubkey()),
+                                  "prioritizationFeeLamports": PRIORITY_FEE  # or replace 'auto' with your specific lamport value
+                              })).content)
     swapTx = base64.b64decode(txRes['swapTransaction'])
-    #print(swapTx)
     tx1 = VersionedTransaction.from_bytes(swapTx)
     tx = VersionedTransaction(tx1.message, [KEY])
     txId = http_client.send_raw_transaction(bytes(tx), TxOpts(skip_preflight=True)).value
     print(f"https://solscan.io/tx/{str(txId)}")
+    return txId
 
+def market_buy(token, amount, slippage):
+    txId = _swap(USDC_ADDRESS, token, amount, slippage)
+    invalidate(token)  # Holdings just changed - next balance read must hit the API
+    return txId
+
+def market_buy_batch(token, amount, slippage, count):
+    """Submit count identical market_buys one after another, returns their tx ids (None = failed leg) - raises only if every leg failed.
+    Legs stay sequential: they all spend the same wallet's USDC, so sending them at once would race on its swaps."""
+    tx_ids, errors = [], []
+    for i in range(count):
+        try:
+            tx_ids.append(market_buy(token, amount, slippage))
+            cprint(f'chunk buy {i+1}/{count} submitted of {token[:4]} sz: {amount} you my dawg moon dev', 'white', 'on_blue')
+        except Exception as e:
+            tx_ids.append(None)
+            errors.append(e)
+            cprint(f'❌ chunk buy {i+1}/{count} of {token[:4]} failed: {str(e)}', 'white', 'on_red')
 
+    if errors and len(errors) == count:
+        raise errors[0]  # Nothing went through - let the caller's retry path take over
+    return tx_ids
 
 def market_sell(QUOTE_TOKEN, amount, slippage):
-    import requests
-    import sys
-    import json
-    import base64
-    from solders.keypair import Keypair
-    from solders.transaction import VersionedTransaction
-    from solana.rpc.api import Client
-    from solana.rpc.types import TxOpts
-
-    KEY = Keypair.from_base58_string(os.getenv("SOLANA_PRIVATE_KEY"))
-    if not KEY:
-        raise ValueError("🚨 SOLANA_PRIVATE_KEY not found in environment variables!")
-    #print('key success')
-    SLIPPAGE = slippage  # 5000 is 50%, 500 is 5% and 50 is .5%
-
-    # token would be usdc for sell orders cause we are selling
-    token = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"  # USDC
-
-    http_client = Client(os.getenv("RPC_ENDPOINT"))
-    if not http_client:
-        raise ValueError("🚨 RPC_ENDPOINT not found in environment variables!")
-    print('http client success')
-
-    quote = requests.get(f'https://quote-api.jup.ag/v6/quote?inputMint={QUOTE_TOKEN}&outputMint={token}&amount={amount}&slippageBps={SLIPPAGE}').json()
-    #print(quote)
-    txRes = requests.post('https://quote-api.jup.ag/v6/swap',
-                          headers={"Content-Type": "application/json"},
-                          data=json.dumps({
-                              "quoteResponse": quote,
-                              "userPublicKey": str(KEY.pubkey()),
-                              "prioritizationFeeLamports": PRIORITY_FEE
-                          })).json()
-    #print(txRes)
-    swapTx = base64.b64decode(txRes['swapTransaction'])
-    #print(swapTx)
-    tx1 = VersionedTransaction.from_bytes(swapTx)
-    #print(tx1)
-    tx = VersionedTransaction(tx1.message, [KEY])
-    #print(tx)
-    txId = http_client.send_raw_transaction(bytes(tx), TxOpts(skip_preflight=True)).value
-    print(f"https://solscan.io/tx/{str(txId)}")
+    # output would be usdc for sell orders cause we are selling
+    txId = _swap(QUOTE_TOKEN, USDC_ADDRESS, amount, slippage)
+    invalidate(QUOTE_TOKEN)  # Position just changed - don't act on a pre-trade price
+    return txId
 
 
 
@@ -336,73 +548,187 @@ def get_time_range(days_back):
 
     return time_from, time_to
 
-def get_data(address, days_back_4_data, timeframe):
-    time_from, time_to = get_time_range(days_back_4_data)
+OHLCV_COLUMNS = ['Datetime (UTC)', 'Open', 'High', 'Low', 'Close', 'Volume']
 
-    # Check temp data first
-    temp_file = f"temp_data/{address}_latest.csv"
-    if os.path.exists(temp_file):
-        print(f"📂 Moon Dev found cached data for {address[:4]}")
-        return pd.read_csv(temp_file)
+def _temp_cache_path(address, timeframe, days_back_4_data):
+    """Temp frame path - keyed by timeframe and window too, so callers asking for different candles never share a frame"""
+    return f"temp_data/{address}_{timeframe}_{days_back_4_data:g}d_latest.parquet"
 
+def _fresh_temp_file(address, timeframe, days_back_4_data):
+    """Path of this run's cached frame for this request, or None if there is none or it's older than one candle"""
+    temp_file = _temp_cache_path(address, timeframe, days_back_4_data)
+    try:
+        age = time.time() - os.path.getmtime(temp_file)
+    except OSError:
+        return None
+    return temp_file if age < TIMEFRAME_SECONDS.get(timeframe, 900) else None
+
+def _ohlcv_request(address, days_back_4_data, timeframe, cached=None):
+    """Build the Birdeye OHLCV url and headers - with cached candles only the missing tail is requested"""
+    window_start, time_to = get_time_range(days_back_4_data)
+    time_from = window_start
+    if cached is not None and not cached.empty:
+        last_cached = int(pd.Timestamp(cached['Datetime (UTC)'].iloc[-1], tz='UTC').timestamp())
+        time_from = max(window_start, last_cached)  # Re-fetch the last candle, it may still have been forming
     url = f"https://public-api.birdeye.so/defi/ohlcv?address={address}&type={timeframe}&time_from={time_from}&time_to={time_to}"
-
     headers = {"X-API-KEY": BIRDEYE_API_KEY}
-    response = requests.get(url, headers=headers)
+    return url, headers, window_start
+
+def _sma(values, length):
+    """Simple moving average from one cumulative sum - NaN until a full window is available (matches ta.sma)"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= length:
+        cs = np.cumsum(np.insert(values, 0, 0.0))
+        out[length - 1:] = (cs[length:] - cs[:-length]) / length
+    return out
+
+def _rsi(values, length):
+    """Wilder RSI on NumPy arrays - same smoothing as ta.rsi, without the per-call pandas_ta overhead"""
+    change = np.diff(values, prepend=np.nan)  # Leading NaN is skipped by ewm, just like close.diff()
+    gains = pd.Series(np.clip(change, 0, None)).ewm(alpha=1 / length, min_periods=length).mean().to_numpy()
+    losses = pd.Series(np.clip(-change, 0, None)).ewm(alpha=1 / length, min_periods=length).mean().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 * gains / (gains + losses)
+
+OHLCV_FIELDS = (('Open', 'o'), ('High', 'h'), ('Low', 'l'), ('Close', 'c'), ('Volume', 'v'))
+OHLCV_STREAM_CHUNK = 1024  # Candle rows added each time the streaming buffers fill up
+
+def _ohlcv_arrays(items):
+    """Typed (timestamps, {column: values}) arrays from already-parsed Birdeye candles"""
+    count = len(items)
+    ts = np.fromiter((item['unixTime'] for item in items), dtype=np.int64, count=count)
+    fields = {column: np.fromiter((item[key] for item in items), dtype=np.float64, count=count)
+              for column, key in OHLCV_FIELDS}
+    return ts, fields
+
+def _stream_ohlcv_arrays(raw):
+    """Same as _ohlcv_arrays, but parsed straight off the response stream - no list of dicts is ever built"""
+    ts = np.empty(OHLCV_STREAM_CHUNK, dtype=np.int64)
+    values = np.empty((OHLCV_STREAM_CHUNK, len(OHLCV_FIELDS)), dtype=np.float64)
+    count = 0
+    for item in ijson.items(raw, 'data.items.item', use_float=True):
+        if count == len(ts):
+            ts = np.resize(ts, count + OHLCV_STREAM_CHUNK)
+            values = np.resize(values, (count + OHLCV_STREAM_CHUNK, len(OHLCV_FIELDS)))
+        ts[count] = item['unixTime']
+        values[count] = [item[key] for _, key in OHLCV_FIELDS]
+        count += 1
+    return ts[:count], {column: values[:count, i] for i, (column, _) in enumerate(OHLCV_FIELDS)}
+
+def _process_ohlcv_items(address, candles, temp_file, cached=None, window_start=None):
+    """Turn typed Birdeye candle arrays (plus any cached candles) into the padded, indicator-ready DataFrame"""
+    ts, fields = candles
+
+    # Remove any candles dated in the future before anything else touches them
+    live = ts <= int(time.time())
+    ts = ts[live]
+    fields = {column: values[live] for column, values in fields.items()}
+
+    # Merge onto the cached candles - fresh rows win, anything older than the window drops off
+    if cached is not None and not cached.empty:
+        cached_ts = pd.to_datetime(cached['Datetime (UTC)'], format='%Y-%m-%d %H:%M:%S').to_numpy(dtype='datetime64[s]').astype(np.int64)
+        ts = np.concatenate([cached_ts, ts])
+        fields = {column: np.concatenate([cached[column].to_numpy(dtype=np.float64), values]) for column, values in fields.items()}
+        _, last_seen = np.unique(ts[::-1], return_index=True)  # Reversed, so each timestamp's newest row is the one found
+        keep = len(ts) - 1 - last_seen  # Back to forward indices, already in time order
+        keep = keep[ts[keep] >= window_start]
+        ts = ts[keep]
+        fields = {column: values[keep] for column, values in fields.items()}
+
+    # Pad if needed - repeat the first candle at the front of every column array
+    if len(ts) < 40:
+        print(f"🌙 MoonDev Alert: Padding data to ensure minimum 40 rows for analysis! 🚀")
+        if len(ts):
+            rows_to_add = 40 - len(ts)
+            ts = np.pad(ts, (rows_to_add, 0), mode='edge')
+            fields = {column: np.pad(values, (rows_to_add, 0), mode='edge') for column, values in fields.items()}
+
+    # Build the frame once, formatting every candle time in a single vectorized pass
+    df = pd.DataFrame({
+        'Datetime (UTC)': pd.to_datetime(ts, unit='s').strftime('%Y-%m-%d %H:%M:%S'),
+        **fields
+    }, columns=OHLCV_COLUMNS)
+
+    print(f"📊 MoonDev's Data Analysis Ready! Processing {len(df)} candles... 🎯")
+
+    df = _add_indicators(df)
+
+    # Always save to temp for current run - indicators included, so a cache hit is ready to use as-is
+    _write_temp_cache(address, df, temp_file)
+
+    return df
+
+def _add_indicators(df):
+    """MA20/MA40/RSI plus the trend flags, computed on the raw close array and attached in one assign"""
+    close = df['Close'].to_numpy(dtype=np.float64)
+    ma20 = _sma(close, 20)
+    ma40 = _sma(close, 40)
+    return df.assign(
+        MA20=ma20,
+        RSI=_rsi(close, 14),
+        MA40=ma40,
+        Price_above_MA20=close > ma20,
+        Price_above_MA40=close > ma40,
+        MA20_above_MA40=ma20 > ma40,
+    )
+
+def _write_temp_cache(address, df, temp_file):
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), temp_file, compression='zstd')
+    print(f"🔄 Moon Dev cached data for {address[:4]}")
+
+def _read_temp_cache(address, temp_file):
+    """Load this run's cached frame - a frame saved without indicators gets them added (and re-saved) once"""
+    print(f"📂 Moon Dev found cached data for {address[:4]}")
+    df = pd.read_parquet(temp_file)
+    if 'MA20' not in df.columns and not df.empty:
+        df = _add_indicators(df)
+        _write_temp_cache(address, df, temp_file)
+    return df
+
+def _ohlcv_error(address, status_code):
+    print(f"❌ MoonDev Error: Failed to fetch data for address {address}. Status code: {status_code}")
+    if status_code == 401:
+        print("🔑 Check your BIRDEYE_API_KEY in .env file!")
+    return pd.DataFrame()
+
+def get_data(address, days_back_4_data, timeframe, cached=None):
+    """Birdeye OHLCV + indicators for address - always a DataFrame, empty when the fetch fails"""
+    # Check temp data first
+    temp_file = _temp_cache_path(address, timeframe, days_back_4_data)
+    if _fresh_temp_file(address, timeframe, days_back_4_data):
+        return _read_temp_cache(address, temp_file)
+
+    url, headers, window_start = _ohlcv_request(address, days_back_4_data, timeframe, cached)
+    with HTTP_SESSION.get(url, headers=headers, stream=True) as response:
+        if response.status_code != 200:
+            return _ohlcv_error(address, response.status_code)
+        response.raw.decode_content = True  # Let urllib3 un-gzip while ijson reads
+        candles = _stream_ohlcv_arrays(response.raw)
+    return _process_ohlcv_items(address, candles, temp_file, cached, window_start)
+
+async def get_data_async(client, address, days_back_4_data, timeframe, cached=None):
+    """Async get_data - fetches with a shared httpx.AsyncClient so many tokens can be in flight at once (same DataFrame contract)"""
+    temp_file = _temp_cache_path(address, timeframe, days_back_4_data)
+    if _fresh_temp_file(address, timeframe, days_back_4_data):
+        return await asyncio.to_thread(_read_temp_cache, address, temp_file)
+
+    url, headers, window_start = _ohlcv_request(address, days_back_4_data, timeframe, cached)
+    response = await client.get(url, headers=headers)
     if response.status_code == 200:
-        json_response = response.json()
-        items = json_response.get('data', {}).get('items', [])
-
-        processed_data = [{
-            'Datetime (UTC)': datetime.utcfromtimestamp(item['unixTime']).strftime('%Y-%m-%d %H:%M:%S'),
-            'Open': item['o'],
-            'High': item['h'],
-            'Low': item['l'],
-            'Close': item['c'],
-            'Volume': item['v']
-        } for item in items]
-
-        df = pd.DataFrame(processed_data)
-
-        # Remove any rows with dates far in the future
-        current_date = datetime.now()
-        df['datetime_obj'] = pd.to_datetime(df['Datetime (UTC)'])
-        df = df[df['datetime_obj'] <= current_date]
-        df = df.drop('datetime_obj', axis=1)
-
-        # Pad if needed
-        if len(df) < 40:
-            print(f"🌙 MoonDev Alert: Padding data to ensure minimum 40 rows for analysis! 🚀")
-            rows_to_add = 40 - len(df)
-            first_row_replicated = pd.concat([df.iloc[0:1]] * rows_to_add, ignore_index=True)
-            df = pd.concat([first_row_replicated, df], ignore_index=True)
-
-        print(f"📊 MoonDev's Data Analysis Ready! Processing {len(df)} candles... 🎯")
-
-        # Always save to temp for current run
-        df.to_csv(temp_file)
-        print(f"🔄 Moon Dev cached data for {address[:4]}")
-
-        # Calculate indicators
-        df['MA20'] = ta.sma(df['Close'], length=20)
-        df['RSI'] = ta.rsi(df['Close'], length=14)
-        df['MA40'] = ta.sma(df['Close'], length=40)
-
-        df['Price_above_MA20'] = df['Close'] > df['MA20']
-        df['Price_above_MA40'] = df['Close'] > df['MA40']
-        df['MA20_above_MA40'] = df['MA20'] > df['MA40']
-
-        return df
+        items = orjson.loads(response.content).get('data', {}).get('items', [])
+        # pandas + indicator work is CPU/disk bound - keep it off the event loop
+        return await asyncio.to_thread(lambda: _process_ohlcv_items(address, _ohlcv_arrays(items), temp_file, cached, window_start))
     else:
-        print(f"❌ MoonDev Error: Failed to fetch data for address {address}. Status code: {response.status_code}")
-        if response.status_code == 401:
-            print("🔑 Check your BIRDEYE_API_KEY in .env file!")
-        return pd.DataFrame()
+        return _ohlcv_error(address, response.status_code)
 
 
 
 def fetch_wallet_holdings_og(address):
 
+    cached = _WALLET_CACHE.get(address)
+    if cached is not None:
+        return cached.copy()  # Callers filter/mutate freely without touching the cached snapshot
+
     API_KEY = BIRDEYE_API_KEY  # Assume this is your API key; replace it with the actual one
 
     # Initialize an empty DataFrame
@@ -410,10 +736,10 @@ def fetch_wallet_holdings_og(address):
 
     url = f"https://public-api.birdeye.so/v1/wallet/token_list?wallet={address}"
     headers = {"x-chain": "solana", "X-API-KEY": API_KEY}
-    response = requests.get(url, headers=headers)
+    response = HTTP_SESSION.get(url, headers=headers)
 
     if response.status_code == 200:
-        json_response = response.json()
+        json_response = orjson.loads(response.content)
 
         if 'data' in json_response and 'items' in json_response['data']:
             df = pd.DataFrame(json_response['data']['items'])
@@ -421,6 +747,7 @@ def fetch_wallet_holdings_og(address):
             df = df.rename(columns={'address': 'Mint Address', 'uiAmount': 'Amount', 'valueUsd': 'USD Value'})
             df = df.dropna()
             df = df[df['USD Value'] > 0.05]
+            _WALLET_CACHE.set(address, df.copy())
         else:
             cprint("No data available in the response.", 'white', 'on_red')
 
@@ -451,16 +778,32 @@ def fetch_wallet_token_single(address, token_mint_address):
     return df
 
 
+def _wallet_usd_values(address):
+    """{mint: USD value} for the wallet - built once per wallet snapshot so single-token lookups are a dict read"""
+    values = _BALANCE_CACHE.get(address)
+    if values is None:
+        df = fetch_wallet_holdings_og(address)
+        values = dict(zip(df['Mint Address'], df['USD Value'].astype(float)))
+        if values:
+            _BALANCE_CACHE.set(address, values)  # Don't pin an empty/failed fetch for the whole TTL
+    return values
+
 def token_price(address):
+    cached = _PRICE_CACHE.get(address)
+    if cached is not None:
+        return cached
+
     url = f"https://public-api.birdeye.so/defi/price?address={address}"
     headers = {"X-API-KEY": BIRDEYE_API_KEY}
-    response = requests.get(url, headers=headers)
-    price_data = response.json()
+    response = HTTP_SESSION.get(url, headers=headers)
+    price_data = orjson.loads(response.content)
 
     print(price_data)
 
     if price_data['success']:
-        return price_data['data']['value']
+        price = price_data['data']['value']
+        _PRICE_CACHE.set(address, price)
+        return price
     else:
         return None
     
@@ -482,120 +825,113 @@ def get_position(token_mint_address):
     """
     dataframe = fetch_wallet_token_single(address, token_mint_address)
 
-    #dataframe = pd.read_csv('data/token_per_addy.csv')
+    # fetch_wallet_token_single already filtered to this mint - empty means no balance
+    if dataframe.empty:
+        return 0  # Indicating no balance found
 
-    print('-----------------')
-    #print(dataframe)
+    return float(dataframe['Amount'].iat[0])
+
+
+# Solana Mainnet RPC endpoint
+SOLANA_RPC_URL = "https://api.mainnet-beta.solana.com/"
+RPC_TIMEOUT = 10  # Seconds before a Solana RPC call is given up on
+
+# Decimals never change for an SPL mint, so each one is fetched once per process
+_DECIMALS_CACHE = {}
+
+def get_decimals_batch(token_mint_addresses):
+    """Decimals for several mints - cached ones are free, the rest share a single JSON-RPC batch request.
+    Mints the RPC couldn't resolve (error entry, closed account, failed call) are left out of the result."""
+    misses = [mint for mint in dict.fromkeys(token_mint_addresses) if mint not in _DECIMALS_CACHE]
+    if misses:
+        payload = [{
+            "jsonrpc": "2.0",
+            "id": i,
+            "method": "getAccountInfo",
+            "params": [mint, {"encoding": "jsonParsed"}]
+        } for i, mint in enumerate(misses)]
+
+        response = HTTP_SESSION.post(SOLANA_RPC_URL, headers={"Content-Type": "application/json"},
+                                     data=orjson.dumps(payload), timeout=RPC_TIMEOUT)
+        results = orjson.loads(response.content) if response.ok else None
+        if not isinstance(results, list):  # Rate limits and RPC-level failures come back as a single object
+            print(f"❌ Decimals lookup failed for {len(misses)} mints (HTTP {response.status_code})")
+            results = []
+        for result in results:
+            value = (result.get('result') or {}).get('value')
+            if not value:  # {"error": ...} entry, or null value for a closed account
+                continue
+            try:
+                _DECIMALS_CACHE[misses[result['id']]] = value['data']['parsed']['info']['decimals']
+            except (KeyError, IndexError, TypeError):
+                continue  # Not a parsed SPL mint account
 
-    #print(dataframe)
+    return {mint: _DECIMALS_CACHE[mint] for mint in token_mint_addresses if mint in _DECIMALS_CACHE}
 
-    # Check if the DataFrame is empty
-    if dataframe.empty:
-        print("The DataFrame is empty. No positions to show.")
-        return 0  # Indicating no balance found
+def get_decimals(token_mint_address):
+    return get_decimals_batch([token_mint_address])[token_mint_address]
 
-    # Ensure 'Mint Address' column is treated as string for reliable comparison
-    dataframe['Mint Address'] = dataframe['Mint Address'].astype(str)
+def get_position_and_price(token_mint_address):
+    """Fetch balance and price concurrently - they hit different APIs, so there is no reason to wait on one for the other"""
+    balance_future = _POOL.submit(get_position, token_mint_address)
+    price_future = _POOL.submit(token_price, token_mint_address)
+    return balance_future.result(), price_future.result()
 
-    # Check if the token mint address exists in the DataFrame
-    if dataframe['Mint Address'].isin([token_mint_address]).any():
-        # Get the balance for the specified token
-        balance = dataframe.loc[dataframe['Mint Address'] == token_mint_address, 'Amount'].iloc[0]
-        #print(f"Balance for {token_mint_address[-4:]} token: {balance}")
-        return balance
-    else:
-        # If the token mint address is not found in the DataFrame, return a message indicating so
-        print("Token mint address not found in the wallet.")
-        return 0  # Indicating no balance found
+SELL_CONFIRM_MAX_WAIT = 15  # Seconds to wait for a sell to show up in the balance before the loop re-evaluates
 
+def _sell_and_confirm(token_mint_address, sell_size, balance, on_color):
+    """Sell once, then poll the balance with exponential backoff + jitter until it moves - no fixed 15s nap on fast fills"""
+    try:
+        market_sell(token_mint_address, sell_size, slippage)  # slippage from config
+        close_log.info(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', extra=cstyle('white', on_color))
+    except Exception as e:
+        close_log.error(f'order error for {token_mint_address[:4]}: {str(e)} .. trying again', extra=cstyle('white', 'on_red'))
+        time.sleep(1 + random.uniform(0, 0.5))
+        return
 
-def get_decimals(token_mint_address):
-    import requests
-    import base64
-    import json
-    # Solana Mainnet RPC endpoint
-    url = "https://api.mainnet-beta.solana.com/"
-    headers = {"Content-Type": "application/json"}
-
-    # Request payload to fetch account information
-    payload = json.dumps({
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "getAccountInfo",
-        "params": [
-            token_mint_address,
-            {
-                "encoding": "jsonParsed"
-            }
-        ]
-    })
-
-    # Make the request to Solana RPC
-    response = requests.post(url, headers=headers, data=payload)
-    response_json = response.json()
-
-    # Parse the response to extract the number of decimals
-    decimals = response_json['result']['value']['data']['parsed']['info']['decimals']
-    #print(f"Decimals for {token_mint_address[-4:]} token: {decimals}")
-
-    return decimals
+    waited, attempt = 0, 0
+    while waited < SELL_CONFIRM_MAX_WAIT:
+        delay = min(SELL_CONFIRM_MAX_WAIT - waited, 2 ** attempt) + random.uniform(0, 0.5)
+        time.sleep(delay)
+        waited += delay
+        attempt += 1
+        _WALLET_CACHE.clear()  # Each poll must see the chain, not the snapshot from the last read
+        if get_position(token_mint_address) != balance:
+            return
 
 def pnl_close(token_mint_address):
 
     ''' this will check to see if price is > sell 1, sell 2, sell 3 and sell accordingly '''
 
-    print(f'checking pnl close to see if its time to exit for {token_mint_address[:4]}...')
+    close_log.info(f'checking pnl close to see if its time to exit for {token_mint_address[:4]}...')
     # check solana balance
 
 
-    # if time is on the 5 minute do the balance check, if not grab from data/current_position.csv
-    balance = get_position(token_mint_address)
-
-    # save to data/current_position.csv w/ pandas
-
-    # get current price of token
-    price = token_price(token_mint_address)
+    # get balance and current price of token in parallel
+    balance, price = get_position_and_price(token_mint_address)
 
     usd_value = balance * price
 
+    # loop invariants - targets and the token's base-unit factor never change while closing
     tp = sell_at_multiple * USDC_SIZE
     sl = ((1+stop_loss_percentage) * USDC_SIZE)
-    sell_size = balance
-    decimals = 0
     decimals = get_decimals(token_mint_address)
-    #print(f'for {token_mint_address[-4:]} decimals is {decimals}')
+    factor = 10 **decimals
 
-    sell_size = int(sell_size * 10 **decimals)
+    sell_size = int(balance * factor)
 
     #print(f'bal: {balance} price: {price} usdVal: {usd_value} TP: {tp} sell size: {sell_size} decimals: {decimals}')
 
     while usd_value > tp:
 
 
-        cprint(f'for {token_mint_address[:4]} value is {usd_value} and tp is {tp} so closing...', 'white', 'on_green')
-        try:
+        close_log.info(f'for {token_mint_address[:4]} value is {usd_value} and tp is {tp} so closing...', extra=cstyle('white', 'on_green'))
+        _sell_and_confirm(token_mint_address, sell_size, balance, 'on_green')
 
-            market_sell(token_mint_address, sell_size)
-            cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_green')
-            time.sleep(2)
-            market_sell(token_mint_address, sell_size)
-            cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_green')
-            time.sleep(2)
-            market_sell(token_mint_address, sell_size)
-            cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_green')
-            time.sleep(15)
-
-        except:
-            cprint('order error.. trying again', 'white', 'on_red')
-            time.sleep(2)
-
-        balance = get_position(token_mint_address)
-        price = token_price(token_mint_address)
+        balance, price = get_position_and_price(token_mint_address)
         usd_value = balance * price
-        tp = sell_at_multiple * USDC_SIZE
-        sell_size = balance
-        sell_size = int(sell_size * 10 **decimals)
-        print(f'USD Value is {usd_value} | TP is {tp} ')
+        sell_size = int(balance * factor)
+        close_log.info(f'USD Value is {usd_value} | TP is {tp} ')
 
 
     else:
@@ -610,60 +946,40 @@ def pnl_close(token_mint_address):
 
         while usd_value < sl and usd_value > 0:
 
-            sell_size = balance
-            sell_size = int(sell_size * 10 **decimals)
+            sell_size = int(balance * factor)
 
-            cprint(f'for {token_mint_address[:4]} value is {usd_value} and sl is {sl} so closing as a loss...', 'white', 'on_blue')
+            close_log.info(f'for {token_mint_address[:4]} value is {usd_value} and sl is {sl} so closing as a loss...', extra=cstyle('white', 'on_blue'))
 
             #print(f'for {token_mint_address[-4:]} value is {usd_value} and tp is {tp} so closing...')
-            try:
+            _sell_and_confirm(token_mint_address, sell_size, balance, 'on_blue')
 
-                market_sell(token_mint_address, sell_size)
-                cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_blue')
-                time.sleep(1)
-                market_sell(token_mint_address, sell_size)
-                cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_blue')
-                time.sleep(1)
-                market_sell(token_mint_address, sell_size)
-                cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_blue')
-                time.sleep(15)
-
-            except:
-                cprint('order error.. trying again', 'white', 'on_red')
-                # time.sleep(7)
-
-            balance = get_position(token_mint_address)
-            price = token_price(token_mint_address)
+            balance, price = get_position_and_price(token_mint_address)
             usd_value = balance * price
-            tp = sell_at_multiple * USDC_SIZE
-            sl = ((1+stop_loss_percentage) * USDC_SIZE)
-            sell_size = balance
-
-            sell_size = int(sell_size * 10 **decimals)
-            print(f'balance is {balance} and price is {price} and usd_value is {usd_value} and tp is {tp} and sell_size is {sell_size} decimals is {decimals}')
+            sell_size = int(balance * factor)
+            close_log.info(f'balance is {balance} and price is {price} and usd_value is {usd_value} and tp is {tp} and sell_size is {sell_size} decimals is {decimals}')
 
             # break the loop if usd_value is 0
             if usd_value == 0:
-                print(f'successfully closed {token_mint_address[:4]} usd_value is {usd_value} so breaking loop AFTER putting it on my dont_overtrade.txt...')
-                with open('dont_overtrade.txt', 'a') as file:
+                close_log.info(f'successfully closed {token_mint_address[:4]} usd_value is {usd_value} so breaking loop AFTER putting it on my dont_overtrade.txt...')
+                with _DONT_OVERTRADE_LOCK, open('dont_overtrade.txt', 'a') as file:
                     file.write(token_mint_address + '\n')
                 break
 
         else:
-            print(f'for {token_mint_address[:4]} value is {usd_value} and tp is {tp} so not closing...')
+            close_log.info(f'for {token_mint_address[:4]} value is {usd_value} and tp is {tp} so not closing...')
             #time.sleep(10)
     else:
-        print(f'for {token_mint_address[:4]} value is {usd_value} and tp is {tp} so not closing...')
+        close_log.info(f'for {token_mint_address[:4]} value is {usd_value} and tp is {tp} so not closing...')
 
 def chunk_kill(token_mint_address, max_usd_order_size, slippage):
     """Kill a position in chunks"""
-    cprint(f"\n🔪 Moon Dev's AI Agent initiating position exit...", "white", "on_cyan")
+    close_log.info(f"\n🔪 Moon Dev's AI Agent initiating position exit...", extra=cstyle("white", "on_cyan"))
     
     try:
         # Get current position using address from config
         df = fetch_wallet_token_single(address, token_mint_address)
         if df.empty:
-            cprint("❌ No position found to exit", "white", "on_red")
+            close_log.error("❌ No position found to exit", extra=cstyle("white", "on_red"))
             return
             
         # Get current token amount and value
@@ -673,44 +989,44 @@ def chunk_kill(token_mint_address, max_usd_order_size, slippage):
         # Get token decimals
         decimals = get_decimals(token_mint_address)
         
-        cprint(f"📊 Initial position: {token_amount:.2f} tokens (${current_usd_value:.2f})", "white", "on_cyan")
+        close_log.info(f"📊 Initial position: {token_amount:.2f} tokens (${current_usd_value:.2f})", extra=cstyle("white", "on_cyan"))
         
         while current_usd_value > 0.1:  # Keep going until position is essentially zero
             # Calculate chunk size based on current position
             chunk_size = token_amount / 3  # Split remaining into 3 chunks
-            cprint(f"\n🔄 Splitting remaining position into chunks of {chunk_size:.2f} tokens", "white", "on_cyan")
+            close_log.info(f"\n🔄 Splitting remaining position into chunks of {chunk_size:.2f} tokens", extra=cstyle("white", "on_cyan"))
             
             # Execute sell orders in chunks
             for i in range(3):
                 try:
-                    cprint(f"\n💫 Executing sell chunk {i+1}/3...", "white", "on_cyan")
+                    close_log.info(f"\n💫 Executing sell chunk {i+1}/3...", extra=cstyle("white", "on_cyan"))
                     sell_size = int(chunk_size * 10**decimals)
                     market_sell(token_mint_address, sell_size, slippage)
-                    cprint(f"✅ Sell chunk {i+1}/3 complete", "white", "on_green")
+                    close_log.info(f"✅ Sell chunk {i+1}/3 complete", extra=cstyle("white", "on_green"))
                     time.sleep(2)  # Small delay between chunks
                 except Exception as e:
-                    cprint(f"❌ Error in sell chunk: {str(e)}", "white", "on_red")
+                    close_log.error(f"❌ Error in sell chunk: {str(e)}", extra=cstyle("white", "on_red"))
             
             # Check remaining position
             time.sleep(5)  # Wait for blockchain to update
             df = fetch_wallet_token_single(address, token_mint_address)
             if df.empty:
-                cprint("\n✨ Position successfully closed!", "white", "on_green")
+                close_log.info("\n✨ Position successfully closed!", extra=cstyle("white", "on_green"))
                 return
                 
             # Update position size for next iteration
             token_amount = float(df['Amount'].iloc[0])
             current_usd_value = float(df['USD Value'].iloc[0])
-            cprint(f"\n📊 Remaining position: {token_amount:.2f} tokens (${current_usd_value:.2f})", "white", "on_cyan")
+            close_log.info(f"\n📊 Remaining position: {token_amount:.2f} tokens (${current_usd_value:.2f})", extra=cstyle("white", "on_cyan"))
             
             if current_usd_value > 0.1:
-                cprint("🔄 Position still open - continuing to close...", "white", "on_cyan")
+                close_log.info("🔄 Position still open - continuing to close...", extra=cstyle("white", "on_cyan"))
                 time.sleep(2)
             
-        cprint("\n✨ Position successfully closed!", "white", "on_green")
+        close_log.info("\n✨ Position successfully closed!", extra=cstyle("white", "on_green"))
         
     except Exception as e:
-        cprint(f"❌ Error during position exit: {str(e)}", "white", "on_red")
+        close_log.error(f"❌ Error during position exit: {str(e)}", extra=cstyle("white", "on_red"))
 
 def sell_token(token_mint_address, amount, slippage):
     """Sell a token"""
@@ -728,11 +1044,8 @@ def kill_switch(token_mint_address):
     if the usd_size > 10k then it will chunk in 10k orders
     '''
 
-    # if time is on the 5 minute do the balance check, if not grab from data/current_position.csv
-    balance = get_position(token_mint_address)
-
-    # get current price of token
-    price = token_price(token_mint_address)
+    # get balance and current price of token in parallel
+    balance, price = get_position_and_price(token_mint_address)
     price = float(price)
 
     usd_value = balance * price
@@ -742,13 +1055,14 @@ def kill_switch(token_mint_address):
     else:
         sell_size = 10000/price
 
+    # loop invariants - the target and the token's base-unit factor never change while closing
     tp = sell_at_multiple * USDC_SIZE
+    decimals = get_decimals(token_mint_address)
+    factor = 10 **decimals
 
     # round to 2 decimals
     sell_size = round_down(sell_size, 2)
-    decimals = 0
-    decimals = get_decimals(token_mint_address)
-    sell_size = int(sell_size * 10 **decimals)
+    sell_size = int(sell_size * factor)
 
     #print(f'bal: {balance} price: {price} usdVal: {usd_value} TP: {tp} sell size: {sell_size} decimals: {decimals}')
 
@@ -757,26 +1071,10 @@ def kill_switch(token_mint_address):
 
 # 100 selling 70% ...... selling 30 left
         #print(f'for {token_mint_address[-4:]} closing position cause exit all positions is set to {EXIT_ALL_POSITIONS} and value is {usd_value} and tp is {tp} so closing...')
-        try:
+        _sell_and_confirm(token_mint_address, sell_size, balance, 'on_blue')
 
-            market_sell(token_mint_address, sell_size)
-            cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_blue')
-            time.sleep(1)
-            market_sell(token_mint_address, sell_size)
-            cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_blue')
-            time.sleep(1)
-            market_sell(token_mint_address, sell_size)
-            cprint(f'just made an order {token_mint_address[:4]} selling {sell_size} ...', 'white', 'on_blue')
-            time.sleep(15)
-
-        except:
-            cprint('order error.. trying again', 'white', 'on_red')
-            # time.sleep(7)
-
-        balance = get_position(token_mint_address)
-        price = token_price(token_mint_address)
+        balance, price = get_position_and_price(token_mint_address)
         usd_value = balance * price
-        tp = sell_at_multiple * USDC_SIZE
 
         if usd_value < 10000:
             sell_size = balance
@@ -786,36 +1084,47 @@ def kill_switch(token_mint_address):
         # down downwards to 2 decimals
         sell_size = round_down(sell_size, 2)
 
-        decimals = 0
-        decimals = get_decimals(token_mint_address)
-        #print(f'xxxxxxxxx for {token_mint_address[-4:]} decimals is {decimals}')
-        sell_size = int(sell_size * 10 **decimals)
-        print(f'balance is {balance} and usd_value is {usd_value} EXIT ALL POSITIONS TRUE and sell_size is {sell_size} decimals is {decimals}')
+        sell_size = int(sell_size * factor)
+        close_log.info(f'balance is {balance} and usd_value is {usd_value} EXIT ALL POSITIONS TRUE and sell_size is {sell_size} decimals is {decimals}')
 
 
     else:
-        print(f'for {token_mint_address[:4]} value is {usd_value} ')
+        close_log.info(f'for {token_mint_address[:4]} value is {usd_value} ')
         #time.sleep(10)
 
-    print('closing position in full...')
+    close_log.info('closing position in full...')
 
 def close_all_positions():
 
     # get all positions
     open_positions = fetch_wallet_holdings_og(address)
 
-    # loop through all positions and close them getting the mint address from Mint Address column
-    for index, row in open_positions.iterrows():
-        token_mint_address = row['Mint Address']
+    # split off USDC and anything else we never trade in one vectorized membership pass
+    skip = open_positions['Mint Address'].isin(set(dont_trade_list))
+    for token_mint_address in open_positions.loc[skip, 'Mint Address']:
+        print(f'Skipping kill switch for USDC contract at {token_mint_address}')
+    mints = open_positions.loc[~skip, 'Mint Address'].tolist()
+
+    # warm the decimals cache for every position with one batched RPC call - best effort, kill_switch looks up any misses itself
+    try:
+        get_decimals_batch(mints)
+    except Exception as e:
+        print(f"⚠️ Couldn't prefetch decimals, positions will look them up one by one: {str(e)}")
 
-        # Check if the current token mint address is the USDC contract address
-        cprint(f'this is the token mint address {token_mint_address} this is don not trade list {dont_trade_list}', 'white', 'on_magenta')
-        if token_mint_address in dont_trade_list:
-            print(f'Skipping kill switch for USDC contract at {token_mint_address}')
-            continue  # Skip the rest of the loop for this iteration
+    if not mints:
+        return
 
-        print(f'Closing position for {token_mint_address}...')
-        kill_switch(token_mint_address)
+    # close every position at once - total time is the slowest exit, not the sum of them
+    with ThreadPoolExecutor(max_workers=min(MAX_CLOSE_WORKERS, len(mints)), thread_name_prefix='close') as pool:
+        futures = {pool.submit(kill_switch, mint): mint for mint in mints}
+        print(f'Closing {len(mints)} positions in parallel...')
+        for future in as_completed(futures):
+            token_mint_address = futures[future]
+            try:
+                future.result()
+                cprint(f'✅ Closed position for {token_mint_address[:4]}', 'white', 'on_green')
+            except Exception as e:
+                cprint(f'❌ Error closing {token_mint_address[:4]}: {str(e)}', 'white', 'on_red')
 
 def delete_dont_overtrade_file():
     if os.path.exists('dont_overtrade.txt'):
@@ -824,41 +1133,53 @@ def delete_dont_overtrade_file():
     else:
         print('The file does not exist')
 
-def supply_demand_zones(token_address, timeframe, limit):
+def _swing_pivots(high, low, window):
+    """Indices of swing highs/lows - bars that are the extreme of the window bars on either side, found with one vectorized sliding-window pass"""
+    span = 2 * window + 1
+    if len(high) < span:
+        return np.array([], dtype=int), np.array([], dtype=int)
+    windows_hi = np.lib.stride_tricks.sliding_window_view(high, span)
+    windows_lo = np.lib.stride_tricks.sliding_window_view(low, span)
+    pivot_hi = np.flatnonzero(windows_hi.argmax(axis=1) == window) + window
+    pivot_lo = np.flatnonzero(windows_lo.argmin(axis=1) == window) + window
+    return pivot_hi, pivot_lo
+
+SD_ZONE_DAYS_BACK = 10  # Days of candles fetched before trimming to the last `limit` bars
+
+def supply_demand_zones(token_address, timeframe, limit, pivot_window=None):
 
     print('starting moons supply and demand zone calculations..')
 
     sd_df = pd.DataFrame()
 
-    time_from, time_to = get_time_range()
-
-    df = get_data(token_address, time_from, time_to, timeframe)
+    df = get_data(token_address, SD_ZONE_DAYS_BACK, timeframe)
+    if df.empty:
+        print(f"❌ No candles for {token_address[:4]} - can't calculate supply and demand zones")
+        return sd_df
 
     # only keep the data for as many bars as limit says
     df = df[-limit:]
     #print(df)
     #time.sleep(100)
 
-    # Calculate support and resistance, excluding the last two rows for the calculation
-    if len(df) > 2:  # Check if DataFrame has more than 2 rows to avoid errors
-        df['support'] = df[:-2]['Close'].min()
-        df['resis'] = df[:-2]['Close'].max()
-    else:  # If DataFrame has 2 or fewer rows, use the available 'close' prices for calculation
-        df['support'] = df['Close'].min()
-        df['resis'] = df['Close'].max()
-
-    supp = df.iloc[-1]['support']
-    resis = df.iloc[-1]['resis']
-    #print(f'this is moons support for 1h {supp_1h} this is resis: {resis_1h}')
-
-    df['supp_lo'] = df[:-2]['Low'].min()
-    supp_lo = df.iloc[-1]['supp_lo']
-
-    df['res_hi'] = df[:-2]['High'].max()
-    res_hi = df.iloc[-1]['res_hi']
-
-    #print(df)
-
+    # Calculate support and resistance straight off the arrays, excluding the last two rows for the calculation
+    # If DataFrame has 2 or fewer rows, use all the available prices
+    head = slice(0, -2) if len(df) > 2 else slice(None)
+    close = df['Close'].to_numpy()[head]
+    supp = close.min()
+    resis = close.max()
+    supp_lo = df['Low'].to_numpy()[head].min()
+    res_hi = df['High'].to_numpy()[head].max()
+
+    # Optionally anchor the zones on the latest swing low/high instead of the window's extremes
+    if pivot_window:
+        high = df['High'].to_numpy()[head]
+        low = df['Low'].to_numpy()[head]
+        pivot_hi, pivot_lo = _swing_pivots(high, low, pivot_window)
+        if len(pivot_lo):
+            supp_lo, supp = low[pivot_lo[-1]], close[pivot_lo[-1]]
+        if len(pivot_hi):
+            res_hi, resis = high[pivot_hi[-1]], close[pivot_hi[-1]]
 
     sd_df[f'dz'] = [supp_lo, supp]
     sd_df[f'sz'] = [res_hi, resis]
@@ -869,185 +1190,94 @@ def supply_demand_zones(token_address, timeframe, limit):
     return sd_df
 
 
+USDC_BASE_UNITS = 10**6  # USDC has 6 decimals - market_buy amounts are in these base units
+
+def _next_chunk_size(pos_usd, target_usd):
+    """USD still needed to reach target_usd, and the next order size (capped at max_usd_order_size) as the base-unit string market_buy expects"""
+    size_needed = target_usd - pos_usd
+    chunk_usd = min(size_needed, max_usd_order_size)
+    return size_needed, str(int(chunk_usd * USDC_BASE_UNITS))
+
+ENTRY_RETRY_WAIT = 30  # Seconds to wait before the single retry of a failed chunk
+
+def _announce_chunk_retry(details):
+    cprint(f'trying again to make the order in {ENTRY_RETRY_WAIT} seconds.....', 'light_blue', 'on_light_magenta')
+
+@backoff.on_exception(backoff.constant, Exception, interval=ENTRY_RETRY_WAIT, jitter=None,
+                      max_tries=2, on_backoff=_announce_chunk_retry)
+def _place_chunk(symbol, chunk_size):
+    """Fire one batch of chunk orders and wait tx_sleep for them to settle - retried once if every leg failed.
+    Returns how many legs failed - a partial fill isn't retried (that would re-send the legs that landed), the next chunk tops it up."""
+    failed = market_buy_batch(symbol, chunk_size, slippage, orders_per_open).count(None)
+    if failed:
+        cprint(f'⚠️ {failed}/{orders_per_open} chunk buys of {symbol[:4]} failed - the next chunk makes up the difference', 'white', 'on_yellow')
+    time.sleep(tx_sleep)
+    return failed
+
 def elegant_entry(symbol, buy_under):
 
-    pos = get_position(symbol)
-    price = token_price(symbol)
+    fill_target = .97 * usd_size  # 97% of usd_size counts as filled
+    pos, price = get_position_and_price(symbol)
     pos_usd = pos * price
-    size_needed = usd_size - pos_usd
-    if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-    else: chunk_size = size_needed
-
-    chunk_size = int(chunk_size * 10**6)
-    chunk_size = str(chunk_size)
+    size_needed, chunk_size = _next_chunk_size(pos_usd, usd_size)
 
     print(f'chunk_size: {chunk_size}')
 
-    if pos_usd > (.97 * usd_size):
+    if pos_usd > fill_target:
         print('position filled')
         time.sleep(10)
 
     # add debug prints for next while
     print(f'position: {round(pos,2)} price: {round(price,8)} pos_usd: ${round(pos_usd,2)}')
     print(f'buy_under: {buy_under}')
-    while pos_usd < (.97 * usd_size) and (price < buy_under):
+    while pos_usd < fill_target and (price < buy_under):
 
         print(f'position: {round(pos,2)} price: {round(price,8)} pos_usd: ${round(pos_usd,2)}')
 
         try:
+            _place_chunk(symbol, chunk_size)
+        except Exception:
+            cprint(f'Final Error in the buy, restart needed', 'white', 'on_red')
+            time.sleep(10)
+            break
 
-            for i in range(orders_per_open):
-                market_buy(symbol, chunk_size, slippage)
-                # cprint green background black text
-                cprint(f'chunk buy submitted of {symbol[:4]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-                time.sleep(1)
-
-            time.sleep(tx_sleep)
-
-            pos = get_position(symbol)
-            price = token_price(symbol)
-            pos_usd = pos * price
-            size_needed = usd_size - pos_usd
-            if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-            else: chunk_size = size_needed
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
-
-        except:
-
-            try:
-                cprint(f'trying again to make the order in 30 seconds.....', 'light_blue', 'on_light_magenta')
-                time.sleep(30)
-                for i in range(orders_per_open):
-                    market_buy(symbol, chunk_size, slippage)
-                    # cprint green background black text
-                    cprint(f'chunk buy submitted of {symbol[:4]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-                    time.sleep(1)
-
-                time.sleep(tx_sleep)
-                pos = get_position(symbol)
-                price = token_price(symbol)
-                pos_usd = pos * price
-                size_needed = usd_size - pos_usd
-                if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-                else: chunk_size = size_needed
-                chunk_size = int(chunk_size * 10**6)
-                chunk_size = str(chunk_size)
-
-
-            except:
-                cprint(f'Final Error in the buy, restart needed', 'white', 'on_red')
-                time.sleep(10)
-                break
-
-        pos = get_position(symbol)
-        price = token_price(symbol)
+        pos, price = get_position_and_price(symbol)
         pos_usd = pos * price
-        size_needed = usd_size - pos_usd
-        if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-        else: chunk_size = size_needed
-        chunk_size = int(chunk_size * 10**6)
-        chunk_size = str(chunk_size)
+        size_needed, chunk_size = _next_chunk_size(pos_usd, usd_size)
 
 
 # like the elegant entry but for breakout so its looking for price > BREAKOUT_PRICE
 def breakout_entry(symbol, BREAKOUT_PRICE):
 
-    pos = get_position(symbol)
-    price = token_price(symbol)
+    fill_target = .97 * usd_size  # 97% of usd_size counts as filled
+    pos, price = get_position_and_price(symbol)
     price = float(price)
     pos_usd = pos * price
-    size_needed = usd_size - pos_usd
-    if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-    else: chunk_size = size_needed
-
-    chunk_size = int(chunk_size * 10**6)
-    chunk_size = str(chunk_size)
+    size_needed, chunk_size = _next_chunk_size(pos_usd, usd_size)
 
     print(f'chunk_size: {chunk_size}')
 
-    if pos_usd > (.97 * usd_size):
+    if pos_usd > fill_target:
         print('position filled')
         time.sleep(10)
 
     # add debug prints for next while
     print(f'position: {round(pos,2)} price: {round(price,8)} pos_usd: ${round(pos_usd,2)}')
     print(f'breakoutpurce: {BREAKOUT_PRICE}')
-    while pos_usd < (.97 * usd_size) and (price > BREAKOUT_PRICE):
+    while pos_usd < fill_target and (price > BREAKOUT_PRICE):
 
         print(f'position: {round(pos,2)} price: {round(price,8)} pos_usd: ${round(pos_usd,2)}')
 
-        # for i in range(orders_per_open):
-        #     market_buy(symbol, chunk_size, slippage)
-        #     # cprint green background black text
-        #     cprint(f'chunk buy submitted of {symbol[-4:]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-        #     time.sleep(1)
-
-        # time.sleep(tx_sleep)
-
-        # pos = get_position(symbol)
-        # price = token_price(symbol)
-        # pos_usd = pos * price
-        # size_needed = usd_size - pos_usd
-        # if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-        # else: chunk_size = size_needed
-        # chunk_size = int(chunk_size * 10**6)
-        # chunk_size = str(chunk_size)
-
         try:
+            _place_chunk(symbol, chunk_size)
+        except Exception:
+            cprint(f'Final Error in the buy, restart needed', 'white', 'on_red')
+            time.sleep(10)
+            break
 
-            for i in range(orders_per_open):
-                market_buy(symbol, chunk_size, slippage)
-                # cprint green background black text
-                cprint(f'chunk buy submitted of {symbol[:4]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-                time.sleep(1)
-
-            time.sleep(tx_sleep)
-
-            pos = get_position(symbol)
-            price = token_price(symbol)
-            pos_usd = pos * price
-            size_needed = usd_size - pos_usd
-            if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-            else: chunk_size = size_needed
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
-
-        except:
-
-            try:
-                cprint(f'trying again to make the order in 30 seconds.....', 'light_blue', 'on_light_magenta')
-                time.sleep(30)
-                for i in range(orders_per_open):
-                    market_buy(symbol, chunk_size, slippage)
-                    # cprint green background black text
-                    cprint(f'chunk buy submitted of {symbol[:4]} sz: {chunk_size} you my dawg moon dev', 'white', 'on_blue')
-                    time.sleep(1)
-
-                time.sleep(tx_sleep)
-                pos = get_position(symbol)
-                price = token_price(symbol)
-                pos_usd = pos * price
-                size_needed = usd_size - pos_usd
-                if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-                else: chunk_size = size_needed
-                chunk_size = int(chunk_size * 10**6)
-                chunk_size = str(chunk_size)
-
-
-            except:
-                cprint(f'Final Error in the buy, restart needed', 'white', 'on_red')
-                time.sleep(10)
-                break
-
-        pos = get_position(symbol)
-        price = token_price(symbol)
+        pos, price = get_position_and_price(symbol)
         pos_usd = pos * price
-        size_needed = usd_size - pos_usd
-        if size_needed > max_usd_order_size: chunk_size = max_usd_order_size
-        else: chunk_size = size_needed
-        chunk_size = int(chunk_size * 10**6)
-        chunk_size = str(chunk_size)
+        size_needed, chunk_size = _next_chunk_size(pos_usd, usd_size)
 
 
 
@@ -1057,117 +1287,61 @@ def ai_entry(symbol, amount):
     
     # amount passed in is the target allocation (up to 30% of usd_size)
     target_size = amount  # This could be up to $3 (30% of $10)
+    fill_target = target_size * 0.97  # 97% of the target counts as filled
     
-    pos = get_position(symbol)
-    price = token_price(symbol)
+    pos, price = get_position_and_price(symbol)
     pos_usd = pos * price
     
     cprint(f"🎯 Target allocation: ${target_size:.2f} USD (max 30% of ${usd_size})", "white", "on_blue")
     cprint(f"📊 Current position: ${pos_usd:.2f} USD", "white", "on_blue")
     
     # Check if we're already at or above target
-    if pos_usd >= (target_size * 0.97):
+    if pos_usd >= fill_target:
         cprint("✋ Position already at or above target size!", "white", "on_blue")
         return
         
     # Calculate how much more we need to buy
-    size_needed = target_size - pos_usd
+    size_needed, chunk_size = _next_chunk_size(pos_usd, target_size)
     if size_needed <= 0:
         cprint("🛑 No additional size needed", "white", "on_blue")
         return
-        
-    # For order execution, we'll chunk into max_usd_order_size pieces
-    if size_needed > max_usd_order_size: 
-        chunk_size = max_usd_order_size
-    else: 
-        chunk_size = size_needed
-
-    chunk_size = int(chunk_size * 10**6)
-    chunk_size = str(chunk_size)
-    
+
     cprint(f"💫 Entry chunk size: {chunk_size} (chunking ${size_needed:.2f} into ${max_usd_order_size:.2f} orders)", "white", "on_blue")
 
-    while pos_usd < (target_size * 0.97):
+    while pos_usd < fill_target:
         cprint(f"🤖 AI Agent executing entry for {symbol[:8]}...", "white", "on_blue")
         print(f"Position: {round(pos,2)} | Price: {round(price,8)} | USD Value: ${round(pos_usd,2)}")
 
         try:
-            for i in range(orders_per_open):
-                market_buy(symbol, chunk_size, slippage)
-                cprint(f"🚀 AI Agent placed order {i+1}/{orders_per_open} for {symbol[:8]}", "white", "on_blue")
-                time.sleep(1)
+            _place_chunk(symbol, chunk_size)
+            cprint(f"🚀 AI Agent placed {orders_per_open} orders for {symbol[:8]}", "white", "on_blue")
+        except Exception:
+            cprint("❌ AI Agent encountered critical error, manual intervention needed", "white", "on_red")
+            return
 
-            time.sleep(tx_sleep)
-            
-            # Update position info
-            pos = get_position(symbol)
-            price = token_price(symbol)
-            pos_usd = pos * price
-            
-            # Break if we're at or above target
-            if pos_usd >= (target_size * 0.97):
-                break
-                
-            # Recalculate needed size
-            size_needed = target_size - pos_usd
-            if size_needed <= 0:
-                break
-                
-            # Determine next chunk size
-            if size_needed > max_usd_order_size: 
-                chunk_size = max_usd_order_size
-            else: 
-                chunk_size = size_needed
-            chunk_size = int(chunk_size * 10**6)
-            chunk_size = str(chunk_size)
+        # Update position info
+        pos, price = get_position_and_price(symbol)
+        pos_usd = pos * price
 
-        except Exception as e:
-            try:
-                cprint("🔄 AI Agent retrying order in 30 seconds...", "white", "on_blue")
-                time.sleep(30)
-                for i in range(orders_per_open):
-                    market_buy(symbol, chunk_size, slippage)
-                    cprint(f"🚀 AI Agent retry order {i+1}/{orders_per_open} for {symbol[:8]}", "white", "on_blue")
-                    time.sleep(1)
-
-                time.sleep(tx_sleep)
-                pos = get_position(symbol)
-                price = token_price(symbol)
-                pos_usd = pos * price
-                
-                if pos_usd >= (target_size * 0.97):
-                    break
-                    
-                size_needed = target_size - pos_usd
-                if size_needed <= 0:
-                    break
-                    
-                if size_needed > max_usd_order_size: 
-                    chunk_size = max_usd_order_size
-                else: 
-                    chunk_size = size_needed
-                chunk_size = int(chunk_size * 10**6)
-                chunk_size = str(chunk_size)
-
-            except:
-                cprint("❌ AI Agent encountered critical error, manual intervention needed", "white", "on_red")
-                return
+        # Break if we're at or above target
+        if pos_usd >= fill_target:
+            break
+
+        # Recalculate needed size
+        size_needed, chunk_size = _next_chunk_size(pos_usd, target_size)
+        if size_needed <= 0:
+            break
 
     cprint("✨ AI Agent completed position entry", "white", "on_blue")
 
 def get_token_balance_usd(token_mint_address):
     """Get the USD value of a token position for Moon Dev's wallet 🌙"""
     try:
-        # Get the position data using existing function
-        df = fetch_wallet_token_single(address, token_mint_address)  # Using address from config
-        
-        if df.empty:
+        usd_value = _wallet_usd_values(address).get(token_mint_address)  # Using address from config
+        if usd_value is None:
             print(f"🔍 No position found for {token_mint_address[:8]}")
             return 0.0
-            
-        # Get the USD Value from the dataframe
-        usd_value = df['USD Value'].iloc[0]
-        return float(usd_value)
+        return usd_value
         
     except Exception as e:
         print(f"❌ Error getting token balance: {str(e)}")
@@ -7,9 +7,16 @@ Built with love by Moon Dev 🚀
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import numpy as np
 import time
+import json
+import orjson  # Faster encode/decode for the info POSTs and feed messages
+import threading
+from collections import deque
+import websocket  # websocket-client - threaded, so it fits the sync agents
 import pandas_ta as ta  # For technical indicators
 import traceback
 
@@ -18,9 +25,30 @@ BATCH_SIZE = 5000  # MAX IS 5000 FOR HYPERLIQUID
 MAX_RETRIES = 3
 MAX_ROWS = 5000
 BASE_URL = 'https://api.hyperliquid.xyz/info'
+WS_URL = 'wss://api.hyperliquid.xyz/ws'
+WS_RECONNECT_SECONDS = 5  # Wait before redialing a dropped candle feed
+NUMERIC_COLS = ['open', 'high', 'low', 'close', 'volume']  # OHLCV columns kept as float64
+CANDLE_KEYS = {'open': 'o', 'high': 'h', 'low': 'l', 'close': 'c', 'volume': 'v'}  # DataFrame column -> Hyperliquid candle field
+MARKET_INFO_TTL = 1.0  # Seconds a REST allMids response is reused before POSTing again
+
+# One keep-alive session for every Hyperliquid POST, so repeat calls skip the TCP+TLS handshake.
+# The info endpoint is read-only, so POSTs are safe to retry - urllib3 handles the backoff.
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=MAX_RETRIES,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False,  # Callers still see the final status code
+    ),
+))
 
 # Global variable to store timestamp offset
 timestamp_offset = None
+timestamp_offset_ms = 0  # Same offset in whole milliseconds, so candles are adjusted with plain int math
 
 def adjust_timestamp(dt):
     """Adjust API timestamps by subtracting the timestamp offset."""
@@ -29,9 +57,13 @@ def adjust_timestamp(dt):
         return corrected_dt
     return dt
 
+def _adjust_candle_ms(t):
+    """Candle open time (ms) with the timestamp offset applied - shared by the REST and WebSocket paths"""
+    return t - timestamp_offset_ms
+
 def _get_ohlcv(symbol, interval, start_time, end_time, batch_size=BATCH_SIZE):
     """Internal function to fetch OHLCV data from Hyperliquid"""
-    global timestamp_offset
+    global timestamp_offset, timestamp_offset_ms
     print(f'\n🔍 Requesting data for {symbol}:')
     print(f'📊 Batch Size: {batch_size}')
     print(f'🚀 Start: {start_time.strftime("%Y-%m-%d %H:%M:%S")} UTC')
@@ -40,76 +72,70 @@ def _get_ohlcv(symbol, interval, start_time, end_time, batch_size=BATCH_SIZE):
     start_ts = int(start_time.timestamp() * 1000)
     end_ts = int(end_time.timestamp() * 1000)
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            response = requests.post(
-                BASE_URL,
-                headers={'Content-Type': 'application/json'},
-                json={
-                    "type": "candleSnapshot",
-                    "req": {
-                        "coin": symbol,
-                        "interval": interval,
-                        "startTime": start_ts,
-                        "endTime": end_ts,
-                        "limit": batch_size
-                    }
-                },
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                snapshot_data = response.json()
-                if snapshot_data:
-                    # Handle timestamp offset
-                    if timestamp_offset is None:
-                        latest_api_timestamp = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
-                        system_current_date = datetime.utcnow()
-                        expected_latest_timestamp = system_current_date
-                        timestamp_offset = latest_api_timestamp - expected_latest_timestamp
-                        print(f"⏱️ Calculated timestamp offset: {timestamp_offset}")
-
-                    # Adjust timestamps
+    try:
+        response = HTTP_SESSION.post(
+            BASE_URL,
+            headers={'Content-Type': 'application/json'},
+            data=orjson.dumps({
+                "type": "candleSnapshot",
+                "req": {
+                    "coin": symbol,
+                    "interval": interval,
+                    "startTime": start_ts,
+                    "endTime": end_ts,
+                    "limit": batch_size
+                }
+            }),
+            timeout=10
+        )
+
+        if response.status_code == 200:
+            snapshot_data = orjson.loads(response.content)
+            if snapshot_data:
+                # Handle timestamp offset
+                if timestamp_offset is None:
+                    latest_api_timestamp = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
+                    system_current_date = datetime.utcnow()
+                    expected_latest_timestamp = system_current_date
+                    timestamp_offset = latest_api_timestamp - expected_latest_timestamp
+                    timestamp_offset_ms = timestamp_offset // timedelta(milliseconds=1)
+                    print(f"⏱️ Calculated timestamp offset: {timestamp_offset}")
+
+                # Adjust timestamps
+                if timestamp_offset_ms:
                     for candle in snapshot_data:
-                        dt = datetime.utcfromtimestamp(candle['t'] / 1000)
-                        adjusted_dt = adjust_timestamp(dt)
-                        candle['t'] = int(adjusted_dt.timestamp() * 1000)
-
-                    first_time = datetime.utcfromtimestamp(snapshot_data[0]['t'] / 1000)
-                    last_time = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
-                    print(f'✨ Received {len(snapshot_data)} candles')
-                    print(f'📈 First: {first_time}')
-                    print(f'📉 Last: {last_time}')
-                    return snapshot_data
-                print('❌ No data returned by API')
-                return None
-            print(f'⚠️ HTTP Error {response.status_code}: {response.text}')
-        except requests.exceptions.RequestException as e:
-            print(f'⚠️ Request failed (attempt {attempt + 1}): {e}')
-            time.sleep(1)
+                        candle['t'] -= timestamp_offset_ms
+
+                first_time = datetime.utcfromtimestamp(snapshot_data[0]['t'] / 1000)
+                last_time = datetime.utcfromtimestamp(snapshot_data[-1]['t'] / 1000)
+                print(f'✨ Received {len(snapshot_data)} candles')
+                print(f'📈 First: {first_time}')
+                print(f'📉 Last: {last_time}')
+                return snapshot_data
+            print('❌ No data returned by API')
+            return None
+        print(f'⚠️ HTTP Error {response.status_code}: {response.text}')
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+        print(f'⚠️ Request failed after {MAX_RETRIES} retries: {e}')
     return None
 
+def _ensure_float64(df):
+    """Cast the OHLCV columns to float64 - skipped when they already are, which is the usual case"""
+    if not all(df[c].dtype == np.float64 for c in NUMERIC_COLS):
+        df[NUMERIC_COLS] = df[NUMERIC_COLS].astype('float64', copy=False)
+    return df
+
 def _process_data_to_df(snapshot_data):
     """Convert raw API data to DataFrame"""
     if snapshot_data:
-        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-        data = []
-        for snapshot in snapshot_data:
-            timestamp = datetime.utcfromtimestamp(snapshot['t'] / 1000)
-            # Convert all numeric values to float
-            data.append([
-                timestamp,
-                float(snapshot['o']),
-                float(snapshot['h']),
-                float(snapshot['l']),
-                float(snapshot['c']),
-                float(snapshot['v'])
-            ])
-        df = pd.DataFrame(data, columns=columns)
-        
-        # Ensure numeric columns are float64
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_cols] = df[numeric_cols].astype('float64')
+        # One typed array per column - no per-row Python loop or float() calls
+        n = len(snapshot_data)
+        ts = np.fromiter((c['t'] for c in snapshot_data), dtype=np.int64, count=n)
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(ts, unit='ms'),
+            **{col: np.fromiter((c[key] for c in snapshot_data), dtype=np.float64, count=n)
+               for col, key in CANDLE_KEYS.items()}
+        })
         
         print("\n📊 OHLCV Data Types:")
         print(df.dtypes)
@@ -125,22 +151,17 @@ def add_technical_indicators(df):
     try:
         print("\n🔧 Adding technical indicators...")
         
-        # Ensure numeric columns are float64
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        df[numeric_cols] = df[numeric_cols].astype('float64')
+        df = _ensure_float64(df)
         
         # Add basic indicators
         df['sma_20'] = ta.sma(df['close'], length=20)
         df['sma_50'] = ta.sma(df['close'], length=50)
         df['rsi'] = ta.rsi(df['close'], length=14)
         
-        # Add MACD
-        macd = ta.macd(df['close'])
-        df = pd.concat([df, macd], axis=1)
-        
-        # Add Bollinger Bands
-        bbands = ta.bbands(df['close'])
-        df = pd.concat([df, bbands], axis=1)
+        # Add MACD and Bollinger Bands - columns are written straight onto df instead of concat-ing a new frame
+        for indicator in (ta.macd(df['close']), ta.bbands(df['close'])):
+            for col in indicator.columns:
+                df[col] = indicator[col].values
         
         print("✅ Technical indicators added successfully")
         return df
@@ -150,6 +171,99 @@ def add_technical_indicators(df):
         traceback.print_exc()
         return df
 
+class CandleCache:
+    """Rolling candles for one coin/interval, kept live by the Hyperliquid WebSocket feed after a single REST backfill"""
+    def __init__(self, symbol, interval, maxlen=MAX_ROWS):
+        self.symbol = symbol
+        self.interval = interval
+        self.candles = deque(maxlen=maxlen)
+        self.lock = threading.Lock()
+        self.connected = False
+        self.backfilled = False
+        self._ws = websocket.WebSocketApp(
+            WS_URL,
+            on_open=self._on_open,
+            on_message=self._on_message,
+            on_close=self._on_close,
+            on_error=self._on_error,
+        )
+        threading.Thread(
+            target=self._ws.run_forever,
+            kwargs={'ping_interval': 30, 'reconnect': WS_RECONNECT_SECONDS},
+            daemon=True,
+            name=f'hl-candles-{symbol}-{interval}',
+        ).start()
+
+    def _on_open(self, ws):
+        ws.send(json.dumps({
+            "method": "subscribe",
+            "subscription": {"type": "candle", "coin": self.symbol, "interval": self.interval}
+        }))
+        self.connected = True
+
+    def _on_close(self, ws, *args):
+        # Anything could have been missed while we were away - force a fresh backfill
+        with self.lock:
+            self.connected = False
+            self.backfilled = False
+
+    def _on_error(self, ws, error):
+        print(f"⚠️ Candle feed error for {self.symbol} {self.interval}: {error}")
+        self._on_close(ws)
+
+    def _on_message(self, ws, message):
+        msg = orjson.loads(message)
+        if msg.get('channel') != 'candle':
+            return
+        candle = dict(msg['data'])
+        candle['t'] = _adjust_candle_ms(candle['t'])
+        with self.lock:
+            if self.candles and self.candles[-1]['t'] == candle['t']:
+                self.candles[-1] = candle  # Current bar still forming
+            elif not self.candles or candle['t'] > self.candles[-1]['t']:
+                self.candles.append(candle)
+
+    def backfill(self, snapshot_data):
+        """Seed the cache with REST candles - the feed only sends bars from now on"""
+        with self.lock:
+            self.candles.clear()
+            self.candles.extend(snapshot_data)
+            self.backfilled = True
+
+    def is_warm(self, bars):
+        return self.connected and self.backfilled and len(self.candles) >= bars
+
+    def snapshot(self, bars=None):
+        """Most recent bars as the same DataFrame _process_data_to_df builds from REST"""
+        with self.lock:
+            candles = list(self.candles)
+        return _process_data_to_df(candles[-bars:] if bars else candles)
+
+_candle_caches = {}
+_candle_caches_lock = threading.Lock()
+
+def get_candle_cache(symbol, interval):
+    """The live CandleCache for symbol/interval - the feed is opened on first use"""
+    key = (symbol, interval)
+    with _candle_caches_lock:
+        if key not in _candle_caches:
+            _candle_caches[key] = CandleCache(symbol, interval)
+        return _candle_caches[key]
+
+_market_info = (0.0, None)  # (monotonic fetch time, last allMids response)
+
+def _cached_market_info():
+    """Last allMids response if it is younger than MARKET_INFO_TTL, else None"""
+    fetched_at, data = _market_info
+    if data is not None and time.monotonic() - fetched_at < MARKET_INFO_TTL:
+        return data
+    return None
+
+def _store_market_info(data):
+    global _market_info
+    _market_info = (time.monotonic(), data)
+    return data
+
 def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
     """
     🌙 Moon Dev's Hyperliquid Data Fetcher
@@ -172,23 +286,31 @@ def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
     # Ensure we don't exceed max rows
     bars = min(bars, MAX_ROWS)
     
-    # Calculate time window
-    end_time = datetime.utcnow()
-    # Add extra time to ensure we get enough bars
-    start_time = end_time - timedelta(days=60)
+    # Live feed first - REST only for the initial backfill (or after the feed dropped)
+    cache = get_candle_cache(symbol, timeframe)
+    if cache.is_warm(bars):
+        print("⚡ Using live candle feed")
+        df = cache.snapshot(bars)
+    else:
+        # Calculate time window
+        end_time = datetime.utcnow()
+        # Add extra time to ensure we get enough bars
+        start_time = end_time - timedelta(days=60)
 
-    data = _get_ohlcv(symbol, timeframe, start_time, end_time, batch_size=bars)
-    
-    if not data:
-        print("❌ No data available.")
-        return pd.DataFrame()
+        data = _get_ohlcv(symbol, timeframe, start_time, end_time, batch_size=bars)
+
+        if not data:
+            print("❌ No data available.")
+            return pd.DataFrame()
 
-    df = _process_data_to_df(data)
+        cache.backfill(data)
+        df = _process_data_to_df(data)
 
     if not df.empty:
-        # Get the most recent bars
-        df = df.sort_values('timestamp', ascending=False).head(bars).sort_values('timestamp')
-        df = df.reset_index(drop=True)
+        # Get the most recent bars - candles already arrive in time order, so only sort if they didn't
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', ignore_index=True)
+        df = df.iloc[-bars:].reset_index(drop=True)
         
         # Add technical indicators if requested
         if add_indicators:
@@ -202,19 +324,22 @@ def get_data(symbol, timeframe='15m', bars=100, add_indicators=True):
     return df
 
 def get_market_info():
-    """Get current market info for all coins on Hyperliquid"""
+    """Get current market info for all coins on Hyperliquid - repeat calls within MARKET_INFO_TTL skip the POST"""
+    cached = _cached_market_info()
+    if cached is not None:
+        return cached
     try:
         print("\n🔄 Sending request to Hyperliquid API...")
-        response = requests.post(
+        response = HTTP_SESSION.post(
             BASE_URL,
             headers={'Content-Type': 'application/json'},
-            json={"type": "allMids"}
+            data=orjson.dumps({"type": "allMids"})
         )
         
         print(f"📡 Response status code: {response.status_code}")
         
         if response.status_code == 200:
-            data = response.json()
+            data = _store_market_info(orjson.loads(response.content))
             print(f"📦 Raw response data: {data}")
             return data
         print(f"❌ Bad status code: {response.status_code}")
@@ -273,14 +398,14 @@ def get_funding_rates(symbol):
     """
     try:
         print(f"\n🔄 Fetching funding rate for {symbol}...")
-        response = requests.post(
+        response = HTTP_SESSION.post(
             BASE_URL,
             headers={'Content-Type': 'application/json'},
-            json={"type": "metaAndAssetCtxs"}
+            data=orjson.dumps({"type": "metaAndAssetCtxs"})
         )
         
         if response.status_code == 200:
-            data = response.json()
+            data = orjson.loads(response.content)
             if len(data) >= 2 and isinstance(data[0], dict) and isinstance(data[1], list):
                 # Get universe (symbols) from first element
                 universe = {coin['name']: i for i, coin in enumerate(data[0]['universe'])}
@@ -6,11 +6,23 @@ Runs every 24 hours to maintain an updated list.
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import json
+import orjson
+import csv
 from typing import Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 import time
+import random
+import threading
+import atexit
+from collections import deque
+import logging
+from logging.handlers import RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from dotenv import load_dotenv
 from termcolor import colored, cprint
@@ -20,21 +32,68 @@ load_dotenv()
 
 # ⚙️ Configuration Constants
 HOURS_BETWEEN_RUNS = 24
-MAJOR_EXCHANGES = ['binance', 'coinbase']  # Exchanges to exclude
+MAJOR_EXCHANGES = frozenset({'binance', 'coinbase'})  # Exchanges to exclude
 MIN_VOLUME_USD = 100_000  # Minimum 24h volume in USD
-SLEEP_ON_RATE_LIMIT = 60  # Seconds to sleep when rate limited
+MAX_RETRIES = 5  # Attempts per request before giving up
+RPM_LIMIT = int(os.getenv("COINGECKO_RPM", 500))  # Client-side cap on calls per rolling minute - set to your plan's limit
+DAILY_CALL_BUDGET = int(os.getenv("COINGECKO_DAILY_BUDGET", 15_000))  # Calls per UTC day, counted across restarts - keep it under your monthly plan / 30
+QUOTA_FLUSH_EVERY = 10  # Write the call counter to disk every N calls
+BACKOFF_BASE = 1  # Seconds - first rate-limit wait when there's no Retry-After header, doubled per attempt
+BACKOFF_CAP = 30  # Seconds - longest single backoff
+RATE_LIMIT_RESERVE = 5  # Start slowing down once x-ratelimit-remaining drops to this
+INTERVAL_STEP = 0.5  # Seconds shaved off the pacing gap after each success (additive speed-up)
+MAX_INTERVAL = 10  # Seconds - widest pacing gap between calls
+PAGE_SIZE = 250  # Tokens per coins/markets page (CoinGecko's max)
+MAX_CONCURRENT_PAGES = 5  # Market pages requested at once
+MAX_CONCURRENT_LOOKUPS = 10  # Exchange lookups in flight at once - the pacing gap still throttles them on 429s
 
 # 🚫 Tokens to Skip (e.g. stablecoins, wrapped tokens)
-DO_NOT_ANALYZE = [
+DO_NOT_ANALYZE = frozenset({
     'tether',           # USDT
     'usdt',            # Alternative USDT id
     'usdtsolana',      # Solana USDT
     'wrapped-solana',   # Wrapped SOL
     'usdc',            # USDC
-]
+})
 
 # 📁 File Paths
 DISCOVERED_TOKENS_FILE = Path("src/data/discovered_tokens.csv")
+DISCOVERED_TOKENS_FIELDS = ['token_id', 'symbol', 'name', 'price', 'volume_24h', 'market_cap', 'discovered_at']
+COMPACT_EVERY_SAVES = 7  # Rewrite the CSV from the latest round every Nth save (and the first after startup) - refreshes values, prunes dropped tokens
+TICKER_CACHE_FILE = Path("src/data/ticker_cache.json")  # {token_id: {"exchanges": [...], "fetched_at": ts}}
+TICKER_CACHE_TTL = 7 * 24 * 3600  # Seconds - exchange listings change slowly
+QUOTA_FILE = Path("src/data/.cg_quota.json")  # {"date": "YYYY-MM-DD", "calls": N} - today's CoinGecko usage
+
+TOKEN_FINDER_LOG_FILE = Path("src/data/token_finder.log")  # Full per-token trail, whatever the console level
+
+def _token_finder_logger():
+    """Per-token decisions go to a rotating log file; the console only shows LOG_LEVEL and up (INFO by default)"""
+    logger = logging.getLogger("moondev.tokenfinder")
+    if not logger.handlers:
+        TOKEN_FINDER_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(TOKEN_FINDER_LOG_FILE, maxBytes=5_000_000, backupCount=3, encoding="utf-8", delay=True)
+        file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        console = logging.StreamHandler()
+        console.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+        console.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(file_handler)
+        logger.addHandler(console)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+    return logger
+
+log = _token_finder_logger()
+
+class QuotaExhausted(Exception):
+    """Today's DAILY_CALL_BUDGET is used up - retry_after is the number of seconds until the budget resets at midnight UTC"""
+    def __init__(self, retry_after):
+        super().__init__(f"Daily CoinGecko budget of {DAILY_CALL_BUDGET} calls used up - resets in {retry_after / 3600:.1f}h")
+        self.retry_after = retry_after
+
+def _seconds_until_utc_midnight():
+    now = datetime.now(timezone.utc)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (midnight - now).total_seconds()
 
 class CoinGeckoTokenFinder:
     """Utility class for finding promising Solana tokens 🦎"""
@@ -49,59 +108,190 @@ class CoinGeckoTokenFinder:
             "x-cg-pro-api-key": self.api_key,
             "Content-Type": "application/json"
         }
+        # One pooled keep-alive session - lookups skip the TCP+TLS handshake. urllib3 only retries
+        # gateway errors; 429s are left to _make_request so the adaptive pacing sees them
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=MAX_CONCURRENT_LOOKUPS,
+            max_retries=Retry(total=3, backoff_factor=1.0, status_forcelist=[502, 503, 504], raise_on_status=False),
+        ))
         self.api_calls = 0
+        self._min_interval = 0.0  # Pacing gap between calls - doubles on 429, shrinks by INTERVAL_STEP on success
+        self._last_call = 0.0
+        self._pace_lock = threading.Lock()  # Lookups run on a thread pool - pacing state is shared
+        self._call_times = deque()  # Send times of the calls in the last 60s, for the RPM_LIMIT window
+        self._ticker_cache = self._load_ticker_cache()
+        self._quota = self._load_quota()
+        self._saves = 0  # save_discovered_tokens calls this process - drives the periodic compaction
+        atexit.register(self._save_quota)
         print("🦎 Moon Dev's CoinGecko Token Finder initialized!")
         
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
-        """Make API request with rate limiting and error handling"""
+    def _load_quota(self) -> Dict:
+        """Today's persisted call count - a new UTC day starts from zero"""
+        today = datetime.now(timezone.utc).date().isoformat()
         try:
-            self.api_calls += 1
-            cprint(f"\n🔄 API Call #{self.api_calls} - Endpoint: {endpoint}", "white", "on_blue")
-            
-            url = f"{self.base_url}/{endpoint}"
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code == 429:
-                print(f"⚠️ Rate limit hit! Sleeping {SLEEP_ON_RATE_LIMIT} seconds...")
-                time.sleep(SLEEP_ON_RATE_LIMIT)
-                return self._make_request(endpoint, params)
-                
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ API request failed: {str(e)}")
-            return {}
+            with open(QUOTA_FILE) as f:
+                quota = json.load(f)
+            if quota.get('date') == today:
+                return quota
+        except (OSError, ValueError):
+            pass
+        return {'date': today, 'calls': 0}
+
+    def _save_quota(self):
+        try:
+            QUOTA_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(QUOTA_FILE, "w") as f:
+                json.dump(self._quota, f)
+        except OSError as e:
+            log.warning(f"⚠️ Couldn't save CoinGecko quota: {str(e)}")
+
+    def _count_call(self):
+        """Charge one call to today's budget (caller holds _pace_lock) - raises QuotaExhausted once it's spent"""
+        today = datetime.now(timezone.utc).date().isoformat()
+        if self._quota['date'] != today:
+            self._quota = {'date': today, 'calls': 0}
+        if self._quota['calls'] >= DAILY_CALL_BUDGET:
+            self._save_quota()
+            raise QuotaExhausted(_seconds_until_utc_midnight())
+        self._quota['calls'] += 1
+        if self._quota['calls'] % QUOTA_FLUSH_EVERY == 0:
+            self._save_quota()
+
+    def _retry_after(self, response, attempt: int) -> float:
+        """Seconds to wait after a 429 - the server's Retry-After if it sent one, else capped exponential backoff with jitter"""
+        header = response.headers.get("Retry-After")
+        if header:
+            try:
+                return float(header)
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(header).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt) * (1 + random.random())
+
+    def _slow_down(self):
+        with self._pace_lock:
+            self._min_interval = min(MAX_INTERVAL, max(self._min_interval * 2, INTERVAL_STEP))
+
+    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """Make API request with adaptive pacing, Retry-After aware backoff and error handling"""
+        url = f"{self.base_url}/{endpoint}"
+        for attempt in range(MAX_RETRIES):
+            try:
+                # Keep at least the current pacing gap since the previous call - claim our slot under the lock, sleep outside it
+                with self._pace_lock:
+                    self._count_call()
+                    now = time.monotonic()
+                    slot = max(now, self._last_call + self._min_interval)
+                    # Sliding one-minute window - wait for the oldest call to age out rather than hit a 429
+                    while self._call_times and slot - self._call_times[0] >= 60:
+                        self._call_times.popleft()
+                    if len(self._call_times) >= RPM_LIMIT:
+                        slot = max(slot, self._call_times[0] + 60)
+                        self._call_times.popleft()
+                    self._call_times.append(slot)
+                    self._last_call = slot
+                    self.api_calls += 1
+                    call_number = self.api_calls
+                if slot > now:
+                    time.sleep(slot - now)
+
+                cprint(f"\n🔄 API Call #{call_number} - Endpoint: {endpoint}", "white", "on_blue")
+                response = self.session.get(url, params=params)
+
+                if response.status_code == 429:
+                    # Multiplicative decrease - halve our request rate
+                    self._slow_down()
+                    delay = self._retry_after(response, attempt)
+                    print(f"⚠️ Rate limit hit! Sleeping {delay:.1f} seconds (attempt {attempt + 1}/{MAX_RETRIES})...")
+                    time.sleep(delay)
+                    continue
+
+                response.raise_for_status()
+
+                # Additive increase - creep back up, unless the quota headers say we're nearly out
+                remaining = response.headers.get("x-ratelimit-remaining")
+                if remaining is not None and remaining.isdigit() and int(remaining) <= RATE_LIMIT_RESERVE:
+                    self._slow_down()
+                else:
+                    with self._pace_lock:
+                        self._min_interval = max(0.0, self._min_interval - INTERVAL_STEP)
+                return orjson.loads(response.content)
+
+            except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+                print(f"❌ API request failed: {str(e)}")
+                return {}
+
+        print(f"❌ Still rate limited after {MAX_RETRIES} attempts - giving up on {endpoint}")
+        return {}
             
+    def _get_markets_page(self, page: int) -> List[Dict]:
+        """One page of Solana ecosystem tokens with market data"""
+        params = {
+            'vs_currency': 'usd',
+            'category': 'solana-ecosystem',
+            'order': 'volume_desc',
+            'per_page': PAGE_SIZE,
+            'page': page,
+            'sparkline': False
+        }
+        return self._make_request("coins/markets", params)
+
     def get_solana_tokens(self) -> List[Dict]:
-        """Get all Solana tokens with market data"""
+        """Get all Solana tokens with market data - pages are fetched MAX_CONCURRENT_PAGES at a time"""
         print("\n🔍 Getting Solana tokens from CoinGecko...")
         all_tokens = []
         page = 1
         
-        while True:
-            params = {
-                'vs_currency': 'usd',
-                'category': 'solana-ecosystem',
-                'order': 'volume_desc',
-                'per_page': 250,
-                'page': page,
-                'sparkline': False
-            }
-            
-            tokens = self._make_request("coins/markets", params)
-            if not tokens:
-                break
-                
-            all_tokens.extend(tokens)
-            print(f"📊 Retrieved {len(tokens)} tokens from page {page}")
-            print(f"💫 Total tokens so far: {len(all_tokens)}")
-            page += 1
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES, thread_name_prefix='markets') as pool:
+            while True:
+                pages = range(page, page + MAX_CONCURRENT_PAGES)
+                done = False
+                for page_number, tokens in zip(pages, pool.map(self._get_markets_page, pages)):
+                    if not tokens:
+                        done = True
+                        break
+                    all_tokens.extend(tokens)
+                    print(f"📊 Retrieved {len(tokens)} tokens from page {page_number}")
+                    print(f"💫 Total tokens so far: {len(all_tokens)}")
+                    if len(tokens) < PAGE_SIZE:  # A short page is the last one
+                        done = True
+                        break
+                if done:
+                    break
+                page += MAX_CONCURRENT_PAGES
             
         return all_tokens
         
+    def _load_ticker_cache(self) -> Dict:
+        """Load cached exchange listings from previous runs"""
+        try:
+            with open(TICKER_CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_ticker_cache(self):
+        """Persist exchange listings so the next run only looks up new or stale tokens"""
+        try:
+            TICKER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = TICKER_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self._ticker_cache, f)
+            os.replace(tmp_path, TICKER_CACHE_FILE)
+        except OSError as e:
+            print(f"⚠️ Couldn't save ticker cache: {str(e)}")
+
     def check_token_exchanges(self, token_id: str) -> set:
-        """Get exchanges where a token is listed"""
+        """Get exchanges where a token is listed - served from the ticker cache while it's fresh"""
+        cached = self._ticker_cache.get(token_id)
+        if cached and time.time() - cached['fetched_at'] < TICKER_CACHE_TTL:
+            return set(cached['exchanges'])
+
         exchange_data = self._make_request(f"coins/{token_id}/tickers")
         exchanges = set()
         
@@ -109,6 +299,9 @@ class CoinGeckoTokenFinder:
             market = ticker.get('market', {})
             exchange_id = market.get('identifier', '').lower()
             exchanges.add(exchange_id)
+
+        if 'tickers' in exchange_data:  # Don't cache a failed lookup
+            self._ticker_cache[token_id] = {'exchanges': sorted(exchanges), 'fetched_at': time.time()}
             
         return exchanges
         
@@ -120,49 +313,76 @@ class CoinGeckoTokenFinder:
         
         # Load existing discovered tokens to avoid rechecking
         existing_tokens_df = self.load_discovered_tokens()
-        existing_token_ids = set(existing_tokens_df['token_id'].tolist()) if not existing_tokens_df.empty else set()
-        
+        # Index previous rows by token_id once - each cached hit is then a dict lookup, not a column scan
+        existing_index = (
+            existing_tokens_df.drop_duplicates('token_id').set_index('token_id').to_dict(orient='index')
+            if not existing_tokens_df.empty else {}
+        )
+
+        # Pass 1 - every check that needs no HTTP, so only the survivors cost an exchange lookup
+        candidates = []
         for token in tokens:
             try:
                 processed += 1
                 if processed % 10 == 0:
-                    print(f"⏳ Processed {processed}/{len(tokens)} tokens...")
+                    log.debug(f"⏳ Processed {processed}/{len(tokens)} tokens...")
                 
                 token_id = token.get('id', '').lower()
                 name = token.get('name', 'Unknown')
                 symbol = token.get('symbol', 'N/A').upper()
                 
                 # Skip if already discovered
-                if token_id in existing_token_ids:
-                    print(f"\n♻️ Using cached data for: {name} ({symbol})")
-                    matching_token = existing_tokens_df[existing_tokens_df['token_id'] == token_id].iloc[0]
+                if token_id in existing_index:
+                    log.debug(f"♻️ Using cached data for: {name} ({symbol})")
+                    matching_token = existing_index[token_id]
+                    # Skip the exchange re-check, but take this round's market numbers - the saved ones are from an earlier run
                     filtered_tokens.append({
                         'id': token_id,
                         'name': name,
                         'symbol': symbol,
-                        'current_price': matching_token['price'],
-                        'total_volume': matching_token['volume_24h'],
-                        'market_cap': matching_token['market_cap']
+                        'current_price': token.get('current_price', matching_token['price']),
+                        'total_volume': token.get('total_volume', matching_token['volume_24h']),
+                        'market_cap': token.get('market_cap', matching_token['market_cap'])
                     })
                     continue
                 
                 # Skip if in DO_NOT_ANALYZE list
                 if token_id in DO_NOT_ANALYZE:
-                    print(f"\n⏭️ Skipping {name} ({symbol}) - In DO_NOT_ANALYZE list")
+                    log.debug(f"⏭️ Skipping {name} ({symbol}) - In DO_NOT_ANALYZE list")
                     continue
                 
                 # Check volume requirement
                 volume_usd = float(token.get('total_volume', 0) or 0)
                 if volume_usd < MIN_VOLUME_USD:
-                    print(f"\n❌ Skipping {name} ({symbol}) - Volume too low: ${volume_usd:,.2f}")
+                    log.debug(f"❌ Skipping {name} ({symbol}) - Volume too low: ${volume_usd:,.2f}")
                     continue
                 
+                candidates.append(token)
+                
+            except Exception as e:
+                log.warning(f"⚠️ Error processing {token.get('name', 'Unknown')}: {str(e)}")
+                continue
+
+        # Pass 2 - exchange listings for the candidates only, fetched concurrently into the ticker cache first
+        if candidates:
+            print(f"\n🚀 Checking exchange listings for {len(candidates)} tokens ({MAX_CONCURRENT_LOOKUPS} at a time)...")
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LOOKUPS, thread_name_prefix='tickers') as pool:
+                for token in candidates:
+                    pool.submit(self.check_token_exchanges, token['id'].lower())  # A failed lookup is simply retried below
+        
+        for token in candidates:
+            try:
+                token_id = token['id'].lower()
+                name = token.get('name', 'Unknown')
+                symbol = token.get('symbol', 'N/A').upper()
+                volume_usd = float(token.get('total_volume', 0) or 0)
+                
                 # Check exchange listings
-                print(f"\n🔍 Checking new token: {name} ({symbol})")
+                log.debug(f"🔍 Checking new token: {name} ({symbol})")
                 exchanges = self.check_token_exchanges(token_id)
                 
-                if any(exchange in exchanges for exchange in MAJOR_EXCHANGES):
-                    print(f"⏭️ Skipping {name} ({symbol}) - Listed on major exchange")
+                if exchanges & MAJOR_EXCHANGES:
+                    log.debug(f"⏭️ Skipping {name} ({symbol}) - Listed on major exchange")
                     continue
                 
                 # Token passed all checks
@@ -170,42 +390,77 @@ class CoinGeckoTokenFinder:
                 price_str = f"${price:,.8f}" if price is not None else "N/A"
                 market_cap = float(token.get('market_cap', 0) or 0)
                 
-                print(f"\n✨ Found qualifying token: {name} ({symbol})")
-                print(f"💰 Price: {price_str}")
-                print(f"📊 24h Volume: ${volume_usd:,.2f}")
-                print(f"💎 Market Cap: ${market_cap:,.2f}")
-                print(f"🏢 Listed on: {', '.join(exchanges)}")
+                log.info(
+                    f"✨ Found qualifying token: {name} ({symbol}) | 💰 {price_str} | 📊 24h Vol ${volume_usd:,.2f} "
+                    f"| 💎 MCap ${market_cap:,.2f} | 🏢 {', '.join(exchanges)}"
+                )
                 
                 filtered_tokens.append(token)
                 
+            except QuotaExhausted:
+                raise  # Out of calls for today - abandon the round, main() waits for the reset
             except Exception as e:
-                print(f"⚠️ Error processing {token.get('name', 'Unknown')}: {str(e)}")
+                log.warning(f"⚠️ Error processing {token.get('name', 'Unknown')}: {str(e)}")
                 continue
                 
+        self._save_ticker_cache()
         print(f"\n🎯 Filtering complete!")
         print(f"✨ Found {len(filtered_tokens)} qualifying tokens")
         return filtered_tokens
         
     def save_discovered_tokens(self, tokens: List[Dict]):
-        """Save discovered tokens to CSV"""
+        """Append newly discovered tokens to the CSV - every COMPACT_EVERY_SAVES saves the file is rewritten from this round instead"""
         print("\n💾 Saving discovered tokens...")
         
-        df = pd.DataFrame([{
-            'token_id': token.get('id', 'unknown'),
-            'symbol': token.get('symbol', 'N/A'),
-            'name': token.get('name', 'Unknown'),
-            'price': token.get('current_price'),
-            'volume_24h': token.get('total_volume', 0),
-            'market_cap': token.get('market_cap', 0),
-            'discovered_at': datetime.now().isoformat()
-        } for token in tokens])
-        
         # Ensure directory exists
         DISCOVERED_TOKENS_FILE.parent.mkdir(parents=True, exist_ok=True)
         
-        # Save to CSV
-        df.to_csv(DISCOVERED_TOKENS_FILE, index=False)
-        print(f"✨ Saved {len(tokens)} tokens to {DISCOVERED_TOKENS_FILE}")
+        first_seen = {}
+        if DISCOVERED_TOKENS_FILE.exists():
+            with open(DISCOVERED_TOKENS_FILE, newline='') as f:
+                first_seen = {row['token_id']: row['discovered_at'] for row in csv.DictReader(f)}
+        
+        compact = self._saves % COMPACT_EVERY_SAVES == 0
+        self._saves += 1
+        
+        discovered_at = datetime.now().isoformat()
+        rows = []
+        seen = set()
+        for token in tokens:
+            token_id = token.get('id', 'unknown')
+            if token_id in seen or (token_id in first_seen and not compact):
+                continue
+            seen.add(token_id)
+            # Plain tuples in DISCOVERED_TOKENS_FIELDS order - no per-row dict for the writer to look up
+            rows.append((
+                token_id,
+                token.get('symbol', 'N/A'),
+                token.get('name', 'Unknown'),
+                token.get('current_price'),
+                token.get('total_volume', 0),
+                token.get('market_cap', 0),
+                first_seen.get(token_id, discovered_at)
+            ))
+        
+        if compact:
+            # Rewrite from this round only - fresh numbers for every token, and ones that no longer qualify drop out
+            tmp_file = DISCOVERED_TOKENS_FILE.with_suffix('.tmp')
+            with open(tmp_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(DISCOVERED_TOKENS_FIELDS)
+                writer.writerows(rows)
+            os.replace(tmp_file, DISCOVERED_TOKENS_FILE)  # Atomic - a crash mid-write never leaves a half file
+            print(f"✨ Compacted {DISCOVERED_TOKENS_FILE} to this round's {len(rows)} tokens")
+            return
+        
+        # Append only the new rows - write the header if we're starting the file
+        write_header = not DISCOVERED_TOKENS_FILE.exists() or DISCOVERED_TOKENS_FILE.stat().st_size == 0
+        with open(DISCOVERED_TOKENS_FILE, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(DISCOVERED_TOKENS_FIELDS)
+            writer.writerows(rows)
+        print(f"✨ Saved {len(rows)} new tokens to {DISCOVERED_TOKENS_FILE} ({len(first_seen) + len(rows)} total)")
         
     def load_discovered_tokens(self) -> pd.DataFrame:
         """Load previously discovered tokens"""
@@ -228,8 +483,14 @@ def main():
             print(f"\n🔄 Starting new token discovery round at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
             
             # Get and filter tokens
-            tokens = finder.get_solana_tokens()
-            filtered_tokens = finder.filter_tokens(tokens)
+            try:
+                tokens = finder.get_solana_tokens()
+                filtered_tokens = finder.filter_tokens(tokens)
+            except QuotaExhausted as e:
+                finder._save_ticker_cache()  # Keep the lookups this round did pay for
+                print(f"\n🛑 {str(e)} - sleeping until then")
+                time.sleep(e.retry_after)
+                continue
             
             # Save results
             finder.save_discovered_tokens(filtered_tokens)
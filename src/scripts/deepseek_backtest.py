@@ -5,6 +5,16 @@ from backtesting.lib import crossover
 from backtesting.test import SMA
 import numpy as np
 
+def rolling_sum(values, window):
+    """Trailing window sums via cumsum differences, NaN-padded at the front to match len(values)"""
+    values = np.asarray(values, dtype=np.float64)
+    csum = np.cumsum(values)
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1] = csum[window - 1]
+        out[window:] = csum[window:] - csum[:-window]
+    return out
+
 class VWAPVolumeStrategy(Strategy):
     # Define the parameters for the strategy
     vwap_window = 20  # VWAP calculation window
@@ -15,29 +25,35 @@ class VWAPVolumeStrategy(Strategy):
         typical_price = (self.data.High + self.data.Low + self.data.Close) / 3
         volume = self.data.Volume
         
-        # Create rolling sum arrays
-        rolling_sum_price_volume = np.convolve(typical_price * volume, np.ones(self.vwap_window), 'valid')
-        rolling_sum_volume = np.convolve(volume, np.ones(self.vwap_window), 'valid')
+        # One cumulative-sum pass per series gives every window sum - no per-window multiply-accumulate
+        rolling_sum_price_volume = rolling_sum(typical_price * volume, self.vwap_window)
+        rolling_sum_volume = rolling_sum(volume, self.vwap_window)
+        
+        # Sums stay float64 (cumsum differences need the precision), the finished series are stored as float32
+        n = len(rolling_sum_volume)
+        self.vwap = np.divide(rolling_sum_price_volume, rolling_sum_volume, out=np.empty(n, dtype=np.float32), casting='same_kind')
         
-        # Pad the arrays to match original length
-        pad_length = len(typical_price) - len(rolling_sum_price_volume)
-        self.vwap = np.pad(rolling_sum_price_volume / rolling_sum_volume, (pad_length, 0), 'constant', constant_values=np.nan)
+        # Calculate average volume from the same rolling volume sum
+        self.avg_volume = np.divide(rolling_sum_volume, self.vwap_window, out=np.empty(n, dtype=np.float32), casting='same_kind')
         
-        # Calculate average volume
-        self.avg_volume = np.convolve(volume, np.ones(self.vwap_window), 'valid') / self.vwap_window
-        self.avg_volume = np.pad(self.avg_volume, (pad_length, 0), 'constant', constant_values=np.nan)
+        # Both entry signals for every bar in one vectorized pass - next() just reads the current bar's flag.
+        # Wrapped in self.I so next() sees the value as of the current bar, not the end of the data
+        close = self.data.Close
+        high_volume = self.data.Volume > self.volume_threshold * self.avg_volume
+        self.long_signal = self.I(lambda: (close > self.vwap) & high_volume, name='long_signal', plot=False)
+        self.short_signal = self.I(lambda: (close < self.vwap) & high_volume, name='short_signal', plot=False)
         
         print("🌙 MOON DEV: VWAP and Volume calculations initialized successfully! 🚀")
 
     def next(self):
         # Go long if the closing price is above VWAP and volume is above the threshold
-        if self.data.Close[-1] > self.vwap[-1] and self.data.Volume[-1] > self.volume_threshold * self.avg_volume[-1]:
+        if self.long_signal[-1]:
             if not self.position.is_long:
                 self.buy()  # Enter long position
                 print("🌕 MOON DEV: Long position entered! 🚀📈")
 
         # Go short if the closing price is below VWAP and volume is above the threshold
-        elif self.data.Close[-1] < self.vwap[-1] and self.data.Volume[-1] > self.volume_threshold * self.avg_volume[-1]:
+        elif self.short_signal[-1]:
             if not self.position.is_short:
                 self.sell()  # Enter short position
                 print("🌑 MOON DEV: Short position entered! 🚀📉")
@@ -13,6 +13,9 @@ This script helps you calculate:
 All major variables are configurable.
 """
 
+import numpy as np
+import pandas as pd
+
 def funding_arbitrage_calculator(
     slippage=0.005,           # e.g. 0.5% slippage in decimal form
     fees=0.001,               # e.g. 0.1% total round-trip fees in decimal
@@ -86,6 +89,44 @@ def funding_arbitrage_calculator(
         'hours_for_desired_profit': hours_for_desired_profit
     }
 
+def funding_arb_grid(
+    slippage=0.005,
+    fees=0.001,
+    annual_rates=np.linspace(0.1, 5.0, 50),
+    hold_hours=np.arange(1, 169),
+    desired_profit=0.002
+):
+    """
+    Vectorized funding_arbitrage_calculator over every annual_rates x hold_hours pair.
+    The whole grid is computed in one broadcast NumPy pass and returned as a long DataFrame
+    (one row per pair) with the same metric names as the scalar calculator.
+    """
+    annual = np.asarray(annual_rates, dtype=np.float64)[:, None]
+    hours = np.asarray(hold_hours, dtype=np.float64)[None, :]
+    shape = (annual.shape[0], hours.shape[1])
+
+    total_cost = slippage + fees
+    hourly = annual / 8760.0
+    total_funding_earned = hours * hourly
+    net_result = total_funding_earned - total_cost
+
+    # Zero rates / zero hold times map to inf with a mask instead of per-cell branches
+    hours_to_break_even = np.divide(total_cost, hourly, out=np.full_like(hourly, np.inf), where=hourly > 0)
+    annual_rate_for_break_even = np.divide(total_cost * 8760.0, hours, out=np.full_like(hours, np.inf), where=hours > 0)
+    hours_for_desired_profit = np.divide(total_cost + desired_profit, hourly, out=np.full_like(hourly, np.inf), where=hourly > 0)
+
+    return pd.DataFrame({
+        'annual_funding_rate_decimal': np.broadcast_to(annual, shape).ravel(),
+        'hold_hours': np.broadcast_to(hours, shape).ravel(),
+        'total_cost_decimal': total_cost,
+        'hourly_funding_rate_decimal': np.broadcast_to(hourly, shape).ravel(),
+        'total_funding_earned_decimal': total_funding_earned.ravel(),
+        'net_result_decimal': net_result.ravel(),
+        'hours_to_break_even': np.broadcast_to(hours_to_break_even, shape).ravel(),
+        'annual_rate_for_break_even_in_hold_decimal': np.broadcast_to(annual_rate_for_break_even, shape).ravel(),
+        'hours_for_desired_profit': np.broadcast_to(hours_for_desired_profit, shape).ravel(),
+    })
+
 def print_calculator_results(results):
     """
     Nicely format and print the results from funding_arbitrage_calculator().
@@ -7,9 +7,11 @@ it uses the helius rpc so for RPC_ENDPOINT you need to set the helius rpc endpoi
 
 import os
 import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict
-import time
 
 # List of wallets to track - Add your wallet addresses here! 🎯
 WALLETS_TO_TRACK = [
@@ -17,48 +19,97 @@ WALLETS_TO_TRACK = [
     # Add more wallets here...
 ]
 
+TOKEN_PROGRAM_ID = "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
+RPC_BATCH_SIZE = 50  # Wallets per JSON-RPC batch POST - keeps the body well under Helius's size limits
+
+def _token_accounts_call(wallet_address: str, request_id) -> Dict:
+    """One getTokenAccountsByOwner JSON-RPC call object"""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "getTokenAccountsByOwner",
+        "params": [
+            wallet_address,
+            {
+                "programId": TOKEN_PROGRAM_ID
+            },
+            {
+                "encoding": "jsonParsed"
+            }
+        ]
+    }
+
 class TokenAccountTracker:
     def __init__(self):
         self.rpc_endpoint = os.getenv("RPC_ENDPOINT")
         if not self.rpc_endpoint:
             raise ValueError("⚠️ Please set RPC_ENDPOINT environment variable!")
+        # Keep-alive session for every RPC call - getTokenAccountsByOwner is read-only, so POSTs are safe to retry
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=4,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1.0,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset({'POST'}),
+                respect_retry_after_header=True,
+            ),
+        ))
         print(f"🌐 Connected to Helius RPC endpoint... Moon Dev is ready! 🚀")
 
     def get_token_accounts(self, wallet_address: str) -> Dict:
         """Get all token accounts for a specific wallet address"""
         print(f"🔍 Moon Dev is fetching token accounts for {wallet_address}...")
         
-        payload = {
-            "jsonrpc": "2.0",
-            "id": "moon-dev-rocks",
-            "method": "getTokenAccountsByOwner",
-            "params": [
-                wallet_address,
-                {
-                    "programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"
-                },
-                {
-                    "encoding": "jsonParsed"
-                }
-            ]
-        }
+        payload = _token_accounts_call(wallet_address, "moon-dev-rocks")
 
         try:
-            response = requests.post(self.rpc_endpoint, json=payload)
+            response = self.session.post(self.rpc_endpoint, json=payload)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             print(f"❌ Error fetching token accounts: {str(e)}")
             return None
 
+    def get_token_accounts_batch(self, wallet_addresses: List[str]) -> Dict:
+        """Token accounts for many wallets - one JSON-RPC batch POST per RPC_BATCH_SIZE wallets, matched back by id"""
+        responses = {}
+        for start in range(0, len(wallet_addresses), RPC_BATCH_SIZE):
+            chunk = wallet_addresses[start:start + RPC_BATCH_SIZE]
+            print(f"🔍 Moon Dev is fetching token accounts for {len(chunk)} wallets in one batch...")
+            payload = [_token_accounts_call(wallet, i) for i, wallet in enumerate(chunk)]
+            try:
+                response = self.session.post(self.rpc_endpoint, json=payload)
+                response.raise_for_status()
+                items = orjson.loads(response.content)
+            except Exception as e:
+                print(f"❌ Error fetching token accounts batch: {str(e)}")
+                continue
+            if not isinstance(items, list):  # Rate-limit / "batch not supported" / parse errors come back as one object
+                print(f"❌ Token accounts batch rejected: {items}")
+                continue
+            for item in items:
+                request_id = item.get("id") if isinstance(item, dict) else None
+                if not isinstance(request_id, int) or not 0 <= request_id < len(chunk):
+                    print(f"⚠️ Skipping batch reply without a usable id: {item}")
+                    continue
+                if "error" in item:
+                    print(f"⚠️ RPC error for {chunk[request_id]}: {item['error']}")
+                    continue
+                responses[chunk[request_id]] = item
+        return responses
+
     def track_all_wallets(self):
         """Track token accounts for all wallets in the WALLETS_TO_TRACK list"""
         print(f"🚀 Moon Dev's Token Tracker starting up...")
         print(f"📋 Tracking {len(WALLETS_TO_TRACK)} wallets...")
         
         results = {}
+        batch = self.get_token_accounts_batch(WALLETS_TO_TRACK)
         for wallet in WALLETS_TO_TRACK:
-            token_accounts = self.get_token_accounts(wallet)
+            token_accounts = batch.get(wallet)
             if token_accounts and "result" in token_accounts:
                 parsed_accounts = []
                 for account in token_accounts["result"]["value"]:
@@ -70,7 +121,6 @@ class TokenAccountTracker:
                     })
                 results[wallet] = parsed_accounts
                 print(f"✅ Found {len(parsed_accounts)} token accounts for {wallet}")
-            time.sleep(0.5)  # Be nice to the API 😊
         
         return results
 
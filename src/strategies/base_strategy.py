@@ -3,10 +3,19 @@
 All custom strategies should inherit from this
 """
 
-class BaseStrategy:
+from abc import ABC, abstractmethod
+from datetime import datetime
+import time
+
+SIGNAL_DIRECTIONS = frozenset({'BUY', 'SELL', 'NEUTRAL'})  # Hash lookup for validate_signal's direction check
+
+class BaseStrategy(ABC):
     def __init__(self, name: str):
         self.name = name
+        self._last_ts_int = 0  # Second the cached timestamp string was made for
+        self._last_ts_str = ""
 
+    @abstractmethod
     def generate_signals(self) -> dict:
         """
         Generate trading signals
@@ -18,4 +27,23 @@ class BaseStrategy:
                 'metadata': dict       # Optional strategy-specific data
             }
         """
-        raise NotImplementedError("Strategy must implement generate_signals()") 
\ No newline at end of file
+        raise NotImplementedError("Strategy must implement generate_signals()")
+
+    def validate_signal(self, signal: dict) -> bool:
+        """Check a signal has the shape generate_signals() promises"""
+        return (
+            isinstance(signal, dict)
+            and bool(signal.get('token'))
+            and isinstance(signal.get('direction'), str)
+            and signal['direction'] in SIGNAL_DIRECTIONS
+            and isinstance(signal.get('signal'), (int, float))
+            and 0 <= signal['signal'] <= 1
+        )
+
+    def format_metadata(self, metadata: dict = None) -> dict:
+        """Copy of metadata stamped with the strategy name and time - the ISO string is rebuilt at most once a second"""
+        now = int(time.time())
+        if now != self._last_ts_int:
+            self._last_ts_str = datetime.fromtimestamp(now).isoformat()
+            self._last_ts_int = now
+        return {**(metadata or {}), 'strategy_name': self.name, 'timestamp': self._last_ts_str}
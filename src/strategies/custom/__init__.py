@@ -1,8 +1,21 @@
 """
 🌙 Moon Dev's Custom Strategies Package
 """
+import importlib
+
 from src.strategies.base_strategy import BaseStrategy
-from .example_strategy import ExampleStrategy
-from .private_my_strategy import MyStrategy
 
-__all__ = ['ExampleStrategy', 'MyStrategy'] 
\ No newline at end of file
+# Strategy class -> module it lives in - imported on first access, so loading one strategy doesn't import the rest
+_STRATEGY_MODULES = {
+    'ExampleStrategy': '.example_strategy',
+    'MyStrategy': '.private_my_strategy',
+}
+
+__all__ = list(_STRATEGY_MODULES)
+
+def __getattr__(name):
+    if name not in _STRATEGY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    strategy = getattr(importlib.import_module(_STRATEGY_MODULES[name], __name__), name)
+    globals()[name] = strategy  # Later lookups skip __getattr__
+    return strategy
@@ -6,62 +6,69 @@ Simple Moving Average Crossover Strategy
 from .base_strategy import BaseStrategy
 from src.config import MONITORED_TOKENS
 import pandas as pd
+import numpy as np
 from termcolor import cprint
+from concurrent.futures import ThreadPoolExecutor
 from src import nice_funcs as n
 
+MAX_FETCH_WORKERS = 8  # Tokens whose candles are fetched at once
+
+def _tail_means(close: np.ndarray, window: int):
+    """Previous and latest simple MA over close - only the last window + 1 bars are touched"""
+    return close[-window - 1:-1].mean(), close[-window:].mean()
+
 class SimpleMAStrategy(BaseStrategy):
     def __init__(self):
         """Initialize the strategy"""
         super().__init__("Simple MA Crossover")
         self.fast_ma = 20  # 20-period MA
         self.slow_ma = 50  # 50-period MA
+        self.timeframe = '15m'
+        # Just enough bars for the previous and current slow MA, plus a small margin for missing candles
+        self.days_back = (self.slow_ma + 4) * n.TIMEFRAME_SECONDS[self.timeframe] / 86400
         
     def generate_signals(self) -> dict:
         """Generate trading signals based on MA crossover"""
         try:
-            for token in MONITORED_TOKENS:
-                # Get market data using nice_funcs
-                data = n.get_data(token, days_back=3, timeframe='15m')  
+            # Fetch every token's candles concurrently - map keeps MONITORED_TOKENS order for the checks below
+            with ThreadPoolExecutor(max_workers=max(1, min(MAX_FETCH_WORKERS, len(MONITORED_TOKENS))), thread_name_prefix='ma-fetch') as pool:
+                frames = pool.map(lambda token: n.get_data(token, self.days_back, self.timeframe), MONITORED_TOKENS)
+                results = list(zip(MONITORED_TOKENS, frames))
+            
+            for token, data in results:
                 if data is None or data.empty:
                     continue
                     
-                # Calculate moving averages
-                fast_ma = data['close'].rolling(self.fast_ma).mean()
-                slow_ma = data['close'].rolling(self.slow_ma).mean()
+                # Only the last two MA values matter - average the tail instead of rolling the whole history
+                close = data['Close'].to_numpy(dtype=np.float64)
+                if len(close) < self.slow_ma + 1:
+                    continue
+                prev_fast, current_fast = _tail_means(close, self.fast_ma)
+                prev_slow, current_slow = _tail_means(close, self.slow_ma)
                 
-                # Get latest values
-                current_fast = fast_ma.iloc[-1]
-                current_slow = slow_ma.iloc[-1]
-                prev_fast = fast_ma.iloc[-2]
-                prev_slow = slow_ma.iloc[-2]
+                # Check for crossover first - no crossover, no signal to build
+                # One gap per bar, each compared once against zero - NaN gaps fail both tests and are skipped
+                diff_prev = prev_fast - prev_slow
+                diff_cur = current_fast - current_slow
+                if diff_cur > 0 >= diff_prev:
+                    direction = 'BUY'  # Bullish crossover (fast crosses above slow)
+                elif diff_cur < 0 <= diff_prev:
+                    direction = 'SELL'  # Bearish crossover (fast crosses below slow)
+                else:
+                    continue
                 
-                # Check for crossover
                 signal = {
                     'token': token,
-                    'signal': 0,
-                    'direction': 'NEUTRAL',
+                    'signal': 1.0,
+                    'direction': direction,
                     'metadata': {
                         'strategy_type': 'ma_crossover',
                         'fast_ma': float(current_fast),
                         'slow_ma': float(current_slow),
-                        'current_price': float(data['close'].iloc[-1])
+                        'current_price': float(close[-1])
                     }
                 }
                 
-                # Bullish crossover (fast crosses above slow)
-                if prev_fast <= prev_slow and current_fast > current_slow:
-                    signal.update({
-                        'signal': 1.0,
-                        'direction': 'BUY'
-                    })
-                
-                # Bearish crossover (fast crosses below slow)
-                elif prev_fast >= prev_slow and current_fast < current_slow:
-                    signal.update({
-                        'signal': 1.0,
-                        'direction': 'SELL'
-                    })
-                
                 # Validate and format signal
                 if self.validate_signal(signal):
                     signal['metadata'] = self.format_metadata(signal['metadata'])